@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand
+
+from Contents.models import Manuscript
+from Contents.search import update_search_vectors
+
+
+class Command(BaseCommand):
+    help = "Rebuild the full text search vectors of the manuscripts"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500)
+        parser.add_argument(
+            "--missing",
+            action="store_true",
+            help="only index the manuscripts without a search vector",
+        )
+
+    def handle(self, *args, **options):
+        queryset = Manuscript.objects.order_by("pk")
+
+        if options["missing"]:
+            queryset = queryset.filter(search_vector__isnull=True)
+
+        ids = list(queryset.values_list("pk", flat=True))
+        batch_size = options["batch_size"]
+
+        for start in range(0, len(ids), batch_size):
+            update_search_vectors(ids[start : start + batch_size])
+
+        self.stdout.write("indexed {0} manuscripts".format(len(ids)))
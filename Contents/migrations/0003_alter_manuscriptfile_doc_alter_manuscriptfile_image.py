@@ -0,0 +1,25 @@
+# Generated by Django 4.0.3 on 2026-10-18 11:37
+
+import Contents.models
+import Cores.storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Contents', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='manuscriptfile',
+            name='doc',
+            field=models.FileField(blank=True, max_length=255, null=True, storage=Cores.storage.ContentAddressedStorage(), upload_to=Contents.models.ManuscriptFile.file_path, verbose_name='file'),
+        ),
+        migrations.AlterField(
+            model_name='manuscriptfile',
+            name='image',
+            field=models.ImageField(blank=True, max_length=255, null=True, storage=Cores.storage.ContentAddressedStorage(), upload_to=Contents.models.ManuscriptFile.file_path, verbose_name='image'),
+        ),
+    ]
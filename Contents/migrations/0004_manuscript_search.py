@@ -0,0 +1,29 @@
+# Generated by Django 4.0.3 on 2026-10-18 11:53
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Contents', '0003_alter_manuscriptfile_doc_alter_manuscriptfile_image'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='manuscript',
+            name='search_document',
+            field=models.TextField(blank=True, default='', editable=False, verbose_name='search_document'),
+        ),
+        migrations.AddField(
+            model_name='manuscript',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(blank=True, editable=False, null=True, verbose_name='search_vector'),
+        ),
+        migrations.AddIndex(
+            model_name='manuscript',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='manuscript_search_idx'),
+        ),
+    ]
@@ -1,9 +1,12 @@
 import uuid
 
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
 from Cores.models import ArticleTypeSection
+from Cores.storage import content_addressed_storage
 
 from Journals.models import Journal, JournalSubjectArea
 
@@ -29,6 +32,13 @@ class Manuscript(models.Model):
     word_count = models.PositiveIntegerField(
         _("word_count"),
     )
+    ## title, keywords, authors and abstract, maintained by Contents.search
+    search_document = models.TextField(
+        _("search_document"), blank=True, default="", editable=False
+    )
+    search_vector = SearchVectorField(
+        _("search_vector"), null=True, blank=True, editable=False
+    )
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
@@ -36,7 +46,10 @@ class Manuscript(models.Model):
         verbose_name_plural = _("manuscripts")
         ordering = ["-created_at"]
         db_table = "manuscripts"
-        indexes = [models.Index(fields=["title"], name="title_idx")]
+        indexes = [
+            models.Index(fields=["title"], name="title_idx"),
+            GinIndex(fields=["search_vector"], name="manuscript_search_idx"),
+        ]
 
     def __str__(self) -> str:
         return self.journal.name
@@ -90,10 +103,20 @@ class ManuscriptFile(models.Model):
         _("file_type"), choices=FileType.choices, default=FileType.FIGURE
     )
     doc = models.FileField(
-        _("file"), max_length=255, blank=True, null=True, upload_to=file_path
+        _("file"),
+        max_length=255,
+        blank=True,
+        null=True,
+        upload_to=file_path,
+        storage=content_addressed_storage,
     )
     image = models.ImageField(
-        _("image"), max_length=255, blank=True, null=True, upload_to=file_path
+        _("image"),
+        max_length=255,
+        blank=True,
+        null=True,
+        upload_to=file_path,
+        storage=content_addressed_storage,
     )
     manuscript = models.ForeignKey(
         Manuscript, related_name="files", on_delete=models.CASCADE
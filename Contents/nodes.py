@@ -1,6 +1,7 @@
 import graphene
 from graphene_django import DjangoObjectType
 
+from Cores.loaders import load_related
 from Journals.nodes import Journal as JournalType
 
 from .models import (
@@ -17,6 +18,9 @@ class ManuscriptSectionNode(DjangoObjectType):
         fields = ("id", "section", "content", "created_at")
         interfaces = (graphene.relay.Node,)
 
+    def resolve_section(self, info):
+        return load_related(info, self, "section")
+
 
 class ManuscriptAuthorNode(DjangoObjectType):
     class Meta:
@@ -41,6 +45,8 @@ class ManuscriptKeywordTagNode(DjangoObjectType):
 class ManuscriptNode(DjangoObjectType):
 
     journal = graphene.Field(JournalType)
+    rank = graphene.Float(description="relevance of the manuscript to a search")
+    headline = graphene.String(description="search terms highlighted in their context")
 
     class Meta:
         model = Manuscript
@@ -59,4 +65,22 @@ class ManuscriptNode(DjangoObjectType):
         }
 
     def resolve_journal(self, info):
-        return self.journal
+        return load_related(info, self, "journal")
+
+    def resolve_rank(self, info):
+        return getattr(self, "rank", None)
+
+    def resolve_headline(self, info):
+        return getattr(self, "headline", None)
+
+    def resolve_author_submission(self, info):
+        return load_related(info, self, "author_submission")
+
+    def resolve_authors(self, info, **kwargs):
+        return load_related(info, self, "authors")
+
+    def resolve_subject_area(self, info):
+        return load_related(info, self, "subject_area")
+
+    def resolve_sections(self, info, **kwargs):
+        return load_related(info, self, "sections")
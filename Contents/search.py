@@ -0,0 +1,130 @@
+import json
+
+from django.contrib.postgres.search import (
+    SearchHeadline,
+    SearchQuery,
+    SearchRank,
+    SearchVector,
+)
+from django.db.models import F, Prefetch, Value
+
+from .models import Manuscript, ManuscriptAuthor, ManuscriptSection
+
+## text search configuration of the manuscripts' vectors and queries
+SEARCH_CONFIG = "english"
+
+## name of the article type section indexed with the manuscript
+ABSTRACT_SECTION = "abstract"
+
+
+def section_text(content):
+    """
+    Plain text of a section's rich text content, the paragraphs' text
+    nodes joined by spaces
+    """
+    if isinstance(content, str):
+        try:
+            content = json.loads(content)
+        except ValueError:
+            return content
+
+    if isinstance(content, dict):
+        return " ".join(
+            filter(
+                None,
+                [content.get("text", "")]
+                + [section_text(child) for child in content.get("children", [])],
+            )
+        )
+
+    if isinstance(content, list):
+        return " ".join(filter(None, (section_text(node) for node in content)))
+
+    return "" if content is None else str(content)
+
+
+def update_search_vectors(manuscript_ids):
+    """
+    Rebuild the search vectors of the given manuscripts: the title weighs
+    most, then the keywords, the authors and the abstract. Reads the
+    manuscripts in four queries and writes them in one.
+    """
+    manuscripts = list(
+        Manuscript.objects.filter(pk__in=manuscript_ids)
+        .only("pk", "title")
+        .prefetch_related(
+            "keyword_tags",
+            Prefetch(
+                "authors",
+                queryset=ManuscriptAuthor.objects.only(
+                    "manuscript_id", "first_name", "last_name"
+                ),
+            ),
+            Prefetch(
+                "sections",
+                queryset=ManuscriptSection.objects.filter(
+                    section__name__iexact=ABSTRACT_SECTION
+                ),
+                to_attr="abstract_sections",
+            ),
+        )
+    )
+
+    for manuscript in manuscripts:
+        parts = [
+            (manuscript.title, "A"),
+            (" ".join(tag.tag for tag in manuscript.keyword_tags.all()), "B"),
+            (
+                " ".join(
+                    "{0} {1}".format(author.first_name, author.last_name)
+                    for author in manuscript.authors.all()
+                ),
+                "C",
+            ),
+            (
+                " ".join(
+                    section_text(section.content)
+                    for section in manuscript.abstract_sections
+                ),
+                "D",
+            ),
+        ]
+
+        vector = None
+
+        for text, weight in parts:
+            part = SearchVector(Value(text), weight=weight, config=SEARCH_CONFIG)
+            vector = part if vector is None else vector + part
+
+        manuscript.search_document = "\n".join(text for text, weight in parts if text)
+        manuscript.search_vector = vector
+
+    if manuscripts:
+        Manuscript.objects.bulk_update(
+            manuscripts, ["search_document", "search_vector"]
+        )
+
+
+def search_manuscripts(queryset, text):
+    """
+    Filter the manuscripts matching a web search style query, e.g.
+    `"gene expression" -mice`, best matches first, annotated with their
+    rank and a highlighted headline
+    """
+    query = SearchQuery(text, search_type="websearch", config=SEARCH_CONFIG)
+
+    return (
+        queryset.filter(search_vector=query)
+        .annotate(
+            rank=SearchRank(F("search_vector"), query),
+            headline=SearchHeadline(
+                "search_document",
+                query,
+                config=SEARCH_CONFIG,
+                start_sel="<mark>",
+                stop_sel="</mark>",
+                max_fragments=2,
+            ),
+        )
+        .order_by("-rank", "-created_at")
+    )
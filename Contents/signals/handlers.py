@@ -0,0 +1,32 @@
+from django.dispatch import receiver
+from django.db.models.signals import post_delete, post_save
+
+from ..models import (
+    Manuscript,
+    ManuscriptAuthor,
+    ManuscriptKeywordTag,
+    ManuscriptSection,
+)
+from ..search import update_search_vectors
+
+
+@receiver(post_save, sender=Manuscript)
+def index_manuscript(sender, instance, update_fields=None, **kwargs):
+    """
+    Refresh the manuscript's search vector when it is saved, the bulk
+    writes of its authors and sections refresh it explicitly
+    """
+    if update_fields and not {"title"} & set(update_fields):
+        return
+
+    update_search_vectors([instance.pk])
+
+
+## no post_delete receivers for authors and sections, they would turn the
+## bulk deletes of their editing mutations into one query per row
+@receiver(post_save, sender=ManuscriptAuthor)
+@receiver(post_save, sender=ManuscriptKeywordTag)
+@receiver(post_delete, sender=ManuscriptKeywordTag)
+@receiver(post_save, sender=ManuscriptSection)
+def index_manuscript_content(sender, instance, **kwargs):
+    update_search_vectors([instance.manuscript_id])
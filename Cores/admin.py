@@ -5,6 +5,7 @@ from Cores.models import (
     TermOfService,
     ArticleType,
     ArticleTypeSection,
+    OutgoingEmail,
 )
 
 # Register your models here.
@@ -12,3 +13,4 @@ admin.site.register(Discipline)
 admin.site.register(TermOfService)
 admin.site.register(ArticleTypeSection)
 admin.site.register(ArticleType)
+admin.site.register(OutgoingEmail)
@@ -0,0 +1,26 @@
+from django.contrib.postgres.fields import ArrayField
+from django.db.models import Aggregate, FloatField
+
+
+class PercentileCont(Aggregate):
+    """
+    Continuous percentiles of an expression in a group, all of them computed
+    from one sort of the group's values. The result is the array of the
+    percentiles in the given order.
+    """
+
+    function = "PERCENTILE_CONT"
+    template = "%(function)s(%(fractions)s) WITHIN GROUP (ORDER BY %(expressions)s)"
+
+    def __init__(self, expression, fractions, output_field=None, **extra):
+        fractions = [float(fraction) for fraction in fractions]
+
+        if not fractions or not all(0 <= fraction <= 1 for fraction in fractions):
+            raise ValueError("percentiles are fractions between 0 and 1")
+
+        super().__init__(
+            expression,
+            fractions="ARRAY[{0}]::float8[]".format(", ".join(map(repr, fractions))),
+            output_field=ArrayField(output_field or FloatField()),
+            **extra,
+        )
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class CoresConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'Cores'
+
+    def ready(self):
+        import Cores.signals.handlers
@@ -0,0 +1,62 @@
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import connections
+from django.db.migrations import AddIndex
+
+TRIGRAM = "pg_trgm"
+
+## extensions found installed, by database alias
+_installed = {}
+
+
+def extension_available(connection, name):
+    """
+    Whether the database server ships the extension, contrib modules are
+    packaged separately by some distributions
+    """
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_available_extensions WHERE name = %s", [name])
+        return cursor.fetchone() is not None
+
+
+def extension_installed(connection, name):
+    """
+    Whether the extension is installed in the database
+    """
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_extension WHERE extname = %s", [name])
+        return cursor.fetchone() is not None
+
+
+def has_trigram(using="default"):
+    """
+    Whether the trigram operators can be used, checked once per process
+    """
+    if using not in _installed:
+        _installed[using] = extension_installed(connections[using], TRIGRAM)
+
+    return _installed[using]
+
+
+class OptionalTrigramExtension(TrigramExtension):
+    """
+    Install pg_trgm where the server ships it
+    """
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if extension_available(schema_editor.connection, self.name):
+            super().database_forwards(app_label, schema_editor, from_state, to_state)
+
+
+class AddTrigramIndex(AddIndex):
+    """
+    Add a gin_trgm_ops index, skipped in the database when pg_trgm is not
+    installed
+    """
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if extension_installed(schema_editor.connection, TRIGRAM):
+            super().database_forwards(app_label, schema_editor, from_state, to_state)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if extension_installed(schema_editor.connection, TRIGRAM):
+            super().database_backwards(app_label, schema_editor, from_state, to_state)
@@ -0,0 +1,241 @@
+import json
+from functools import partial
+
+import graphene
+from django.db import connection as db_connection
+from django.db.models import Q
+from graphene.relay import PageInfo
+from graphene_django import DjangoConnectionField
+from graphene_django.utils import maybe_queryset
+from graphql import GraphQLError
+from graphql_relay.utils import base64, unbase64
+
+from .loaders import get_loaders
+
+## below this many estimated rows an exact count is cheap enough
+EXACT_COUNT_THRESHOLD = 1000
+
+
+def approximate_count(queryset):
+    """
+    Estimate the number of rows of a queryset from the query planner
+    instead of running COUNT(*) over every matching row
+    """
+    if db_connection.vendor != "postgresql":
+        return queryset.count()
+
+    sql, params = queryset.order_by().query.sql_with_params()
+
+    with db_connection.cursor() as cursor:
+        cursor.execute("EXPLAIN (FORMAT JSON) %s" % sql, params)
+        plan = cursor.fetchone()[0]
+
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+
+    estimate = int(plan[0]["Plan"]["Plan Rows"])
+
+    if estimate < EXACT_COUNT_THRESHOLD:
+        return queryset.count()
+
+    return estimate
+
+
+class CountableConnection(graphene.relay.Connection):
+    """
+    Connection with an optional, approximate total count
+    """
+
+    total_count = graphene.Int()
+
+    class Meta:
+        abstract = True
+
+    def resolve_total_count(root, info):
+        return approximate_count(root.iterable)
+
+
+class BatchedConnectionField(DjangoConnectionField):
+    """
+    Connection field that registers each resolved page with the request's
+    data loaders, so relations on the page's nodes are loaded in batches
+    """
+
+    @classmethod
+    def connection_resolver(
+        cls,
+        resolver,
+        connection,
+        default_manager,
+        queryset_resolver,
+        max_limit,
+        enforce_first_or_last,
+        root,
+        info,
+        **args
+    ):
+        resolved = super().connection_resolver(
+            resolver,
+            connection,
+            default_manager,
+            queryset_resolver,
+            max_limit,
+            enforce_first_or_last,
+            root,
+            info,
+            **args
+        )
+
+        if hasattr(resolved, "edges"):
+            get_loaders(info).register(edge.node for edge in resolved.edges)
+
+        return resolved
+
+
+class KeysetConnectionField(BatchedConnectionField):
+    """
+    Connection field which, when the client passes `keyset: true`, paginates
+    with cursors on the ordering key, e.g. (created_at, id), instead of
+    OFFSET so that deep pages cost the same as the first one. Without it
+    the field pages like BatchedConnectionField, with the same arguments
+    and cursors.
+
+    Ordering defaults to the first field of the model's Meta.ordering.
+    """
+
+    def __init__(self, *args, ordering=None, **kwargs):
+        self.ordering = ordering
+        kwargs.setdefault(
+            "keyset",
+            graphene.Boolean(
+                default_value=False,
+                description="page with cursors on the ordering key instead of offsets",
+            ),
+        )
+        super().__init__(*args, **kwargs)
+
+    def get_ordering(self):
+        ordering = self.ordering or self.model._meta.ordering[0]
+
+        return (ordering, "-pk" if ordering.startswith("-") else "pk")
+
+    def to_cursor(self, instance):
+        field_name = self.get_ordering()[0].lstrip("-")
+        field = self.model._meta.get_field(field_name)
+
+        values = [field.value_to_string(instance), str(instance.pk)]
+
+        return base64(json.dumps(values))
+
+    def from_cursor(self, cursor):
+        field_name = self.get_ordering()[0].lstrip("-")
+        field = self.model._meta.get_field(field_name)
+
+        try:
+            value, pk = json.loads(unbase64(cursor))
+        except ValueError:
+            raise ValueError("invalid cursor: {0}".format(cursor))
+
+        return field.to_python(value), self.model._meta.pk.to_python(pk)
+
+    def seek(self, cursor, forward):
+        """
+        Filter the rows after (or before) the cursor in the connection's order.
+        Equivalent to the row comparison (field, pk) < (value, pk)
+        """
+        ordering = self.get_ordering()[0]
+        field_name = ordering.lstrip("-")
+        value, pk = self.from_cursor(cursor)
+
+        lookup = "lt" if ordering.startswith("-") == forward else "gt"
+
+        return Q(**{"%s__%se" % (field_name, lookup): value}) & (
+            Q(**{"%s__%s" % (field_name, lookup): value})
+            | Q(**{field_name: value, "pk__%s" % lookup: pk})
+        )
+
+    def resolve_keyset_connection(self, queryset, args):
+        first = args.get("first")
+        last = args.get("last")
+        after = args.get("after")
+        before = args.get("before")
+
+        if first is None and last is None:
+            first = self.max_limit
+
+        paginated = queryset.order_by(*self.get_ordering())
+
+        if after:
+            paginated = paginated.filter(self.seek(after, forward=True))
+
+        if before:
+            paginated = paginated.filter(self.seek(before, forward=False))
+
+        if last is None or first is not None:
+            nodes = list(paginated if first is None else paginated[: first + 1])
+            has_next_page = first is not None and len(nodes) > first
+            has_previous_page = bool(after)
+            nodes = nodes[:first]
+
+            if last is not None:
+                has_previous_page = has_previous_page or len(nodes) > last
+                nodes = nodes[max(len(nodes) - last, 0) :]
+        else:
+            nodes = list(paginated.reverse()[: last + 1])
+            has_previous_page = len(nodes) > last
+            has_next_page = bool(before)
+            nodes = nodes[:last][::-1]
+
+        connection_type = self.connection_type
+        edges = [
+            connection_type.Edge(node=node, cursor=self.to_cursor(node))
+            for node in nodes
+        ]
+
+        connection = connection_type(
+            edges=edges,
+            page_info=PageInfo(
+                start_cursor=edges[0].cursor if edges else None,
+                end_cursor=edges[-1].cursor if edges else None,
+                has_previous_page=has_previous_page,
+                has_next_page=has_next_page,
+            ),
+        )
+        connection.iterable = queryset
+
+        return connection
+
+    def keyset_resolver(self, offset_resolver, resolver, root, info, **args):
+        if not args.pop("keyset", False):
+            return offset_resolver(root, info, **args)
+
+        if args.get("offset") is not None:
+            raise GraphQLError("offset cannot be combined with keyset paging")
+
+        for key in ("first", "last"):
+            if self.max_limit and args.get(key) is not None:
+                assert args[key] <= self.max_limit, (
+                    "Requesting {} records on the `{}` connection exceeds the `{}` limit of {} records."
+                ).format(args[key], info.field_name, key, self.max_limit)
+
+        if self.enforce_first_or_last:
+            assert args.get("first") or args.get("last"), (
+                "You must provide a `first` or `last` value to properly paginate the `{}` connection."
+            ).format(info.field_name)
+
+        iterable = resolver(root, info, **args)
+
+        if iterable is None:
+            iterable = self.get_manager()
+
+        queryset = self.node_type.get_queryset(maybe_queryset(iterable), info)
+        connection = self.resolve_keyset_connection(queryset, args)
+
+        get_loaders(info).register(edge.node for edge in connection.edges)
+
+        return connection
+
+    def wrap_resolve(self, parent_resolver):
+        return partial(
+            self.keyset_resolver, super().wrap_resolve(parent_resolver), parent_resolver
+        )
@@ -0,0 +1,61 @@
+import hashlib
+import math
+
+## 2 ** PRECISION registers of a byte, a standard error of 1.04 / 64 = 1.6%
+PRECISION = 12
+
+
+class HyperLogLog:
+    """
+    Sketch estimating the number of distinct values added to it in a fixed
+    space. Sketches merge without loss, the uniques of a week are the merge
+    of its days' sketches.
+    """
+
+    def __init__(self, registers=None, precision=PRECISION):
+        self.precision = precision
+        self.size = 1 << precision
+
+        if registers:
+            if len(registers) != self.size:
+                raise ValueError("a sketch has {0} registers".format(self.size))
+
+            self.registers = bytearray(registers)
+        else:
+            self.registers = bytearray(self.size)
+
+    def add(self, value):
+        digest = hashlib.blake2b(str(value).encode(), digest_size=8).digest()
+        hashed = int.from_bytes(digest, "big")
+
+        index = hashed >> (64 - self.precision)
+        rest = hashed & ((1 << (64 - self.precision)) - 1)
+        ## position of the leftmost 1 bit of the remaining bits
+        rank = (64 - self.precision) - rest.bit_length() + 1
+
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def merge(self, other):
+        if other.size != self.size:
+            raise ValueError("sketches of different precisions")
+
+        self.registers = bytearray(map(max, self.registers, other.registers))
+
+        return self
+
+    def __len__(self):
+        m = self.size
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / sum(2.0**-register for register in self.registers)
+
+        zeros = self.registers.count(0)
+
+        ## small cardinalities are counted from the empty registers
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * math.log(m / zeros)
+
+        return int(round(estimate))
+
+    def __bytes__(self):
+        return bytes(self.registers)
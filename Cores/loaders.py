@@ -0,0 +1,218 @@
+from collections import defaultdict
+
+from django.db.models import F
+
+
+class DataLoader:
+    """
+    Batches and caches key lookups for the lifetime of a single request.
+
+    Keys that were primed are fetched together with the next key that
+    misses the cache, so a page of nodes costs one query per relation.
+    """
+
+    def __init__(self):
+        self._cache = {}
+        self._queue = []
+
+    def batch_load(self, keys):
+        """
+        Return a dict mapping the given keys to their values
+        """
+        raise NotImplementedError
+
+    def default(self):
+        return None
+
+    def is_cached(self, key):
+        return key in self._cache
+
+    def prime(self, keys):
+        self._queue.extend(
+            key for key in keys if key is not None and key not in self._cache
+        )
+
+    def dispatch(self):
+        """
+        Load every queued key in one batch and return the loaded values
+        """
+        keys = list(dict.fromkeys(self._queue))
+        self._queue = []
+
+        if not keys:
+            return {}
+
+        results = self.batch_load(keys)
+        loaded = {key: results.get(key, self.default()) for key in keys}
+        self._cache.update(loaded)
+
+        return loaded
+
+    def load(self, key):
+        if key is None:
+            return self.default()
+
+        if key not in self._cache:
+            self.prime([key])
+            self.dispatch()
+
+        return self._cache[key]
+
+
+class ForwardRelationLoader(DataLoader):
+    """
+    Loads the target of a foreign key or one-to-one field, keyed by the column value
+    """
+
+    def __init__(self, field):
+        super().__init__()
+        self.field = field
+
+    def key(self, instance):
+        return getattr(instance, self.field.attname)
+
+    def batch_load(self, keys):
+        return self.field.related_model._default_manager.in_bulk(
+            keys, field_name=self.field.target_field.name
+        )
+
+
+class ReverseOneToOneLoader(DataLoader):
+    """
+    Loads the reverse side of a one-to-one field, keyed by the parent's pk
+    """
+
+    def __init__(self, field):
+        super().__init__()
+        self.field = field.field
+
+    def key(self, instance):
+        return instance.pk
+
+    def batch_load(self, keys):
+        queryset = self.field.model._default_manager.filter(
+            **{"%s__in" % self.field.name: keys}
+        )
+
+        return {getattr(obj, self.field.attname): obj for obj in queryset}
+
+
+class RelatedListLoader(DataLoader):
+    """
+    Loads reverse foreign keys and many-to-many relations, keyed by the parent's pk
+    """
+
+    def __init__(self, field):
+        super().__init__()
+
+        if field.many_to_many and not field.auto_created:
+            self.lookup = field.related_query_name()
+        else:
+            self.lookup = field.field.name
+
+        self.related_model = field.related_model
+
+    def default(self):
+        return []
+
+    def key(self, instance):
+        return instance.pk
+
+    def batch_load(self, keys):
+        queryset = self.related_model._default_manager.filter(
+            **{"%s__in" % self.lookup: keys}
+        ).annotate(loader_key=F(self.lookup))
+
+        results = defaultdict(list)
+
+        for obj in queryset:
+            results[obj.loader_key].append(obj)
+
+        return results
+
+
+def loader_for_field(field):
+    if field.one_to_many or field.many_to_many:
+        return RelatedListLoader(field)
+
+    if field.auto_created:
+        return ReverseOneToOneLoader(field)
+
+    return ForwardRelationLoader(field)
+
+
+class Loaders:
+    """
+    The data loaders of a single request.
+
+    Instances returned together by a connection page or a loader batch are
+    registered as a cohort; loading a relation for one of them primes the
+    loader with every instance of its cohort.
+    """
+
+    def __init__(self):
+        self._loaders = {}
+        self._cohorts = {}
+
+    def get(self, model, field_name):
+        key = (model, field_name)
+
+        if key not in self._loaders:
+            self._loaders[key] = loader_for_field(model._meta.get_field(field_name))
+
+        return self._loaders[key]
+
+    def register(self, instances):
+        cohort = [instance for instance in instances if instance is not None]
+
+        for instance in cohort:
+            self._cohorts[(instance.__class__, instance.pk)] = cohort
+
+    def load(self, instance, field_name):
+        field = instance._meta.get_field(field_name)
+
+        ## relations already fetched by select_related/prefetch_related
+        if field.one_to_many or field.many_to_many:
+            prefetched = getattr(instance, "_prefetched_objects_cache", {})
+
+            if field_name in prefetched:
+                return list(prefetched[field_name])
+        elif field.is_cached(instance):
+            return field.get_cached_value(instance)
+
+        loader = self.get(instance.__class__, field_name)
+        key = loader.key(instance)
+
+        if key is not None and not loader.is_cached(key):
+            cohort = self._cohorts.get((instance.__class__, instance.pk), [instance])
+            loader.prime(loader.key(obj) for obj in cohort)
+            loader.prime([key])
+
+            loaded = loader.dispatch().values()
+
+            if isinstance(loader, RelatedListLoader):
+                self.register(obj for objs in loaded for obj in objs)
+            else:
+                self.register(loaded)
+
+        return loader.load(key)
+
+
+def get_loaders(info):
+    """
+    Get the data loaders bound to the current request
+    """
+    loaders = getattr(info.context, "loaders", None)
+
+    if loaders is None:
+        loaders = Loaders()
+        setattr(info.context, "loaders", loaders)
+
+    return loaders
+
+
+def load_related(info, instance, field_name):
+    """
+    Load a relation of the instance through the request's data loaders
+    """
+    return get_loaders(info).load(instance, field_name)
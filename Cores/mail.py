@@ -0,0 +1,124 @@
+from datetime import timedelta
+
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from .models import OutgoingEmail
+
+## failed deliveries are retried after 1, 2, 4, 8 ... minutes
+MAX_ATTEMPTS = 6
+RETRY_DELAY = timedelta(minutes=1)
+
+## a claimed email is claimed again after this time, its worker stopped
+CLAIM_TIMEOUT = timedelta(minutes=10)
+
+
+def queue_email(subject, text_content, from_email, to, html_content=None):
+    """
+    Write an email to the outbox, it is delivered by the email worker
+    once the surrounding transaction commits
+    """
+    return OutgoingEmail.objects.create(
+        subject=subject,
+        text_content=text_content,
+        html_content=html_content,
+        from_email=from_email,
+        to=list(to),
+    )
+
+
+def build_message(email, connection):
+    msg = EmailMultiAlternatives(
+        email.subject,
+        email.text_content,
+        email.from_email,
+        email.to,
+        connection=connection,
+    )
+
+    if email.html_content:
+        msg.attach_alternative(email.html_content, "text/html")
+
+    return msg
+
+
+def claim_due_emails(batch_size):
+    """
+    Claim a batch of due emails for CLAIM_TIMEOUT and return them. The claim
+    counts as an attempt and is committed at once, the emails are sent
+    without a transaction or a lock held.
+    """
+    now = timezone.now()
+
+    with transaction.atomic():
+        emails = list(
+            OutgoingEmail.objects.select_for_update(skip_locked=True)
+            .filter(status=OutgoingEmail.Status.PENDING, send_after__lte=now)
+            .filter(Q(claimed_until__isnull=True) | Q(claimed_until__lte=now))
+            .order_by("send_after")[:batch_size]
+        )
+
+        OutgoingEmail.objects.filter(pk__in=[email.pk for email in emails]).update(
+            claimed_until=now + CLAIM_TIMEOUT, attempts=F("attempts") + 1
+        )
+
+    for email in emails:
+        email.attempts += 1
+
+    return emails
+
+
+def record_failure(email, error):
+    outcome = {"last_error": str(error), "claimed_until": None}
+
+    if email.attempts >= MAX_ATTEMPTS:
+        outcome["status"] = OutgoingEmail.Status.FAILED
+    else:
+        outcome["send_after"] = timezone.now() + RETRY_DELAY * 2 ** (email.attempts - 1)
+
+    OutgoingEmail.objects.filter(pk=email.pk).update(**outcome)
+
+
+def send_queued_emails(batch_size=50):
+    """
+    Deliver a batch of due emails over a single connection and return the
+    number of emails sent. The batch is claimed beforehand so that several
+    workers can drain the outbox concurrently, and the outcome of each email
+    is recorded as soon as it is known.
+    """
+    sent = 0
+    emails = claim_due_emails(batch_size)
+
+    if not emails:
+        return sent
+
+    connection = get_connection()
+
+    try:
+        connection.open()
+    except Exception as e:
+        for email in emails:
+            record_failure(email, e)
+
+        return sent
+
+    try:
+        for email in emails:
+            try:
+                build_message(email, connection).send()
+            except Exception as e:
+                record_failure(email, e)
+            else:
+                OutgoingEmail.objects.filter(pk=email.pk).update(
+                    status=OutgoingEmail.Status.SENT,
+                    sent_at=timezone.now(),
+                    last_error=None,
+                    claimed_until=None,
+                )
+                sent += 1
+    finally:
+        connection.close()
+
+    return sent
@@ -0,0 +1,31 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+
+from Cores.storage import collect_garbage
+
+
+class Command(BaseCommand):
+    help = "Remove the stored files that are no longer referenced"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--grace-hours",
+            type=float,
+            default=24,
+            help="keep unreferenced files younger than this",
+        )
+        parser.add_argument(
+            "--dry-run", action="store_true", help="only list the files to remove"
+        )
+
+    def handle(self, *args, **options):
+        removed = collect_garbage(
+            grace=timedelta(hours=options["grace_hours"]),
+            dry_run=options["dry_run"],
+        )
+
+        for name in removed:
+            self.stdout.write(name)
+
+        self.stdout.write("removed {0} files".format(len(removed)))
@@ -0,0 +1,41 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from Cores.mail import send_queued_emails
+
+
+class Command(BaseCommand):
+    help = "Deliver the emails waiting in the outbox"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=50)
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=5,
+            help="seconds to wait when the outbox is empty",
+        )
+        parser.add_argument(
+            "--once", action="store_true", help="drain the outbox once and exit"
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+
+        while True:
+            try:
+                sent = send_queued_emails(batch_size)
+            except Exception as e:
+                ## the mail server is unreachable, the batch is retried later
+                self.stderr.write("failed to deliver emails: {0}".format(e))
+                sent = 0
+
+            if sent:
+                self.stdout.write("sent {0} emails".format(sent))
+
+            if options["once"] and sent < batch_size:
+                break
+
+            if sent < batch_size:
+                time.sleep(options["interval"])
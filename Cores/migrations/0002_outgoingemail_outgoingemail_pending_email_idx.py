@@ -0,0 +1,41 @@
+# Generated by Django 4.0.3 on 2026-10-18 11:32
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Cores', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OutgoingEmail',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('subject', models.CharField(max_length=255, verbose_name='subject')),
+                ('text_content', models.TextField(verbose_name='text content')),
+                ('html_content', models.TextField(blank=True, null=True, verbose_name='html content')),
+                ('from_email', models.CharField(max_length=255, verbose_name='from email')),
+                ('to', models.JSONField(default=list, verbose_name='to')),
+                ('status', models.PositiveSmallIntegerField(choices=[(1, 'pending'), (2, 'sent'), (3, 'failed')], default=1, verbose_name='status')),
+                ('attempts', models.PositiveSmallIntegerField(default=0, verbose_name='attempts')),
+                ('last_error', models.TextField(blank=True, null=True, verbose_name='last error')),
+                ('send_after', models.DateTimeField(default=django.utils.timezone.now, verbose_name='send after')),
+                ('sent_at', models.DateTimeField(blank=True, null=True, verbose_name='sent at')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='created_at')),
+            ],
+            options={
+                'verbose_name': 'outgoing email',
+                'verbose_name_plural': 'outgoing emails',
+                'db_table': 'outgoing_emails',
+                'ordering': ('created_at',),
+            },
+        ),
+        migrations.AddIndex(
+            model_name='outgoingemail',
+            index=models.Index(condition=models.Q(('status', 1)), fields=['send_after'], name='pending_email_idx'),
+        ),
+    ]
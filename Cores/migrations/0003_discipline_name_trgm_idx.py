@@ -0,0 +1,20 @@
+# Generated by Django 4.0.3 on 2026-10-18 12:10
+
+import Cores.extensions
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Cores', '0002_outgoingemail_outgoingemail_pending_email_idx'),
+    ]
+
+    operations = [
+        Cores.extensions.OptionalTrigramExtension(),
+        Cores.extensions.AddTrigramIndex(
+            model_name='discipline',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['name'], name='discipline_name_trgm_idx', opclasses=['gin_trgm_ops']),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.0.3 on 2026-10-18 12:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Cores', '0003_discipline_name_trgm_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='outgoingemail',
+            name='claimed_until',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='claimed until'),
+        ),
+    ]
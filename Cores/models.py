@@ -1,5 +1,7 @@
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
 from django.template.defaultfilters import slugify
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 # Create your models here.
@@ -19,6 +21,13 @@ class Discipline(models.Model):
         verbose_name_plural = _("disciplines")
         ordering = ("name",)
         db_table = "displicines"
+        indexes = [
+            GinIndex(
+                fields=["name"],
+                name="discipline_name_trgm_idx",
+                opclasses=["gin_trgm_ops"],
+            )
+        ]
 
     def __str__(self):
         return self.name
@@ -112,3 +121,45 @@ class InformationHeading(models.Model):
 
     def __str__(self) -> str:
         return self.name
+
+
+class OutgoingEmail(models.Model):
+    """
+    Transactional emails waiting to be delivered by the email worker
+    """
+
+    class Status(models.IntegerChoices):
+        PENDING = 1, _("pending")
+        SENT = 2, _("sent")
+        FAILED = 3, _("failed")
+
+    subject = models.CharField(_("subject"), max_length=255)
+    text_content = models.TextField(_("text content"))
+    html_content = models.TextField(_("html content"), blank=True, null=True)
+    from_email = models.CharField(_("from email"), max_length=255)
+    to = models.JSONField(_("to"), default=list)
+    status = models.PositiveSmallIntegerField(
+        _("status"), choices=Status.choices, default=Status.PENDING
+    )
+    attempts = models.PositiveSmallIntegerField(_("attempts"), default=0)
+    last_error = models.TextField(_("last error"), blank=True, null=True)
+    send_after = models.DateTimeField(_("send after"), default=timezone.now)
+    sent_at = models.DateTimeField(_("sent at"), blank=True, null=True)
+    claimed_until = models.DateTimeField(_("claimed until"), blank=True, null=True)
+    created_at = models.DateTimeField(_("created_at"), auto_now_add=True)
+
+    class Meta:
+        verbose_name = _("outgoing email")
+        verbose_name_plural = _("outgoing emails")
+        ordering = ("created_at",)
+        db_table = "outgoing_emails"
+        indexes = [
+            models.Index(
+                fields=["send_after"],
+                name="pending_email_idx",
+                condition=models.Q(status=1),
+            )
+        ]
+
+    def __str__(self) -> str:
+        return self.subject
@@ -0,0 +1,144 @@
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Prefetch
+from graphene.utils.str_converters import to_snake_case
+from graphql.language import FieldNode, FragmentSpreadNode
+
+
+def get_selections(info, selection_sets):
+    """
+    Map the snake cased names of the selected fields to their selection sets,
+    merging fragments and fields selected more than once
+    """
+    selections = {}
+
+    for selection_set in selection_sets:
+        for selection in selection_set.selections:
+            if isinstance(selection, FieldNode):
+                child_sets = selections.setdefault(
+                    to_snake_case(selection.name.value), []
+                )
+
+                if selection.selection_set:
+                    child_sets.append(selection.selection_set)
+                continue
+
+            if isinstance(selection, FragmentSpreadNode):
+                selection = info.fragments[selection.name.value]
+
+            for name, child_sets in get_selections(
+                info, [selection.selection_set]
+            ).items():
+                selections.setdefault(name, []).extend(child_sets)
+
+    return selections
+
+
+def get_node_selections(info, selection_sets):
+    """
+    Get the selections of a node, unwrapping relay connections
+    """
+    selections = get_selections(info, selection_sets)
+
+    if "edges" in selections:
+        edges = get_selections(info, selections["edges"])
+        selections = get_selections(info, edges.get("node", []))
+
+    return selections
+
+
+class QueryOptimizer:
+    """
+    Derives the select_related, prefetch_related and only() calls needed
+    to resolve a graphql selection set from a queryset
+    """
+
+    def __init__(self, info):
+        self.info = info
+
+    def optimize(self, queryset, selections):
+        queryset = queryset.all()
+        only, select_related, prefetches = [], [], []
+
+        ## annotations are selected whatever the columns loaded
+        annotations = queryset.query.annotations
+        selections = {
+            name: selection_sets
+            for name, selection_sets in selections.items()
+            if name not in annotations
+        }
+
+        self.plan(queryset.model, selections, "", only, select_related, prefetches)
+
+        ## ordering columns are read back to build pagination cursors
+        ordering = queryset.query.order_by or queryset.model._meta.ordering
+        only.extend(
+            name.lstrip("-")
+            for name in ordering
+            if isinstance(name, str)
+            and "__" not in name
+            and name.lstrip("-") not in ("?", *annotations)
+        )
+
+        if select_related:
+            queryset = queryset.select_related(*select_related)
+
+        if prefetches:
+            queryset = queryset.prefetch_related(*prefetches)
+
+        return queryset.only(*only)
+
+    def plan(self, model, selections, prefix, only, select_related, prefetches):
+        ## foreign key columns are always loaded, deferring them would refetch
+        ## the row when a relation or data loader reads them
+        fields = [model._meta.pk.name] + [
+            field.name for field in model._meta.concrete_fields if field.is_relation
+        ]
+        is_complete = True
+
+        for name, selection_sets in selections.items():
+            if name.startswith("__"):
+                continue
+
+            try:
+                field = model._meta.get_field(name)
+            except FieldDoesNotExist:
+                ## computed fields may read any column of the model
+                is_complete = False
+                continue
+
+            path = prefix + name
+
+            if not field.is_relation:
+                fields.append(name)
+            elif field.many_to_one or field.one_to_one:
+                select_related.append(path)
+                self.plan(
+                    field.related_model,
+                    get_node_selections(self.info, selection_sets),
+                    path + "__",
+                    only,
+                    select_related,
+                    prefetches,
+                )
+            else:
+                queryset = self.optimize(
+                    field.related_model._default_manager.all(),
+                    get_node_selections(self.info, selection_sets),
+                )
+                prefetches.append(Prefetch(path, queryset=queryset))
+
+        if not is_complete:
+            fields = [field.name for field in model._meta.concrete_fields]
+
+        only.extend(prefix + field for field in fields)
+
+
+def optimize(queryset, info):
+    """
+    Fetch exactly the columns and relations selected in the graphql query
+    """
+    selections = get_node_selections(
+        info, [node.selection_set for node in info.field_nodes if node.selection_set]
+    )
+
+    return QueryOptimizer(info).optimize(queryset, selections)
@@ -1,5 +1,7 @@
 import graphene
 from Cores.models import Discipline, InformationHeading
+from Cores.reference import reference_rows
+from Cores.typeahead import suggest
 
 from .nodes import (
     Discipline as SubjectDisciplineType,
@@ -10,9 +12,17 @@ from .nodes import (
 class CoreQueries(graphene.ObjectType):
     disciplines = graphene.List(SubjectDisciplineType)
     information_headings = graphene.List(InformationHeadingType)
+    discipline_suggestions = graphene.List(
+        SubjectDisciplineType,
+        query=graphene.String(required=True),
+        first=graphene.Int(),
+    )
 
     def resolve_disciplines(root, info):
-        return Discipline.objects.all()
+        return reference_rows(Discipline)
 
     def resolve_information_headings(root, info):
-        return InformationHeading.objects.all()
+        return reference_rows(InformationHeading)
+
+    def resolve_discipline_suggestions(root, info, query, first=None):
+        return suggest(Discipline.objects.all(), query, limit=first)
@@ -0,0 +1,140 @@
+import time
+import uuid
+
+from django.core.cache import cache
+from django.db import transaction
+
+from .models import (
+    ArticleType,
+    ArticleTypeSection,
+    Discipline,
+    InformationHeading,
+    TermOfService,
+)
+
+## cached models and the relations prefetched with their rows
+REFERENCE_MODELS = {
+    Discipline: (),
+    InformationHeading: (),
+    ArticleType: ("sections",),
+    ArticleTypeSection: (),
+    TermOfService: ("discipline",),
+}
+
+## seconds the versions and rows are kept in the caches. A change expires
+## them at once for the workers sharing the cache, the others see it within
+## this time.
+REFERENCE_TIMEOUT = 300
+
+## rows read by this process, by model, with the version and the time they
+## were read at
+_rows = {}
+
+
+def _version_key(model):
+    return "reference:{0}".format(model._meta.label_lower)
+
+
+def _version(model):
+    key = _version_key(model)
+    version = cache.get(key)
+
+    if version is None:
+        cache.add(key, uuid.uuid4().hex, REFERENCE_TIMEOUT)
+        version = cache.get(key)
+
+    return version
+
+
+def reference_rows(model):
+    """
+    Rows of a reference model in its ordering, with their prefetched
+    relations. They are served from the process's copy while the model's
+    version in the shared cache is unchanged, else from the shared cache,
+    and read from the database once per change, outside of transactions.
+    Every copy expires after REFERENCE_TIMEOUT seconds, which bounds how
+    stale the rows are when the cache is not shared by every worker. The
+    rows are shared between callers, who must not modify them.
+    """
+    if model not in REFERENCE_MODELS:
+        raise ValueError("{0} is not reference data".format(model._meta.label))
+
+    version = _version(model)
+
+    ## without a shared cache the versions cannot be compared
+    if version is None:
+        return list(model._default_manager.prefetch_related(*REFERENCE_MODELS[model]))
+
+    local = _rows.get(model)
+
+    if (
+        local is not None
+        and local[0] == version
+        and time.monotonic() - local[2] < REFERENCE_TIMEOUT
+    ):
+        return local[1]
+
+    key = "{0}:{1}".format(_version_key(model), version)
+    rows = cache.get(key)
+
+    if rows is None:
+        rows = list(model._default_manager.prefetch_related(*REFERENCE_MODELS[model]))
+
+        ## rows read in a transaction may include its uncommitted changes
+        if transaction.get_connection(model._default_manager.db).in_atomic_block:
+            return rows
+
+        cache.set(key, rows, REFERENCE_TIMEOUT)
+
+    _rows[model] = (version, rows, time.monotonic())
+
+    return rows
+
+
+def reference_in_bulk(model, ids):
+    """
+    Cached rows of a reference model with the given primary keys, by
+    primary key, like QuerySet.in_bulk
+    """
+    ids = {str(pk) for pk in ids}
+
+    return {row.pk: row for row in reference_rows(model) if str(row.pk) in ids}
+
+
+def reference_get(model, **lookups):
+    """
+    Cached row of a reference model whose fields equal the lookups, raises
+    the model's DoesNotExist like QuerySet.get
+    """
+    for row in reference_rows(model):
+        if all(getattr(row, field) == value for field, value in lookups.items()):
+            return row
+
+    raise model.DoesNotExist(
+        "{0} matching query does not exist.".format(model._meta.object_name)
+    )
+
+
+def invalidate_reference(model):
+    """
+    Expire the cached rows of a reference model and of the models which
+    prefetch it, connected to the models' post_save, post_delete and
+    m2m_changed signals. They are expired again once the transaction
+    commits, rows read before then are missing its changes.
+    """
+    models = [model] + [
+        cached
+        for cached, relations in REFERENCE_MODELS.items()
+        if any(
+            cached._meta.get_field(relation).related_model is model
+            for relation in relations
+        )
+    ]
+
+    def expire():
+        for expired in models:
+            cache.set(_version_key(expired), uuid.uuid4().hex, REFERENCE_TIMEOUT)
+            _rows.pop(expired, None)
+
+    expire()
+    transaction.on_commit(expire)
@@ -0,0 +1,31 @@
+from django.dispatch import receiver
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+from ..models import (
+    ArticleType,
+    ArticleTypeSection,
+    Discipline,
+    InformationHeading,
+    TermOfService,
+)
+from ..reference import invalidate_reference
+
+
+@receiver(post_save, sender=Discipline)
+@receiver(post_delete, sender=Discipline)
+@receiver(post_save, sender=InformationHeading)
+@receiver(post_delete, sender=InformationHeading)
+@receiver(post_save, sender=ArticleType)
+@receiver(post_delete, sender=ArticleType)
+@receiver(post_save, sender=ArticleTypeSection)
+@receiver(post_delete, sender=ArticleTypeSection)
+@receiver(post_save, sender=TermOfService)
+@receiver(post_delete, sender=TermOfService)
+def expire_reference_data(sender, **kwargs):
+    invalidate_reference(sender)
+
+
+@receiver(m2m_changed, sender=TermOfService.discipline.through)
+def expire_term_disciplines(sender, action, **kwargs):
+    if action in ("post_add", "post_remove", "post_clear"):
+        invalidate_reference(TermOfService)
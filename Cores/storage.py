@@ -0,0 +1,147 @@
+import hashlib
+import os
+import tempfile
+import time
+from datetime import timedelta
+from pathlib import Path
+
+from django.apps import apps
+from django.core.files.storage import FileSystemStorage
+from django.db import models
+from django.utils.deconstruct import deconstructible
+
+## directory of MEDIA_ROOT holding the content addressed files
+CONTENT_DIRECTORY = "cas"
+
+
+@deconstructible
+class ContentAddressedStorage(FileSystemStorage):
+    """
+    Stores files under the SHA-256 of their content, so identical uploads
+    share a single file on disk whatever name they were uploaded with.
+
+    Files are never removed when a row is deleted, unreferenced files are
+    reclaimed by `collect_garbage` instead.
+    """
+
+    def hashed_name(self, digest, name):
+        """
+        Name of the file with the given SHA-256, keeping the extension of name
+        """
+        return "{0}/{1}/{2}/{3}{4}".format(
+            CONTENT_DIRECTORY,
+            digest[:2],
+            digest[2:4],
+            digest,
+            Path(name).suffix.lower(),
+        )
+
+    def get_available_name(self, name, max_length=None):
+        ## an existing name holds the very same content
+        return name
+
+    def touch(self, name):
+        ## shared files count as new for the garbage collector's grace period
+        os.utime(self.path(name))
+
+    def _save(self, name, content):
+        digest = hashlib.sha256()
+
+        for chunk in content.chunks():
+            digest.update(chunk)
+
+        name = self.hashed_name(digest.hexdigest(), name)
+
+        if self.exists(name):
+            self.touch(name)
+            return name
+
+        path = self.path(name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        ## written aside and renamed, concurrent writers of the same content
+        ## replace the file with identical bytes
+        with tempfile.NamedTemporaryFile(dir=os.path.dirname(path), delete=False) as f:
+            for chunk in content.chunks():
+                f.write(chunk)
+
+        if self.file_permissions_mode is not None:
+            os.chmod(f.name, self.file_permissions_mode)
+
+        os.replace(f.name, path)
+
+        return name
+
+    def save_path(self, path, digest, name):
+        """
+        Move an existing file with a known SHA-256 into the storage
+        """
+        stored_name = self.hashed_name(digest, name)
+
+        if self.exists(stored_name):
+            self.touch(stored_name)
+            os.remove(path)
+        else:
+            os.makedirs(os.path.dirname(self.path(stored_name)), exist_ok=True)
+            os.replace(path, self.path(stored_name))
+
+        return stored_name
+
+
+content_addressed_storage = ContentAddressedStorage()
+
+
+def content_addressed_fields():
+    """
+    The file fields of every model stored in the content addressed storage
+    """
+    for model in apps.get_models():
+        for field in model._meta.concrete_fields:
+            if isinstance(field, models.FileField) and isinstance(
+                field.storage, ContentAddressedStorage
+            ):
+                yield model, field
+
+
+def referenced_names():
+    names = set()
+
+    for model, field in content_addressed_fields():
+        names.update(
+            model._default_manager.exclude(**{field.name: ""})
+            .exclude(**{"%s__isnull" % field.name: True})
+            .values_list(field.name, flat=True)
+            .iterator()
+        )
+
+    return names
+
+
+def collect_garbage(grace=timedelta(hours=24), dry_run=False):
+    """
+    Remove the stored files no row references anymore and return their names.
+
+    Files younger than grace are kept, they may belong to a transaction that
+    has not committed yet.
+    """
+    storage = content_addressed_storage
+    root = Path(storage.path(CONTENT_DIRECTORY))
+    deadline = time.time() - grace.total_seconds()
+    references = referenced_names()
+    removed = []
+
+    if not root.is_dir():
+        return removed
+
+    for path in root.glob("*/*/*"):
+        name = path.relative_to(storage.location).as_posix()
+
+        if name in references or path.stat().st_mtime > deadline:
+            continue
+
+        if not dry_run:
+            path.unlink(missing_ok=True)
+
+        removed.append(name)
+
+    return removed
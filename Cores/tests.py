@@ -1,8 +1,31 @@
 import json
+import os
+import tempfile
+from io import StringIO
+from unittest import mock
+
+from datetime import timedelta
+
+from django.core import mail
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import TestCase, TransactionTestCase
+from django.utils import timezone
 from graphene_django.utils.testing import GraphQLTestCase
 from mixer.backend.django import mixer
 
-from Cores.models import Discipline, InformationHeading
+from Cores.mail import (
+    MAX_ATTEMPTS,
+    claim_due_emails,
+    queue_email,
+    send_queued_emails,
+)
+from Cores import reference
+from Cores.models import Discipline, InformationHeading, OutgoingEmail, TermOfService
+from Cores.reference import reference_get, reference_rows
+from Cores.storage import collect_garbage
+from SubmissionPortal.models import AuthorSubmission, SubmissionFile
 
 
 class CoreTestcase(GraphQLTestCase):
@@ -52,3 +75,211 @@ class CoreTestcase(GraphQLTestCase):
 
         self.assertEqual(len(content), len(information_headings))
         self.assertTrue(content[0]["name"] in [i.name for i in information_headings])
+
+
+class OutgoingEmailTestcase(TestCase):
+    def queue(self, n):
+        return [
+            queue_email(
+                "subject {0}".format(i),
+                "text",
+                "journal@pubsgate.com",
+                ["reviewer{0}@gmail.com".format(i)],
+                html_content="<p>text</p>",
+            )
+            for i in range(n)
+        ]
+
+    def test_emails_are_sent_by_the_worker(self):
+        self.queue(3)
+
+        self.assertEqual(len(mail.outbox), 0)
+
+        call_command("send_emails", "--once", "--batch-size", "2", stdout=StringIO())
+
+        self.assertEqual(len(mail.outbox), 3)
+        self.assertEqual(mail.outbox[0].alternatives, [("<p>text</p>", "text/html")])
+        self.assertFalse(
+            OutgoingEmail.objects.exclude(status=OutgoingEmail.Status.SENT).exists()
+        )
+
+    def test_failed_emails_are_retried_with_backoff(self):
+        (email,) = self.queue(1)
+
+        with mock.patch(
+            "django.core.mail.EmailMultiAlternatives.send",
+            side_effect=ConnectionError("connection refused"),
+        ):
+            self.assertEqual(send_queued_emails(), 0)
+
+        email.refresh_from_db()
+
+        self.assertEqual(email.status, OutgoingEmail.Status.PENDING)
+        self.assertEqual(email.attempts, 1)
+        self.assertGreater(email.send_after, email.created_at)
+
+        ## not due yet
+        self.assertEqual(send_queued_emails(), 0)
+
+        OutgoingEmail.objects.update(
+            send_after=email.created_at, attempts=MAX_ATTEMPTS - 1
+        )
+
+        with mock.patch(
+            "django.core.mail.EmailMultiAlternatives.send",
+            side_effect=ConnectionError("connection refused"),
+        ):
+            send_queued_emails()
+
+        email.refresh_from_db()
+
+        self.assertEqual(email.status, OutgoingEmail.Status.FAILED)
+        self.assertEqual(len(mail.outbox), 0)
+
+    def test_emails_are_claimed_before_sending(self):
+        (email,) = self.queue(1)
+
+        ## the connection fails before any email is sent
+        with mock.patch(
+            "django.core.mail.backends.locmem.EmailBackend.open",
+            side_effect=ConnectionError("connection refused"),
+        ):
+            self.assertEqual(send_queued_emails(), 0)
+
+        email.refresh_from_db()
+
+        self.assertEqual(email.attempts, 1)
+        self.assertEqual(email.last_error, "connection refused")
+        self.assertIsNone(email.claimed_until)
+        self.assertGreater(email.send_after, email.created_at)
+
+        OutgoingEmail.objects.update(send_after=email.created_at)
+
+        ## claimed by a worker which is still sending
+        self.assertEqual(claim_due_emails(10), [email])
+        self.assertEqual(send_queued_emails(), 0)
+
+        ## or which stopped
+        OutgoingEmail.objects.update(claimed_until=timezone.now())
+
+        self.assertEqual(send_queued_emails(), 1)
+
+        email.refresh_from_db()
+
+        self.assertEqual(email.status, OutgoingEmail.Status.SENT)
+        self.assertEqual(email.attempts, 3)
+        self.assertIsNone(email.last_error)
+
+
+class ContentAddressedStorageTestcase(TestCase):
+    def setUp(self):
+        media_root = tempfile.TemporaryDirectory()
+        self.addCleanup(media_root.cleanup)
+
+        settings = self.settings(MEDIA_ROOT=media_root.name)
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+    def test_identical_files_are_stored_once(self):
+        submission = mixer.blend(AuthorSubmission)
+        content = os.urandom(1024)
+
+        create_file = lambda name: SubmissionFile.objects.create(
+            author_submission=submission,
+            file_type=SubmissionFile.FileType.COVER_LETTER,
+            file=SimpleUploadedFile(name=name, content=content),
+        )
+
+        first = create_file("cover_letter.pdf")
+        second = create_file("Cover Letter (revised).PDF")
+
+        self.assertEqual(first.file.name, second.file.name)
+        self.assertTrue(first.file.name.endswith(".pdf"))
+
+        first.delete()
+
+        self.assertEqual(collect_garbage(grace=timedelta(0)), [])
+        self.assertTrue(os.path.isfile(second.file.path))
+
+        second.delete()
+
+        self.assertEqual(collect_garbage(), [])
+        self.assertEqual(collect_garbage(grace=timedelta(0)), [second.file.name])
+        self.assertFalse(os.path.isfile(second.file.path))
+
+
+class ReferenceCacheTestcase(TransactionTestCase):
+    """
+    Reference rows are only cached when read outside of a transaction
+    """
+
+    def setUp(self):
+        cache.clear()
+        reference._rows.clear()
+
+    def tearDown(self):
+        cache.clear()
+        reference._rows.clear()
+
+    def test_reference_rows_are_served_without_queries(self):
+        disciplines = mixer.cycle(3).blend(Discipline)
+        term = mixer.blend(TermOfService)
+        term.discipline.add(*disciplines[:2])
+
+        self.assertEqual(
+            [discipline.pk for discipline in reference_rows(Discipline)],
+            [
+                discipline.pk
+                for discipline in sorted(disciplines, key=lambda row: row.name)
+            ],
+        )
+        reference_rows(TermOfService)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                reference_get(Discipline, name=disciplines[0].name), disciplines[0]
+            )
+            self.assertEqual(len(reference_rows(TermOfService)[0].discipline.all()), 2)
+
+            with self.assertRaises(Discipline.DoesNotExist):
+                reference_get(Discipline, name="linguistics")
+
+        ## another worker reads the rows from the shared cache
+        reference._rows.clear()
+
+        with self.assertNumQueries(0):
+            reference_rows(Discipline)
+
+        ## a copy is not served past its timeout, whether the cache is
+        ## shared by every worker or not
+        version, rows, read_at = reference._rows[Discipline]
+        reference._rows[Discipline] = (
+            version,
+            rows[:1],
+            read_at - reference.REFERENCE_TIMEOUT,
+        )
+        cache.clear()
+
+        self.assertEqual(len(reference_rows(Discipline)), 3)
+
+        Discipline.objects.create(name="linguistics")
+
+        self.assertEqual(
+            reference_get(Discipline, name="linguistics").slug, "linguistics"
+        )
+
+        term.discipline.remove(disciplines[0])
+
+        self.assertEqual(len(reference_rows(TermOfService)[0].discipline.all()), 1)
+
+        ## terms prefetch their disciplines
+        disciplines[1].name = "philology"
+        disciplines[1].save()
+
+        self.assertEqual(
+            [
+                discipline.name
+                for discipline in reference_rows(TermOfService)[0].discipline.all()
+            ],
+            ["philology"],
+        )
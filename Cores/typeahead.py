@@ -0,0 +1,96 @@
+import hashlib
+
+from django.contrib.postgres.search import TrigramWordSimilarity
+from django.core.cache import cache
+
+from .extensions import has_trigram
+
+## suggestions returned when the client does not ask for a number
+SUGGESTION_LIMIT = 10
+
+## most suggestions a client can ask for
+MAX_SUGGESTIONS = 50
+
+## seconds a prefix's suggestions are cached, saving or deleting a row of the
+## model expires them sooner
+SUGGESTION_TIMEOUT = 300
+
+
+def normalize(text):
+    """
+    Lowercase text with single spaces, so that the typed variants of a
+    prefix share their cached suggestions
+    """
+    return " ".join(str(text).split()).lower()
+
+
+def _version_key(model):
+    return "suggestions:{0}".format(model._meta.label_lower)
+
+
+def invalidate_suggestions(sender, **kwargs):
+    """
+    Expire the cached suggestions of the sender model, connected to its
+    post_save and post_delete signals
+    """
+    try:
+        cache.incr(_version_key(sender))
+    except ValueError:
+        cache.set(_version_key(sender), 1, None)
+
+
+def match(queryset, text, field, limit):
+    """
+    Primary keys of the rows whose field best matches text, ranked by word
+    similarity on the field's gin_trgm_ops index. Without pg_trgm rows
+    containing text are returned in alphabetical order.
+    """
+    if has_trigram(queryset.db):
+        queryset = (
+            queryset.annotate(similarity=TrigramWordSimilarity(text, field))
+            .filter(**{"{0}__trigram_word_similar".format(field): text})
+            .order_by("-similarity", field)
+        )
+    else:
+        queryset = queryset.filter(**{"{0}__icontains".format(field): text}).order_by(
+            field
+        )
+
+    return list(queryset.values_list("pk", flat=True)[:limit])
+
+
+def suggest(queryset, text, field="name", scope="", limit=SUGGESTION_LIMIT):
+    """
+    Rows of queryset best matching what was typed so far, best first. The
+    ranked primary keys are cached by model, scope (whatever filters the
+    queryset, e.g. a journal id) and prefix, so a hot prefix costs a cache
+    read and a primary key lookup.
+    """
+    text = normalize(text)
+    limit = max(1, min(limit or SUGGESTION_LIMIT, MAX_SUGGESTIONS))
+
+    if not text:
+        return []
+
+    model = queryset.model
+    version = cache.get_or_set(_version_key(model), 1, None)
+    key = "suggestions:{0}:{1}:{2}".format(
+        model._meta.label_lower,
+        version,
+        hashlib.md5(
+            "{0}:{1}:{2}:{3}".format(field, scope, limit, text).encode()
+        ).hexdigest(),
+    )
+
+    pks = cache.get(key)
+
+    if pks is None:
+        pks = match(queryset, text, field, limit)
+        cache.set(key, pks, SUGGESTION_TIMEOUT)
+
+    if not pks:
+        return []
+
+    rows = queryset.in_bulk(pks)
+
+    return [rows[pk] for pk in pks if pk in rows]
@@ -0,0 +1,182 @@
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+from django.db import connection, transaction
+from django.db.models import Count
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+from graphql import GraphQLError
+
+from Cores.hyperloglog import HyperLogLog
+
+from .models import JournalViewLog, JournalViewRollup, RollupWatermark
+
+## name of the view logs rollup's watermark
+VIEW_ROLLUP = "journal_view_rollups"
+
+## the watermark follows the time views are written, the start of the
+## transaction inserting them, so it never passes the start of a transaction
+## still running, and the last minute is left to the next run for the views
+## stamped by the clock of another host. Views written late, e.g. replayed
+## from the spool of a stopped worker, are added to the rollups of the days
+## they happened.
+ROLLUP_LAG = timedelta(minutes=1)
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+DAY = "day"
+WEEK = "week"
+
+## longest range of days an analytics query covers
+MAX_ANALYTICS_DAYS = 3 * 366
+
+
+def rollup_horizon():
+    """
+    Start of the oldest transaction of the database still writing, other
+    than the current one, or None. Views stamped before it are committed.
+    """
+    with connection.cursor() as cursor:
+        ## the activity read earlier in the transaction is cached
+        cursor.execute("SELECT pg_stat_clear_snapshot()")
+        cursor.execute(
+            """
+            SELECT min(xact_start) FROM pg_stat_activity
+            WHERE datname = current_database()
+            AND backend_xid IS NOT NULL
+            AND pid <> pg_backend_pid()
+            """
+        )
+
+        return cursor.fetchone()[0]
+
+
+def rollup_journal_views(until=None):
+    """
+    Add the views written since the watermark to the daily rollups of their
+    journals and move the watermark, no further than the start of a
+    transaction still writing. The view logs are read with two
+    grouped queries, whatever their number, and the rollups are written
+    with one statement each for the new and the updated ones.
+
+    Returns the number of views rolled up.
+    """
+    until = until or timezone.now() - ROLLUP_LAG
+
+    with transaction.atomic():
+        ## concurrent runs wait for each other
+        watermark, _ = RollupWatermark.objects.select_for_update().get_or_create(
+            name=VIEW_ROLLUP, defaults={"position": EPOCH}
+        )
+
+        horizon = rollup_horizon()
+
+        if horizon is not None:
+            until = min(until, horizon)
+
+        if until <= watermark.position:
+            return 0
+
+        logs = (
+            JournalViewLog.objects.filter(
+                inserted_at__gte=watermark.position, inserted_at__lt=until
+            )
+            .annotate(bucket=TruncDate("created_at"))
+            .order_by()
+        )
+
+        counts = {
+            (row["journal_id"], row["bucket"]): row
+            for row in logs.values("journal_id", "bucket").annotate(
+                views=Count("pk"), user_views=Count("user")
+            )
+        }
+
+        sketches = defaultdict(HyperLogLog)
+
+        for journal_id, bucket, ip_address in (
+            logs.values_list("journal_id", "bucket", "ip_address").distinct().iterator()
+        ):
+            sketches[(journal_id, bucket)].add(ip_address)
+
+        rollups = {
+            (rollup.journal_id, rollup.bucket): rollup
+            for rollup in JournalViewRollup.objects.filter(
+                journal__in={journal_id for journal_id, bucket in counts},
+                bucket__in={bucket for journal_id, bucket in counts},
+            )
+        }
+
+        updates, creates = [], []
+
+        for key, row in counts.items():
+            rollup = rollups.get(key)
+
+            if rollup is None:
+                rollup = JournalViewRollup(
+                    journal_id=key[0], bucket=key[1], visitors=b""
+                )
+                creates.append(rollup)
+            else:
+                updates.append(rollup)
+
+            rollup.views += row["views"]
+            rollup.user_views += row["user_views"]
+            rollup.visitors = bytes(HyperLogLog(rollup.visitors).merge(sketches[key]))
+
+        JournalViewRollup.objects.bulk_update(
+            updates, ["views", "user_views", "visitors"]
+        )
+        JournalViewRollup.objects.bulk_create(creates)
+
+        watermark.position = until
+        watermark.save(update_fields=["position"])
+
+    return sum(row["views"] for row in counts.values())
+
+
+def journal_analytics(journal_id, start, end, granularity=DAY):
+    """
+    Views, views by logged in users and by anonymous visitors, and the
+    estimated number of distinct visitors of the journal for each day or
+    week, starting on Monday, between start and end included. Only the
+    rollups are read.
+    """
+    if end < start:
+        raise GraphQLError("the range ends before it starts")
+
+    if (end - start).days >= MAX_ANALYTICS_DAYS:
+        raise GraphQLError(
+            "the range covers more than {0} days".format(MAX_ANALYTICS_DAYS)
+        )
+
+    buckets = {}
+
+    for bucket, views, user_views, visitors in JournalViewRollup.objects.filter(
+        journal=journal_id, bucket__gte=start, bucket__lte=end
+    ).values_list("bucket", "views", "user_views", "visitors"):
+        if granularity == WEEK:
+            bucket -= timedelta(days=bucket.weekday())
+
+        if bucket not in buckets:
+            buckets[bucket] = {
+                "bucket": bucket,
+                "views": 0,
+                "user_views": 0,
+                "sketch": HyperLogLog(),
+            }
+
+        buckets[bucket]["views"] += views
+        buckets[bucket]["user_views"] += user_views
+        buckets[bucket]["sketch"].merge(HyperLogLog(visitors))
+
+    return [
+        {
+            "bucket": row["bucket"],
+            "views": row["views"],
+            "user_views": row["user_views"],
+            "anonymous_views": row["views"] - row["user_views"],
+            "visitors": len(row["sketch"]),
+        }
+        for row in buckets.values()
+    ]
@@ -7,6 +7,16 @@ class Action(graphene.Enum):
     DELETE = "delete"
 
 
+class Granularity(graphene.Enum):
+    DAY = "day"
+    WEEK = "week"
+
+
+class DateRangeInput(graphene.InputObjectType):
+    start = graphene.Date(required=True)
+    end = graphene.Date(required=True)
+
+
 class JournalInformationInput(graphene.InputObjectType):
     heading_id = graphene.ID(required=True)
     content = graphene.JSONString(required=True)
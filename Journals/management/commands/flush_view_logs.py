@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+
+from Journals.tracking import ViewLogBuffer
+
+
+class Command(BaseCommand):
+    help = "Write the journal views spooled by stopped workers"
+
+    def handle(self, *args, **options):
+        written = ViewLogBuffer().replay()
+
+        self.stdout.write("wrote {0} journal views".format(written))
@@ -0,0 +1,54 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from Journals.models import JournalViewLog
+from Journals.partitions import (
+    add_months,
+    create_partitions,
+    drop_partitions,
+    month_start,
+    purge_default_partition,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Create the journal view logs' partitions of the coming months "
+        "and drop the ones past the retention period, along with the rows "
+        "of the default partition past it"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--ahead",
+            type=int,
+            default=settings.VIEW_LOG_PARTITIONS_AHEAD,
+            help="months partitioned ahead of the current one",
+        )
+        parser.add_argument(
+            "--retain",
+            type=int,
+            default=settings.VIEW_LOG_RETENTION_MONTHS,
+            help="months of logs kept, the current one included",
+        )
+
+    def handle(self, *args, **options):
+        table = JournalViewLog._meta.db_table
+        month = month_start(timezone.now().date())
+
+        created = create_partitions(table, month, add_months(month, options["ahead"]))
+        before = add_months(month, 1 - max(options["retain"], 1))
+        dropped = drop_partitions(table, before)
+        purged = purge_default_partition(table, before)
+
+        for name in created:
+            self.stdout.write("created {0}".format(name))
+
+        for name in dropped:
+            self.stdout.write("dropped {0}".format(name))
+
+        if purged:
+            self.stdout.write(
+                "purged {0} expired rows of the default partition".format(purged)
+            )
@@ -0,0 +1,44 @@
+from django.core.management.base import BaseCommand, CommandError
+from graphql import GraphQLError
+
+from Journals.provisioning import provision_journals, read_journals
+
+
+class Command(BaseCommand):
+    help = (
+        "Create the journals listed in a CSV or JSON file with their editorial boards"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "path",
+            help="CSV file with a header line or JSON list of journals, "
+            "with name, issn and discipline columns",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="journals created per transaction",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            rows = read_journals(options["path"])
+        except (OSError, ValueError) as e:
+            raise CommandError("cannot read {0}: {1}".format(options["path"], e))
+
+        batch_size = options["batch_size"]
+        created = 0
+
+        for start in range(0, len(rows), batch_size):
+            try:
+                journals = provision_journals(rows[start : start + batch_size])
+            except GraphQLError as e:
+                raise CommandError(e.message)
+
+            created += len(journals)
+
+        self.stdout.write(
+            "created {0} journals, skipped {1}".format(created, len(rows) - created)
+        )
@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+
+from Journals.analytics import rollup_journal_views
+
+
+class Command(BaseCommand):
+    help = "Add the journal views logged since the last run to the daily rollups"
+
+    def handle(self, *args, **options):
+        views = rollup_journal_views()
+
+        self.stdout.write("rolled up {0} journal views".format(views))
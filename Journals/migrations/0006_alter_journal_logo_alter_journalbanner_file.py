@@ -0,0 +1,25 @@
+# Generated by Django 4.0.3 on 2026-10-18 11:37
+
+import Cores.storage
+import Journals.models.journals
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Journals', '0005_alter_editorjournalactivity_last_login'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='journal',
+            name='logo',
+            field=models.ImageField(blank=True, null=True, storage=Cores.storage.ContentAddressedStorage(), upload_to=Journals.models.journals.Journal.upload_to, verbose_name='logo'),
+        ),
+        migrations.AlterField(
+            model_name='journalbanner',
+            name='file',
+            field=models.ImageField(storage=Cores.storage.ContentAddressedStorage(), upload_to=Journals.models.journals.JournalBanner.upload_to, verbose_name='file'),
+        ),
+    ]
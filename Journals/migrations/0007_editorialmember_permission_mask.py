@@ -0,0 +1,48 @@
+# Generated by Django 4.0.3 on 2026-10-18 11:51
+
+from django.db import migrations, models
+
+## JournalPermissionChoice values at the time of the migration, in bit order
+PERMISSIONS = [
+    "give_reports",
+    "view_submissions",
+    "assign_editors",
+    "assign_reviewers",
+    "delete_submissions",
+    "edit_submissions",
+    "can_recruit",
+]
+
+
+def backfill_permission_masks(apps, schema_editor):
+    EditorialMember = apps.get_model("Journals", "EditorialMember")
+    Through = EditorialMember.permissions.through
+    masks = {}
+
+    for pk, code_name in Through.objects.values_list(
+        "editorialmember_id", "journalpermission__code_name"
+    ).iterator():
+        if code_name in PERMISSIONS:
+            masks[pk] = masks.get(pk, 0) | 1 << PERMISSIONS.index(code_name)
+
+    EditorialMember.objects.bulk_update(
+        [EditorialMember(pk=pk, permission_mask=mask) for pk, mask in masks.items()],
+        ["permission_mask"],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Journals', '0006_alter_journal_logo_alter_journalbanner_file'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='editorialmember',
+            name='permission_mask',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='permission_mask'),
+        ),
+        migrations.RunPython(backfill_permission_masks, migrations.RunPython.noop),
+    ]
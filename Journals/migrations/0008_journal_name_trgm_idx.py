@@ -0,0 +1,24 @@
+# Generated by Django 4.0.3 on 2026-10-18 12:10
+
+import Cores.extensions
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Cores', '0003_discipline_name_trgm_idx'),
+        ('Journals', '0007_editorialmember_permission_mask'),
+    ]
+
+    operations = [
+        Cores.extensions.AddTrigramIndex(
+            model_name='journal',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['name'], name='journal_name_trgm_idx', opclasses=['gin_trgm_ops']),
+        ),
+        Cores.extensions.AddTrigramIndex(
+            model_name='journalsubjectarea',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['name'], name='subject_name_trgm_idx', opclasses=['gin_trgm_ops']),
+        ),
+    ]
@@ -0,0 +1,56 @@
+# Generated by Django 4.0.3 on 2026-10-18 12:03
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Journals', '0008_journal_name_trgm_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JournalViewRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('bucket', models.DateField(verbose_name='bucket')),
+                ('views', models.PositiveIntegerField(default=0, verbose_name='views')),
+                ('user_views', models.PositiveIntegerField(default=0, verbose_name='user_views')),
+                ('visitors', models.BinaryField(verbose_name='visitors')),
+            ],
+            options={
+                'verbose_name': 'journal view rollup',
+                'verbose_name_plural': 'journal view rollups',
+                'db_table': 'journal_view_rollups',
+                'ordering': ['bucket'],
+            },
+        ),
+        migrations.CreateModel(
+            name='RollupWatermark',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=255, unique=True, verbose_name='name')),
+                ('position', models.DateTimeField(verbose_name='position')),
+            ],
+            options={
+                'verbose_name': 'rollup watermark',
+                'verbose_name_plural': 'rollup watermarks',
+                'db_table': 'rollup_watermarks',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='journalviewlog',
+            index=models.Index(fields=['created_at'], name='view_log_created_idx'),
+        ),
+        migrations.AddField(
+            model_name='journalviewrollup',
+            name='journal',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='view_rollups', to='Journals.journal'),
+        ),
+        migrations.AddConstraint(
+            model_name='journalviewrollup',
+            constraint=models.UniqueConstraint(fields=('journal', 'bucket'), name='unique_journal_view_rollup'),
+        ),
+    ]
@@ -0,0 +1,118 @@
+# Generated by Django 4.0.3 on 2026-10-18 12:40
+
+from django.db import migrations, models
+import django.utils.timezone
+
+from Journals.partitions import (
+    DEFAULT_SUFFIX,
+    add_months,
+    create_partitions,
+    month_start,
+)
+
+TABLE = "journal_view_logs"
+LEGACY = "journal_view_logs_legacy"
+COLUMNS = "id, ip_address, created_at, journal_id, user_id"
+
+## months partitioned ahead of the current one
+AHEAD = 3
+
+
+def rename_table(schema_editor, old, new):
+    quote = schema_editor.quote_name
+
+    schema_editor.execute("ALTER TABLE %s RENAME TO %s" % (quote(old), quote(new)))
+    ## the primary key's name would clash with the new table's
+    schema_editor.execute(
+        "ALTER TABLE %s RENAME CONSTRAINT %s TO %s"
+        % (quote(new), quote(old + "_pkey"), quote(new + "_pkey"))
+    )
+
+
+def partition_view_logs(apps, schema_editor):
+    JournalViewLog = apps.get_model("Journals", "JournalViewLog")
+    quote = schema_editor.quote_name
+
+    rename_table(schema_editor, TABLE, LEGACY)
+
+    ## a partitioned table's unique keys include its partition key
+    schema_editor.execute(
+        """
+        CREATE TABLE %s (
+            id uuid NOT NULL,
+            ip_address inet NOT NULL,
+            created_at timestamp with time zone NOT NULL,
+            journal_id bigint NOT NULL,
+            user_id bigint NULL,
+            PRIMARY KEY (id, created_at)
+        ) PARTITION BY RANGE (created_at)
+        """
+        % quote(TABLE)
+    )
+    schema_editor.execute(
+        "CREATE TABLE %s PARTITION OF %s DEFAULT"
+        % (quote(TABLE + DEFAULT_SUFFIX), quote(TABLE))
+    )
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("SELECT min(created_at) FROM %s" % quote(LEGACY))
+        (first,) = cursor.fetchone()
+
+    today = django.utils.timezone.now().date()
+    create_partitions(
+        TABLE,
+        min(first.date(), today) if first else today,
+        add_months(month_start(today), AHEAD),
+    )
+
+    schema_editor.execute(
+        "INSERT INTO %s (%s) SELECT %s FROM %s"
+        % (quote(TABLE), COLUMNS, COLUMNS, quote(LEGACY))
+    )
+    schema_editor.execute("DROP TABLE %s" % quote(LEGACY))
+
+    ## created on the partitioned table, they cascade to its partitions
+    for name in ("journal", "user"):
+        field = JournalViewLog._meta.get_field(name)
+        schema_editor.execute(
+            schema_editor._create_fk_sql(
+                JournalViewLog, field, "_fk_%(to_table)s_%(to_column)s"
+            )
+        )
+        schema_editor.execute(
+            schema_editor._create_index_sql(JournalViewLog, fields=[field])
+        )
+
+    for index in JournalViewLog._meta.indexes:
+        schema_editor.add_index(JournalViewLog, index)
+
+
+def unpartition_view_logs(apps, schema_editor):
+    JournalViewLog = apps.get_model("Journals", "JournalViewLog")
+    quote = schema_editor.quote_name
+
+    rename_table(schema_editor, TABLE, LEGACY)
+
+    ## the indexes and foreign keys are created once the partitions are gone
+    schema_editor.create_model(JournalViewLog)
+    schema_editor.execute(
+        "INSERT INTO %s (%s) SELECT %s FROM %s"
+        % (quote(TABLE), COLUMNS, COLUMNS, quote(LEGACY))
+    )
+    schema_editor.execute("DROP TABLE %s CASCADE" % quote(LEGACY))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Journals', '0009_journalviewrollup_rollupwatermark'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='journalviewlog',
+            name='created_at',
+            field=models.DateTimeField(default=django.utils.timezone.now, verbose_name='created_at'),
+        ),
+        migrations.RunPython(partition_view_logs, unpartition_view_logs),
+    ]
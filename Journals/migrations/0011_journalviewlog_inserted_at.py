@@ -0,0 +1,28 @@
+# Generated by Django 4.0.3 on 2026-10-18 12:26
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Journals', '0010_partition_journal_view_logs'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='journalviewlog',
+            name='inserted_at',
+            field=models.DateTimeField(default=django.utils.timezone.now, verbose_name='inserted_at'),
+        ),
+        ## the rollup watermark followed created_at until now
+        migrations.RunSQL(
+            "UPDATE journal_view_logs SET inserted_at = created_at",
+            migrations.RunSQL.noop,
+        ),
+        migrations.AddIndex(
+            model_name='journalviewlog',
+            index=models.Index(fields=['inserted_at'], name='view_log_inserted_idx'),
+        ),
+    ]
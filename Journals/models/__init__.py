@@ -6,6 +6,8 @@ from .journals import (
     JournalBanner,
     JournalInformation,
     JournalViewLog,
+    JournalViewRollup,
+    RollupWatermark,
     JournalVolume,
     JournalVolumeIssue,
     JournalReportQuestion,
@@ -3,7 +3,9 @@ import string
 import uuid
 
 from Cores.models import Discipline, InformationHeading
+from Cores.storage import content_addressed_storage
 from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex
 from django.contrib.auth.hashers import make_password
 from django.db import models
 from django.template.defaultfilters import slugify
@@ -49,7 +51,13 @@ class Journal(models.Model):
     iso_abbreviation = models.CharField(
         _("ISO_abbreviation"), max_length=255, null=True, default=None
     )
-    logo = models.ImageField(_("logo"), upload_to=upload_to, null=True, blank=True)
+    logo = models.ImageField(
+        _("logo"),
+        upload_to=upload_to,
+        null=True,
+        blank=True,
+        storage=content_addressed_storage,
+    )
     discipline = models.ForeignKey(
         Discipline, related_name="journals", on_delete=models.PROTECT
     )
@@ -60,6 +68,13 @@ class Journal(models.Model):
         verbose_name_plural = _("journals")
         db_table = "journals"
         ordering = ["-created_at"]
+        indexes = [
+            GinIndex(
+                fields=["name"],
+                name="journal_name_trgm_idx",
+                opclasses=["gin_trgm_ops"],
+            )
+        ]
 
     def __str__(self) -> str:
         return self.name
@@ -102,11 +117,18 @@ class Journal(models.Model):
         if role.name == "CHIEF":
             raise GraphQLError("action forbidden: cannot make editor a chief")
 
+        ## members are saved one by one, the signals invalidate the token
+        ## claims of the editors moved between roles
+
         ## remove the editor from old role
-        self.editorial_members.filter(editor=editor).update(editor=None)
+        for member in self.editorial_members.filter(editor=editor):
+            member.editor = None
+            member.save(update_fields=["editor"])
 
         ## assign the editor a new role
-        self.editorial_members.filter(role=role.value).update(editor=editor)
+        for member in self.editorial_members.filter(role=role.value):
+            member.editor = editor
+            member.save(update_fields=["editor"])
 
     def get_editorial_board_member(self, role):
         """
@@ -205,6 +227,13 @@ class JournalSubjectArea(models.Model):
                 fields=["name", "journal"], name="unique_journal_subject_areas"
             )
         ]
+        indexes = [
+            GinIndex(
+                fields=["name"],
+                name="subject_name_trgm_idx",
+                opclasses=["gin_trgm_ops"],
+            )
+        ]
 
     def __str__(self) -> str:
         return self.name
@@ -220,7 +249,9 @@ class JournalBanner(models.Model):
         BOTTOM = 3, _("bottom")
 
     id = models.UUIDField(primary_key=True, default=uuid.uuid4)
-    file = models.ImageField(_("file"), upload_to=upload_to)
+    file = models.ImageField(
+        _("file"), upload_to=upload_to, storage=content_addressed_storage
+    )
     journal = models.ForeignKey(
         Journal, related_name="banners", on_delete=models.CASCADE
     )
@@ -292,7 +323,8 @@ class JournalAuthToken(models.Model):
 
 class JournalViewLog(models.Model):
     """
-    Journal view logs
+    Journal view logs, the table is partitioned by month of created_at and
+    its primary key is (id, created_at), see Journals.partitions
     """
 
     id = models.UUIDField(primary_key=True, default=uuid.uuid4)
@@ -306,13 +338,62 @@ class JournalViewLog(models.Model):
     journal = models.ForeignKey(
         Journal, related_name="view_logs", on_delete=models.CASCADE
     )
-    created_at = models.DateTimeField(_("created_at"), auto_now_add=True)
+    ## the view's time, kept when a spooled view is written later
+    created_at = models.DateTimeField(_("created_at"), default=timezone.now)
+    ## the time the view was written, the rollups follow it so that views
+    ## written late are still rolled up
+    inserted_at = models.DateTimeField(_("inserted_at"), default=timezone.now)
 
     class Meta:
         db_table = "journal_view_logs"
         verbose_name = _("journal view log")
         verbose_name_plural = _("journal view logs")
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["created_at"], name="view_log_created_idx"),
+            models.Index(fields=["inserted_at"], name="view_log_inserted_idx"),
+        ]
+
+
+class JournalViewRollup(models.Model):
+    """
+    Views of a journal in a day, aggregated from the view logs by
+    Journals.analytics
+    """
+
+    journal = models.ForeignKey(
+        Journal, related_name="view_rollups", on_delete=models.CASCADE
+    )
+    bucket = models.DateField(_("bucket"))
+    views = models.PositiveIntegerField(_("views"), default=0)
+    user_views = models.PositiveIntegerField(_("user_views"), default=0)
+    ## HyperLogLog sketch of the visitors' addresses
+    visitors = models.BinaryField(_("visitors"))
+
+    class Meta:
+        db_table = "journal_view_rollups"
+        verbose_name = _("journal view rollup")
+        verbose_name_plural = _("journal view rollups")
+        ordering = ["bucket"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["journal", "bucket"], name="unique_journal_view_rollup"
+            )
+        ]
+
+
+class RollupWatermark(models.Model):
+    """
+    Time up to which a rollup has aggregated its source rows
+    """
+
+    name = models.CharField(_("name"), max_length=255, unique=True)
+    position = models.DateTimeField(_("position"))
+
+    class Meta:
+        db_table = "rollup_watermarks"
+        verbose_name = _("rollup watermark")
+        verbose_name_plural = _("rollup watermarks")
 
 
 class JournalVolume(models.Model):
@@ -25,6 +25,11 @@ class Role(models.Model):
         choices=Role.choices,
         default=Role.SECTION,
     )
+    ## bitmask of the role's permissions, kept in sync with the permissions
+    ## relation so permission checks need no join
+    permission_mask = models.PositiveIntegerField(
+        _("permission_mask"), default=0, editable=False
+    )
     created_at = models.DateTimeField(_("created_at"), auto_now_add=True)
 
     class Meta:
@@ -9,4 +9,5 @@ from .journals import (
     JournalSubjectAreaMutation,
     EditJournalInformationMutation,
     TransferJournalManagementMutation,
+    RecordJournalViewMutation,
 )
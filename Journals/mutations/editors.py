@@ -1,12 +1,15 @@
 from django.shortcuts import get_object_or_404
 import graphene
 from django.contrib.auth import get_user_model
-from django.core.mail import EmailMultiAlternatives
+from django.db import transaction
 from graphql.error import GraphQLError
 from graphql_jwt.decorators import login_required, staff_member_required
 
+from Cores.mail import queue_email
+
 from ..models import Editor, Journal, RecruitmentApplication
 from ..nodes import Editor as EditorType
+from ..permissions import get_permissions
 from ..permissions.editors import editor_in_chief_required
 
 
@@ -26,13 +29,6 @@ class AcceptEditorMutation(graphene.Mutation):
         user = get_user_model().objects.get(email=email)
         journal = Journal.objects.get(pk=journal_id)
 
-        RecruitmentApplication.objects.create(
-            user=user,
-            journal=journal,
-            status=RecruitmentApplication.Status.ACCEPTED,
-            role=RecruitmentApplication.Role.EDITOR,
-        )
-
         url = "/accounts/editor/signup?jid={0}".format(journal_id)
 
         from_email = "{0}@pubsgate.com".format(journal.name)
@@ -45,9 +41,21 @@ class AcceptEditorMutation(graphene.Mutation):
             "<a>{0}</a></div>"
         )
 
-        msg = EmailMultiAlternatives(subject, text_content, from_email, to)
-        msg.attach_alternative(html_content.format(url), "text/html")
-        msg.send()
+        with transaction.atomic():
+            RecruitmentApplication.objects.create(
+                user=user,
+                journal=journal,
+                status=RecruitmentApplication.Status.ACCEPTED,
+                role=RecruitmentApplication.Role.EDITOR,
+            )
+
+            queue_email(
+                subject,
+                text_content,
+                from_email,
+                to,
+                html_content=html_content.format(url),
+            )
 
         return AcceptEditorMutation(message="success")
 
@@ -100,6 +108,7 @@ class CreateEditorMutation(graphene.Mutation):
         )
 
         editor.journals.add(journal)
+        get_permissions(info.context).clear()
 
         application.status = RecruitmentApplication.Status.COMPLETED
         application.save()
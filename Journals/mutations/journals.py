@@ -3,6 +3,7 @@ from datetime import datetime, timedelta, timezone
 import graphene
 import jwt
 from Cores.models import Discipline
+from Cores.reference import reference_get
 from django.contrib.auth.hashers import check_password
 from django.shortcuts import get_object_or_404
 from graphene_file_upload.scalars import Upload
@@ -24,6 +25,7 @@ from ..models import (
 from ..nodes import Journal as JournalType
 from ..nodes import JournalInformation as JournalInformationType
 from ..permissions import editor_in_chief_required, editor_is_required
+from ..tracking import record_view
 
 
 class CreateJournalMutation(graphene.Mutation):
@@ -38,7 +40,7 @@ class CreateJournalMutation(graphene.Mutation):
     @staff_member_required
     @login_required
     def mutate(root, info, **kwargs):
-        discipline = Discipline.objects.get(name=kwargs.pop("discipline"))
+        discipline = reference_get(Discipline, name=kwargs.pop("discipline"))
 
         journal = Journal.objects.create(discipline=discipline, **kwargs)
 
@@ -203,7 +205,7 @@ class LogoutJournalManagerMutation(graphene.Mutation):
     @login_required
     def mutate(root, info, **kwargs):
         token = kwargs.get("token")
-        
+
         try:
             JournalAuthToken.objects.filter(token=token).delete()
             message = "success"
@@ -211,3 +213,22 @@ class LogoutJournalManagerMutation(graphene.Mutation):
             message = "error"
 
         return LogoutJournalManagerMutation(message=message)
+
+
+class RecordJournalViewMutation(graphene.Mutation):
+    """
+    Log a visit of a journal's page, the view is written in a later batch
+    """
+
+    message = graphene.String()
+
+    class Arguments:
+        journal_id = graphene.ID(required=True)
+
+    def mutate(root, info, journal_id):
+        try:
+            record_view(info.context, journal_id)
+        except ValueError:
+            raise GraphQLError("journal does not exist")
+
+        return RecordJournalViewMutation(message="success")
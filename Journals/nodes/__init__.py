@@ -1,6 +1,7 @@
 from .editors import Editor
 from .journals import (
     Journal,
+    JournalAnalytics,
     JournalPermissionNode,
     JournalSubjectArea,
     JournalReportQuestionNode,
@@ -1,5 +1,7 @@
 from graphene_django import DjangoObjectType
 
+from Cores.loaders import load_related
+
 from ..models import Editor as EditorModel
 
 
@@ -14,3 +16,6 @@ class Editor(DjangoObjectType):
             "user",
             "specialisation",
         ]
+
+    def resolve_user(self, info):
+        return load_related(info, self, "user")
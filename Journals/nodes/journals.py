@@ -2,6 +2,7 @@ import graphene
 
 from graphene_django import DjangoObjectType
 
+from Cores.loaders import load_related
 from Cores.nodes import (
     Discipline as SubjectDisciplineNode,
     InformationHeading as InformationHeadingType,
@@ -36,7 +37,7 @@ class Journal(DjangoObjectType):
         )
 
     def resolve_discipline(self, info):
-        return self.discipline
+        return load_related(info, self, "discipline")
 
     def resolve_publication_frequency(self, info):
         return self.get_publication_frequency_display()
@@ -45,6 +46,14 @@ class Journal(DjangoObjectType):
         return self.editor_last_login
 
 
+class JournalAnalytics(graphene.ObjectType):
+    bucket = graphene.Date(description="day, or Monday of the week")
+    views = graphene.Int()
+    user_views = graphene.Int()
+    anonymous_views = graphene.Int()
+    visitors = graphene.Int(description="estimated number of distinct visitors")
+
+
 class JournalInformation(DjangoObjectType):
     heading = graphene.Field(InformationHeadingType)
 
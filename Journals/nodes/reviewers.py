@@ -1,6 +1,8 @@
 import graphene
 from graphene_django import DjangoObjectType
 
+from Cores.loaders import load_related
+
 from ..models import Reviewer
 
 
@@ -9,3 +11,14 @@ class ReviewerNode(DjangoObjectType):
         model = Reviewer
         fields = ("id", "is_anonymous", "affiliation", "journals", "started_at", "user")
         interfaces = (graphene.relay.Node,)
+
+    score = graphene.Float(description="similarity of the reviewer to a submission")
+
+    def resolve_score(self, info):
+        return getattr(self, "score", None)
+
+    def resolve_journals(self, info, **kwargs):
+        return load_related(info, self, "journals")
+
+    def resolve_user(self, info):
+        return load_related(info, self, "user")
@@ -0,0 +1,158 @@
+import re
+from datetime import date
+
+from django.db import connection, transaction
+
+## suffix of a month's partition, e.g. journal_view_logs_p202610
+PARTITION_SUFFIX = "_p{0:%Y%m}"
+
+## rows outside of every month's partition
+DEFAULT_SUFFIX = "_default"
+
+
+def month_start(day):
+    return date(day.year, day.month, 1)
+
+
+def add_months(month, months):
+    index = month.year * 12 + month.month - 1 + months
+
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(table, month):
+    return table + PARTITION_SUFFIX.format(month)
+
+
+def partitions(table):
+    """
+    Months partitioning the table, by their partition's name
+    """
+    pattern = re.compile(re.escape(table) + r"_p(\d{4})(\d{2})$")
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT child.relname
+            FROM pg_inherits
+            JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+            WHERE pg_inherits.inhparent = %s::regclass
+            """,
+            [table],
+        )
+        names = [name for (name,) in cursor.fetchall()]
+
+    months = {}
+
+    for name in names:
+        match = pattern.match(name)
+
+        if match:
+            months[name] = date(int(match.group(1)), int(match.group(2)), 1)
+
+    return months
+
+
+def create_partition(table, month, column="created_at"):
+    """
+    Create the month's partition of a table partitioned by range of column,
+    the month's rows are moved to it from the default partition. Returns
+    whether the partition was created.
+    """
+    name = partition_name(table, month)
+
+    if name in partitions(table):
+        return False
+
+    quote = connection.ops.quote_name
+    bounds = [
+        "{0:%Y-%m-%d} 00:00:00+00".format(month),
+        "{0:%Y-%m-%d} 00:00:00+00".format(add_months(month, 1)),
+    ]
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(
+            "CREATE TABLE {0} (LIKE {1} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)".format(
+                quote(name), quote(table)
+            )
+        )
+        ## the default partition cannot keep rows of a new partition's range
+        cursor.execute(
+            """
+            WITH moved AS (
+                DELETE FROM {0} WHERE {2} >= %s AND {2} < %s RETURNING *
+            )
+            INSERT INTO {1} SELECT * FROM moved
+            """.format(
+                quote(table + DEFAULT_SUFFIX), quote(name), quote(column)
+            ),
+            bounds,
+        )
+        cursor.execute(
+            "ALTER TABLE {0} ATTACH PARTITION {1} FOR VALUES FROM (%s) TO (%s)".format(
+                quote(table), quote(name)
+            ),
+            bounds,
+        )
+
+    return True
+
+
+def create_partitions(table, start, end):
+    """
+    Create the missing partitions of the months from start to end included,
+    returns the names of the created partitions
+    """
+    month, end = month_start(start), month_start(end)
+    created = []
+
+    while month <= end:
+        if create_partition(table, month):
+            created.append(partition_name(table, month))
+
+        month = add_months(month, 1)
+
+    return created
+
+
+def drop_partitions(table, before):
+    """
+    Detach and drop the partitions of the months before the given one,
+    their rows are gone without a DELETE to vacuum. Returns the names of
+    the dropped partitions.
+    """
+    quote = connection.ops.quote_name
+    dropped = []
+
+    for name, month in sorted(partitions(table).items(), key=lambda item: item[1]):
+        if month >= month_start(before):
+            continue
+
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(
+                "ALTER TABLE {0} DETACH PARTITION {1}".format(quote(table), quote(name))
+            )
+            cursor.execute("DROP TABLE {0}".format(quote(name)))
+
+        dropped.append(name)
+
+    return dropped
+
+
+def purge_default_partition(table, before, column="created_at"):
+    """
+    Delete the rows of the default partition older than the month before,
+    the rows of months without a partition of their own are kept no longer
+    than the dropped partitions'. Returns the number of deleted rows.
+    """
+    quote = connection.ops.quote_name
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "DELETE FROM {0} WHERE {1} < %s".format(
+                quote(table + DEFAULT_SUFFIX), quote(column)
+            ),
+            ["{0:%Y-%m-%d} 00:00:00+00".format(month_start(before))],
+        )
+
+        return cursor.rowcount
@@ -1,3 +1,9 @@
+from .context import PermissionContext, get_permissions, group_required
 from .editors import is_editor_journal, editor_in_chief_required, editor_is_required
-from .journals import JournalPermissionChoice
+from .journals import (
+    JournalPermissionChoice,
+    permission_mask,
+    permissions_changed,
+    sync_permission_masks,
+)
 from .reviewers import reviewer_is_required, is_reviewer_journal
@@ -0,0 +1,162 @@
+from functools import wraps
+
+from graphql_jwt.decorators import context
+from graphql_jwt.exceptions import JSONWebTokenError, PermissionDenied
+from graphql_jwt.utils import get_http_authorization, get_payload
+
+from ..models import Editor, EditorialMember, Reviewer
+
+## permissions carried by the token's claims
+CLAIMS = ("groups", "editor_journals", "reviewer_journals", "chief_journals")
+
+
+class PermissionContext:
+    """
+    The groups and journal memberships of the requesting user.
+
+    Every permission check of a request is answered from the same context,
+    so each membership is queried at most once per request.
+    """
+
+    def __init__(self, user):
+        self.user = user
+        self._cache = {}
+
+    def memoize(self, key, load):
+        """
+        Return the value stored under key, calling load on the first access
+        """
+        if key not in self._cache:
+            self._cache[key] = load()
+
+        return self._cache[key]
+
+    def clear(self):
+        """
+        Forget the loaded permissions after the user's memberships changed
+        """
+        self._cache = {}
+
+    @property
+    def groups(self):
+        return self.memoize(
+            "groups", lambda: set(self.user.groups.values_list("name", flat=True))
+        )
+
+    @property
+    def editor_journals(self):
+        return self.memoize(
+            "editor_journals",
+            lambda: {
+                str(pk)
+                for pk in Editor.objects.filter(
+                    user__pk=self.user.pk, journals__isnull=False
+                ).values_list("journals__pk", flat=True)
+            },
+        )
+
+    @property
+    def reviewer_journals(self):
+        return self.memoize(
+            "reviewer_journals",
+            lambda: {
+                str(pk)
+                for pk in Reviewer.objects.filter(
+                    user__pk=self.user.pk, journals__isnull=False
+                ).values_list("journals__pk", flat=True)
+            },
+        )
+
+    @property
+    def chief_journals(self):
+        return self.memoize(
+            "chief_journals",
+            lambda: {
+                str(pk)
+                for pk in EditorialMember.objects.filter(
+                    editor__user__pk=self.user.pk, role=EditorialMember.Role.CHIEF
+                ).values_list("journal_id", flat=True)
+            },
+        )
+
+    def has_group(self, name):
+        return name in self.groups
+
+    def claims(self):
+        """
+        The permissions to embed in the user's tokens
+        """
+        claims = {key: sorted(getattr(self, key)) for key in CLAIMS}
+        claims["version"] = self.user.claims_version
+
+        return claims
+
+    def load_claims(self, claims):
+        """
+        Trust the permissions of a token's claims, unless the user's
+        roles changed since the token was issued
+        """
+        if claims.get("version") != self.user.claims_version:
+            return False
+
+        for key in CLAIMS:
+            self._cache[key] = set(claims.get(key, ()))
+
+        return True
+
+
+def get_token_claims(context):
+    """
+    Get the permission claims of the request's token, if any
+    """
+    token = get_http_authorization(context)
+
+    if token is None:
+        return None
+
+    try:
+        payload = get_payload(token, context)
+    except JSONWebTokenError:
+        return None
+
+    if payload.get("email") != getattr(context.user, "email", None):
+        return None
+
+    return payload.get("claims")
+
+
+def get_permissions(context):
+    """
+    Get the permission context of the request's user
+    """
+    permissions = getattr(context, "permissions", None)
+
+    if permissions is None or permissions.user.pk != context.user.pk:
+        permissions = PermissionContext(context.user)
+        setattr(context, "permissions", permissions)
+
+        claims = get_token_claims(context)
+
+        if claims:
+            permissions.load_claims(claims)
+
+    return permissions
+
+
+def group_required(name):
+    """
+    The user is a member of the named group
+    """
+
+    def decorator(f):
+        @wraps(f)
+        @context(f)
+        def wrapper(context, *args, **kwargs):
+            if get_permissions(context).has_group(name):
+                return f(*args, **kwargs)
+
+            raise PermissionDenied
+
+        return wrapper
+
+    return decorator
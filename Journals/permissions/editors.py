@@ -3,16 +3,15 @@ from functools import wraps
 
 import jwt
 from django.shortcuts import get_object_or_404
-from graphql_jwt.decorators import context, user_passes_test
+from graphql_jwt.decorators import context
 from graphql_jwt.exceptions import PermissionDenied
 from graphql_relay import from_global_id
 from Journals.models.journals import JournalAuthToken
 
-from ..models import Editor, EditorialMember, Journal
+from ..models import Journal
+from .context import get_permissions, group_required
 
-editor_is_required = user_passes_test(
-    lambda u: u.groups.filter(name="editors").exists()
-)
+editor_is_required = group_required("editors")
 
 
 def manager_login_required(input_key="journal_id"):
@@ -71,11 +70,9 @@ def is_editor_journal(input_key="journal_id"):
             if not journal_id:
                 raise PermissionDenied("Journal ID is required")
 
-            editor = Editor.objects.filter(
-                journals__pk=from_global_id(journal_id).id, user__pk=context.user.pk
-            )
+            editor_journals = get_permissions(context).editor_journals
 
-            if not editor.exists():
+            if from_global_id(journal_id).id not in editor_journals:
                 raise PermissionDenied(
                     "You do not have permission to perform this action"
                 )
@@ -102,13 +99,9 @@ def editor_in_chief_required(input_key="journal_id"):
             if not journal_id:
                 raise PermissionDenied("Journal ID is required")
 
-            journal_member = EditorialMember.objects.filter(
-                journal__pk=journal_id,
-                role=EditorialMember.Role.CHIEF,
-                editor__user__pk=context.user.pk,
-            )
+            chief_journals = get_permissions(context).chief_journals
 
-            if not journal_member.exists():
+            if str(journal_id) not in chief_journals:
                 raise PermissionDenied(
                     "You do not have permission to perform this action"
                 )
@@ -10,3 +10,64 @@ class JournalPermissionChoice(models.TextChoices):
     DELETE_SUBMISSIONS = "delete_submissions", _("Can delete submissions")
     EDIT_SUBMISSIONS = "edit_submissions", _("Can edit submissions")
     CAN_RECRUIT = "can_recruit", _("Can recriut editors or reviewers")
+
+
+def permission_mask(code_names):
+    """
+    Bitmask of the given permissions, bit i standing for the i-th
+    JournalPermissionChoice. New choices must be appended to keep the
+    stored masks valid.
+    """
+    values = JournalPermissionChoice.values
+    mask = 0
+
+    for code_name in code_names:
+        mask |= 1 << values.index(code_name)
+
+    return mask
+
+
+def sync_permission_masks(model, pks):
+    """
+    Recompute the permission_mask of the rows of model with the given
+    primary keys from their permissions
+    """
+    field = model.permissions.field
+    source = field.m2m_field_name()
+    target = field.m2m_reverse_field_name()
+
+    code_names = {str(pk): [] for pk in pks}
+
+    if not code_names:
+        return
+
+    for pk, code_name in model.permissions.through.objects.filter(
+        **{"%s__in" % source: list(code_names)}
+    ).values_list(source, "%s__code_name" % target):
+        code_names[str(pk)].append(code_name)
+
+    model.objects.bulk_update(
+        [
+            model(pk=pk, permission_mask=permission_mask(names))
+            for pk, names in code_names.items()
+        ],
+        ["permission_mask"],
+    )
+
+
+def permissions_changed(model, instance, action, reverse, pk_set):
+    """
+    Keep the permission masks of model in sync with an m2m_changed signal
+    of its permissions
+    """
+    if not reverse:
+        if action in ("post_add", "post_remove", "post_clear"):
+            sync_permission_masks(model, [instance.pk])
+    elif action == "pre_clear":
+        instance._cleared_roles = list(
+            model.objects.filter(permissions=instance).values_list("pk", flat=True)
+        )
+    elif action == "post_clear":
+        sync_permission_masks(model, instance.__dict__.pop("_cleared_roles", []))
+    elif action in ("post_add", "post_remove"):
+        sync_permission_masks(model, pk_set)
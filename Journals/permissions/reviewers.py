@@ -1,14 +1,12 @@
 from functools import wraps
-from graphql_jwt.decorators import context, user_passes_test
+from graphql_jwt.decorators import context
 from graphql_jwt.exceptions import PermissionDenied
 from graphql_relay import from_global_id
 
-from Journals.models.reviewers import Reviewer
+from .context import get_permissions, group_required
 
 
-reviewer_is_required = user_passes_test(
-    lambda u: u.groups.filter(name="reviewers").exists()
-)
+reviewer_is_required = group_required("reviewers")
 
 
 def is_reviewer_journal(calls_relay_mutation=False, input_key="journal_id"):
@@ -27,16 +25,12 @@ def is_reviewer_journal(calls_relay_mutation=False, input_key="journal_id"):
             else:
                 journal_id = kwargs.get(input_key, None)
 
-            id = from_global_id(journal_id).id
-
             if not journal_id:
                 raise PermissionDenied("Journal ID is required")
 
-            reviewer = Reviewer.objects.filter(
-                journals__pk=from_global_id(journal_id).id, user__pk=context.user.pk
-            )
+            reviewer_journals = get_permissions(context).reviewer_journals
 
-            if not reviewer.exists():
+            if from_global_id(journal_id).id not in reviewer_journals:
                 raise PermissionDenied("Forbiden action")
 
             return f(*args, **kwargs)
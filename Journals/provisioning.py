@@ -0,0 +1,185 @@
+import csv
+import json
+from pathlib import Path
+
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+from django.template.defaultfilters import slugify
+from graphql import GraphQLError
+
+from Cores.models import Discipline, InformationHeading
+from Cores.reference import reference_rows
+from Cores.typeahead import invalidate_suggestions
+
+from .models import Journal, JournalPermission, EditorialMember
+from .models.journals import JournalInformation
+from .permissions import JournalPermissionChoice, permission_mask
+
+## columns of a journal in a provisioning file, besides its name, ISSN and
+## discipline name
+OPTIONAL_FIELDS = (
+    "iso_abbreviation",
+    "publication_start_date",
+    "access_options",
+    "publication_frequency",
+)
+
+
+def provision_editorial_boards(journals):
+    """
+    Create the information sections, the permissions and the editorial board
+    of new journals with one statement per table, whatever the number of
+    journals.
+
+    The board's access logins are written as unusable passwords, which
+    check_password rejects like the random passwords nobody received before,
+    so nothing is hashed here. Nothing issues board credentials yet.
+    """
+    headings = reference_rows(InformationHeading)
+
+    JournalInformation.objects.bulk_create(
+        [
+            JournalInformation(journal=journal, heading=heading)
+            for journal in journals
+            for heading in headings
+        ]
+    )
+
+    permissions = JournalPermission.objects.bulk_create(
+        [
+            JournalPermission(journal=journal, code_name=code_name, label=label)
+            for journal in journals
+            for code_name, label in JournalPermissionChoice.choices
+        ]
+    )
+
+    mask = permission_mask([JournalPermissionChoice.VIEW_SUBMISSIONS])
+    members = EditorialMember.objects.bulk_create(
+        [
+            EditorialMember(
+                role=role,
+                journal=journal,
+                access_login=make_password(None),
+                permission_mask=mask,
+            )
+            for journal in journals
+            for role in EditorialMember.Role.values
+            if role != EditorialMember.Role.CHIEF
+        ]
+    )
+
+    view_permissions = {
+        permission.journal_id: permission.pk
+        for permission in permissions
+        if permission.code_name == JournalPermissionChoice.VIEW_SUBMISSIONS
+    }
+
+    Through = EditorialMember.permissions.through
+    Through.objects.bulk_create(
+        [
+            Through(
+                editorialmember_id=member.pk,
+                journalpermission_id=view_permissions[member.journal_id],
+            )
+            for member in members
+        ]
+    )
+
+    return members
+
+
+def get_choice(choices, value):
+    """
+    Get a choice from its value or its name
+    """
+    try:
+        return choices(int(value))
+    except ValueError:
+        pass
+
+    try:
+        return choices[str(value).upper().replace("-", "_")]
+    except KeyError:
+        raise GraphQLError("invalid {0}: {1}".format(choices.__name__, value))
+
+
+@transaction.atomic
+def provision_journals(rows):
+    """
+    Create the journals described by rows, dictionaries with a name, an issn,
+    a discipline name and optionally the OPTIONAL_FIELDS, along with their
+    editorial boards. Journals whose name is taken already are skipped.
+
+    Returns the created journals.
+    """
+    rows = [row for row in rows if row.get("name")]
+    names = {row["name"] for row in rows}
+    existing = set(
+        Journal.objects.filter(name__in=names).values_list("name", flat=True)
+    )
+
+    disciplines = {
+        discipline.name: discipline for discipline in reference_rows(Discipline)
+    }
+
+    journals = {}
+
+    for row in rows:
+        if row["name"] in existing or row["name"] in journals:
+            continue
+
+        discipline = disciplines.get(row.get("discipline"))
+
+        if discipline is None:
+            raise GraphQLError(
+                "unknown discipline {0} for journal {1}".format(
+                    row.get("discipline"), row["name"]
+                )
+            )
+
+        fields = {
+            field: row[field]
+            for field in OPTIONAL_FIELDS
+            if row.get(field) not in (None, "")
+        }
+
+        if "access_options" in fields:
+            fields["access_options"] = get_choice(
+                Journal.ModelType, fields["access_options"]
+            )
+
+        if "publication_frequency" in fields:
+            fields["publication_frequency"] = get_choice(
+                Journal.PublicationFrequency, fields["publication_frequency"]
+            )
+
+        ## bulk_create skips Journal.save, which derives the slug
+        journals[row["name"]] = Journal(
+            name=row["name"],
+            slug=slugify(row["name"]),
+            issn=row.get("issn", ""),
+            discipline=discipline,
+            **fields
+        )
+
+    journals = Journal.objects.bulk_create(journals.values())
+    provision_editorial_boards(journals)
+
+    ## bulk_create sends no post_save
+    invalidate_suggestions(Journal)
+
+    return journals
+
+
+def read_journals(path):
+    """
+    Read the journal rows of a CSV file with a header line, or of a JSON file
+    holding a list of objects
+    """
+    path = Path(path)
+
+    with open(path, newline="") as f:
+        if path.suffix.lower() == ".json":
+            return json.load(f)
+
+        return list(csv.DictReader(f))
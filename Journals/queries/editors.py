@@ -2,6 +2,8 @@ import graphene
 from django.db.models import F
 from graphql_jwt.decorators import login_required
 
+from Cores.optimizer import optimize
+
 from ..models import Editor
 from ..nodes import Editor as EditorType
 from ..nodes import Journal as JournalType
@@ -16,13 +18,15 @@ class EditorQuery(graphene.ObjectType):
     def resolve_editor(root, info, **kwargs):
         id = kwargs.get("id")
 
-        return Editor.objects.get(pk=id)
+        return optimize(Editor.objects, info).get(pk=id)
 
     @editor_is_required
     @login_required
     def resolve_editor_journals(root, info, **kwargs):
         editor = info.context.user.editor
 
-        return editor.journals.annotate(
+        queryset = editor.journals.annotate(
             editor_last_login=F("editor_activities__last_login")
-        ).all()
+        )
+
+        return optimize(queryset, info)
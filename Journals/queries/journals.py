@@ -1,11 +1,19 @@
 import graphene
+from graphql_jwt.decorators import login_required
 
+from Cores.optimizer import optimize
+from Cores.typeahead import suggest
+
+from ..analytics import journal_analytics
+from ..inputTypes.journals import DateRangeInput, Granularity
 from ..models.journals import Journal, JournalInformation, JournalSubjectArea
 from ..nodes import (
+    JournalAnalytics as JournalAnalyticsType,
     JournalInformation as JournalInformationType,
     Journal as JournalType,
     JournalSubjectArea as JournalSubjectAreaType,
 )
+from ..permissions import editor_in_chief_required
 
 
 class JournalQuery(graphene.ObjectType):
@@ -17,19 +25,61 @@ class JournalQuery(graphene.ObjectType):
     subject_areas = graphene.List(
         JournalSubjectAreaType, journal_id=graphene.ID(required=True)
     )
+    journal_analytics = graphene.List(
+        JournalAnalyticsType,
+        journal_id=graphene.ID(required=True),
+        range=DateRangeInput(required=True),
+        granularity=Granularity(default_value=Granularity.DAY.value),
+    )
+    journal_suggestions = graphene.List(
+        JournalType, query=graphene.String(required=True), first=graphene.Int()
+    )
+    subject_area_suggestions = graphene.List(
+        JournalSubjectAreaType,
+        query=graphene.String(required=True),
+        journal_id=graphene.ID(),
+        first=graphene.Int(),
+    )
 
     def resolve_journal(root, info, id):
-        return Journal.objects.select_related("discipline").get(pk=id)
+        return optimize(Journal.objects, info).get(pk=id)
 
     def resolve_journals(root, info):
-        return Journal.objects.select_related("discipline").all()
+        return optimize(Journal.objects, info)
 
     def resolve_journal_information(root, info, journal_id):
-        return JournalInformation.objects.filter(journal__pk=journal_id).select_related(
-            "heading", "journal"
-        )
+        queryset = JournalInformation.objects.filter(journal__pk=journal_id)
+
+        return optimize(queryset, info)
 
     def resolve_subject_areas(root, info, journal_id):
-        return JournalSubjectArea.objects.filter(journal__pk=journal_id).select_related(
-            "journal"
+        queryset = JournalSubjectArea.objects.filter(journal__pk=journal_id)
+
+        return optimize(queryset, info)
+
+    def resolve_journal_suggestions(root, info, query, first=None):
+        return suggest(optimize(Journal.objects, info), query, limit=first)
+
+    def resolve_subject_area_suggestions(
+        root, info, query, journal_id=None, first=None
+    ):
+        queryset = JournalSubjectArea.objects.all()
+
+        if journal_id is not None:
+            queryset = queryset.filter(journal__pk=journal_id)
+
+        return suggest(
+            optimize(queryset, info), query, scope=journal_id or "", limit=first
+        )
+
+    @editor_in_chief_required()
+    @login_required
+    def resolve_journal_analytics(root, info, **kwargs):
+        date_range = kwargs.get("range")
+
+        return journal_analytics(
+            kwargs.get("journal_id"),
+            date_range.start,
+            date_range.end,
+            kwargs.get("granularity"),
         )
@@ -8,6 +8,7 @@ from .mutations import (
     EditJournalInformationMutation,
     EditJournalMutation,
     JournalSubjectAreaMutation,
+    RecordJournalViewMutation,
     TransferJournalManagementMutation,
 )
 from .queries import EditorQuery, JournalQuery
@@ -24,6 +25,7 @@ class Mutation(graphene.ObjectType):
     edit_journal = EditJournalMutation.Field()
     journal_subject_area = JournalSubjectAreaMutation.Field()
     edit_journal_information = EditJournalInformationMutation.Field()
+    record_journal_view = RecordJournalViewMutation.Field()
 
 
 class Query(JournalQuery, EditorQuery, graphene.ObjectType):
@@ -1,16 +1,16 @@
-import random
-import string
-
 from django.dispatch import receiver
-from django.db.models.signals import post_save
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_save
+from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Group
-from django.contrib.auth.hashers import make_password
 
-from Cores.models import InformationHeading
-from Journals.models.journals import JournalInformation
+from Cores.models import Discipline
+from Cores.typeahead import invalidate_suggestions
+from Users.utils import invalidate_claims
 
-from ..models import Journal, JournalPermission, Reviewer, Editor, EditorialMember
-from ..permissions import JournalPermissionChoice
+from ..models import Journal, Reviewer, Editor, EditorialMember
+from ..models.journals import JournalSubjectArea
+from ..permissions import permissions_changed
+from ..provisioning import provision_editorial_boards
 
 
 @receiver(post_save, sender=Editor)
@@ -34,51 +34,72 @@ def add_editor_to_group(sender, instance, created, *args, **kwargs):
 @receiver(post_save, sender=Journal)
 def create_editorial_board_roles(sender, instance, created, *args, **kwargs):
     if created:
-        information_headings = InformationHeading.objects.all()
-
-        JournalInformation.objects.bulk_create(
-            [
-                JournalInformation(journal=instance, heading=heading)
-                for heading in information_headings
-            ]
-        )
-
-        JournalPermission.objects.bulk_create(
-            [
-                JournalPermission(
-                    **{
-                        "journal": instance,
-                        "code_name": code_name,
-                        "label": label,
-                    }
-                )
-                for code_name, label in JournalPermissionChoice.choices
-            ]
-        )
-
-        members = EditorialMember.objects.bulk_create(
-            [
-                EditorialMember(
-                    **{
-                        "role": getattr(EditorialMember.Role, role),
-                        "journal": instance,
-                        ### this is a temporary solution
-                        "access_login": make_password(
-                            "".join(
-                                random.choice(string.ascii_letters) for i in range(6)
-                            )
-                        ),
-                    }
-                )
-                for role in filter(
-                    lambda role: role != EditorialMember.Role.CHIEF.name,
-                    EditorialMember.Role.names,
-                )
-            ]
-        )
-
-        for member in members:
-            permission_qs = instance.permissions.filter(
-                code_name=JournalPermissionChoice.VIEW_SUBMISSIONS.value
-            )
-            member.permissions.add(*permission_qs)
+        provision_editorial_boards([instance])
+
+
+@receiver(m2m_changed, sender=get_user_model().groups.through)
+def invalidate_group_claims(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ("post_add", "post_remove", "pre_clear"):
+        return
+
+    if not reverse:
+        invalidate_claims([instance.pk])
+    elif action == "pre_clear":
+        invalidate_claims(instance.user_set.values("pk"))
+    else:
+        invalidate_claims(pk_set)
+
+
+@receiver(m2m_changed, sender=Editor.journals.through)
+@receiver(m2m_changed, sender=Reviewer.journals.through)
+def invalidate_journal_claims(
+    sender, instance, action, reverse, model, pk_set, **kwargs
+):
+    if action not in ("post_add", "post_remove", "pre_clear"):
+        return
+
+    if not reverse:
+        invalidate_claims([instance.user_id])
+    elif action == "pre_clear":
+        members = model.objects.filter(journals__pk=instance.pk)
+        invalidate_claims(members.values("user_id"))
+    else:
+        invalidate_claims(model.objects.filter(pk__in=pk_set).values("user_id"))
+
+
+@receiver(pre_save, sender=EditorialMember)
+def track_previous_editor(sender, instance, **kwargs):
+    instance._previous_editor_id = (
+        sender.objects.filter(pk=instance.pk)
+        .values_list("editor_id", flat=True)
+        .first()
+        if instance.pk
+        else None
+    )
+
+
+@receiver(post_save, sender=EditorialMember)
+@receiver(post_delete, sender=EditorialMember)
+def invalidate_editorial_claims(sender, instance, **kwargs):
+    editor_ids = {instance.editor_id, getattr(instance, "_previous_editor_id", None)}
+    editor_ids.discard(None)
+
+    if editor_ids:
+        invalidate_claims(Editor.objects.filter(pk__in=editor_ids).values("user_id"))
+
+
+@receiver(m2m_changed, sender=EditorialMember.permissions.through)
+def sync_editorial_permission_masks(
+    sender, instance, action, reverse, pk_set, **kwargs
+):
+    permissions_changed(EditorialMember, instance, action, reverse, pk_set)
+
+
+@receiver(post_save, sender=Journal)
+@receiver(post_delete, sender=Journal)
+@receiver(post_save, sender=JournalSubjectArea)
+@receiver(post_delete, sender=JournalSubjectArea)
+@receiver(post_save, sender=Discipline)
+@receiver(post_delete, sender=Discipline)
+def expire_suggestions(sender, **kwargs):
+    invalidate_suggestions(sender)
@@ -2,11 +2,19 @@ import json
 
 from Cores.models import Discipline
 from django.contrib.auth import get_user_model, models
+from django.test import RequestFactory
 from graphene_django.utils.testing import GraphQLTestCase
 from graphql_jwt.shortcuts import get_token
 from mixer.backend.django import mixer
 
-from ..models import Editor, Journal, RecruitmentApplication, Reviewer
+from ..models import (
+    Editor,
+    EditorialMember,
+    Journal,
+    RecruitmentApplication,
+    Reviewer,
+)
+from ..permissions import get_permissions
 
 # Create your tests here.
 
@@ -278,3 +286,58 @@ class EditorTestcase(GraphQLTestCase):
             .first()
             .last_login.isoformat(),
         )
+
+    def test_permission_claims_skip_membership_queries(self):
+        editor = mixer.blend(Editor, user=self.user)
+        editor.journals.add(self.journal)
+        self.user.refresh_from_db()
+
+        token = get_token(self.user)
+
+        def permissions():
+            request = RequestFactory().post(
+                self.GRAPHQL_URL, HTTP_AUTHORIZATION=f"Bearer {token}"
+            )
+            request.user = get_user_model().objects.get(pk=self.user.pk)
+
+            return get_permissions(request)
+
+        perms = permissions()
+
+        with self.assertNumQueries(0):
+            self.assertTrue(perms.has_group("editors"))
+            self.assertIn(str(self.journal.pk), perms.editor_journals)
+
+        ## a membership change invalidates the claims of issued tokens
+        journal = mixer.blend(Journal, discipline=self.journal.discipline)
+        editor.journals.add(journal)
+
+        perms = permissions()
+
+        with self.assertNumQueries(1):
+            self.assertIn(str(journal.pk), perms.editor_journals)
+
+    def test_demoted_chief_claims_are_rejected(self):
+        editor = mixer.blend(Editor, user=self.user)
+        editor.journals.add(self.journal)
+        self.journal.make_editor_chief(editor)
+        self.user.refresh_from_db()
+
+        token = get_token(self.user)
+
+        def permissions():
+            request = RequestFactory().post(
+                self.GRAPHQL_URL, HTTP_AUTHORIZATION=f"Bearer {token}"
+            )
+            request.user = get_user_model().objects.get(pk=self.user.pk)
+
+            return get_permissions(request)
+
+        with self.assertNumQueries(1):
+            self.assertIn(str(self.journal.pk), permissions().chief_journals)
+
+        self.journal.assign_editor_role(editor, EditorialMember.Role.LINE)
+
+        ## the token's claims are stale, the roles are queried again
+        with self.assertNumQueries(2):
+            self.assertNotIn(str(self.journal.pk), permissions().chief_journals)
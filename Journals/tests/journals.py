@@ -1,9 +1,20 @@
+import csv
 import json
+import os
+import tempfile
 import time
+import uuid
+from datetime import date, datetime, timedelta
+from unittest import mock
+from io import StringIO
 
 from Cores.models import Discipline, InformationHeading
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Group
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 from django.core.files.uploadedfile import SimpleUploadedFile
 from graphene_django.utils.testing import GraphQLTestCase
@@ -14,6 +25,17 @@ from mixer.backend.django import mixer
 from ..models.editors import Editor
 from ..models.journals import Journal, JournalInformation, JournalSubjectArea
 from ..models.roles import EditorialMember
+from ..permissions import JournalPermissionChoice
+from ..provisioning import provision_journals
+from .. import tracking
+from ..analytics import VIEW_ROLLUP, rollup_journal_views
+from ..partitions import (
+    create_partitions,
+    drop_partitions,
+    partitions,
+    purge_default_partition,
+)
+from ..models.journals import JournalViewLog, RollupWatermark
 
 
 class JournalTestcase(GraphQLFileUploadTestMixin, GraphQLTestCase):
@@ -640,3 +662,507 @@ class JournalTestcase(GraphQLFileUploadTestMixin, GraphQLTestCase):
         self.assertEqual(content["subjectAreas"][3]["name"], subject_areas[3].name)
         self.assertEqual(content["subjectAreas"][4]["name"], subject_areas[4].name)
         self.assertEqual(content["subjectAreas"][5]["name"], subject_areas[5].name)
+
+    def test_provision_journals(self):
+        """
+        Journals listed in a provisioning file are created with their editorial
+        boards in a fixed number of queries
+        """
+
+        def provision(n_journals):
+            rows = [
+                {
+                    "name": "catalogue journal {0} {1}".format(n_journals, i),
+                    "issn": "1234-{0:04d}".format(i),
+                    "discipline": self.dicipline.name,
+                    "access_options": "partial_access",
+                    "publication_frequency": "4",
+                }
+                for i in range(n_journals)
+            ]
+
+            with CaptureQueriesContext(connection) as queries:
+                journals = provision_journals(rows)
+
+            self.assertEqual(len(journals), n_journals)
+
+            return len(queries)
+
+        self.assertEqual(provision(2), provision(20))
+
+        journal = Journal.objects.get(name="catalogue journal 20 7")
+
+        self.assertEqual(journal.slug, "catalogue-journal-20-7")
+        self.assertEqual(journal.access_options, Journal.ModelType.PARTIAL_ACCESS)
+        self.assertEqual(
+            journal.publication_frequency, Journal.PublicationFrequency.QUARTERLY
+        )
+        self.assertEqual(journal.informations.count(), self.n_info_heading)
+        self.assertEqual(
+            journal.permissions.count(), len(JournalPermissionChoice.choices)
+        )
+        self.assertEqual(
+            journal.editorial_members.count(), len(EditorialMember.Role.values) - 1
+        )
+
+        for member in journal.editorial_members.all():
+            self.assertEqual(
+                list(member.permissions.values_list("code_name", flat=True)),
+                [JournalPermissionChoice.VIEW_SUBMISSIONS.value],
+            )
+
+        ## existing journals are skipped when the file is provisioned again
+        with tempfile.NamedTemporaryFile("w", suffix=".csv") as f:
+            writer = csv.DictWriter(f, fieldnames=["name", "issn", "discipline"])
+            writer.writeheader()
+            writer.writerow(
+                {
+                    "name": journal.name,
+                    "issn": journal.issn,
+                    "discipline": self.dicipline.name,
+                }
+            )
+            writer.writerow(
+                {
+                    "name": "catalogue journal csv",
+                    "issn": "4321-0000",
+                    "discipline": self.dicipline.name,
+                }
+            )
+            f.flush()
+
+            out = StringIO()
+            call_command("provision_journals", f.name, stdout=out)
+
+        self.assertIn("created 1 journals, skipped 1", out.getvalue())
+        self.assertTrue(
+            Journal.objects.get(name="catalogue journal csv").editorial_members.exists()
+        )
+
+    def test_journal_suggestions(self):
+        """
+        Journals matching what was typed are suggested, a prefix typed again
+        is answered from the cache until a journal is saved
+        """
+        cache.clear()
+        mixer.blend(Journal, name="Journal of Neuroscience")
+        mixer.blend(Journal, name="Neural Computation")
+        mixer.blend(Journal, name="Plant Biology")
+
+        def suggest(text):
+            with CaptureQueriesContext(connection) as queries:
+                response = self.query(
+                    """
+                    query JournalSuggestions($query: String!) {
+                        journalSuggestions(query: $query, first: 5) {
+                            name
+                        }
+                    }
+                    """,
+                    operation_name="JournalSuggestions",
+                    variables={"query": text},
+                )
+
+            self.assertResponseNoErrors(response)
+            content = json.loads(response.content)["data"]["journalSuggestions"]
+
+            return {journal["name"] for journal in content}, len(queries)
+
+        names, n_queries = suggest("neur")
+
+        self.assertEqual(names, {"Journal of Neuroscience", "Neural Computation"})
+
+        names, n_queries = suggest("  NEUR ")
+
+        self.assertEqual(names, {"Journal of Neuroscience", "Neural Computation"})
+        self.assertEqual(n_queries, 1)
+
+        mixer.blend(Journal, name="Neurology Letters")
+
+        names, n_queries = suggest("neur")
+
+        self.assertIn("Neurology Letters", names)
+        self.assertEqual(n_queries, 2)
+
+    def test_buffered_view_logs(self):
+        """
+        Journal views are written in batches, the spool files of stopped
+        workers are replayed and the ones in use are left alone
+        """
+        spool_dir = tempfile.mkdtemp()
+        buffer = tracking.ViewLogBuffer(
+            spool_dir=spool_dir, batch_size=3, flush_interval=3600
+        )
+
+        def record_view(ip_address):
+            with mock.patch.object(tracking, "_buffer", buffer):
+                response = self.query(
+                    """
+                    mutation RecordJournalView($journalId: ID!) {
+                        recordJournalView(journalId: $journalId) {
+                            message
+                        }
+                    }
+                    """,
+                    operation_name="RecordJournalView",
+                    variables={"journalId": self.journal.pk},
+                    headers={"HTTP_X_FORWARDED_FOR": ip_address},
+                )
+
+            self.assertResponseNoErrors(response)
+
+        record_view("10.0.0.1")
+        record_view("10.0.0.2, 10.0.0.254")
+
+        self.assertFalse(JournalViewLog.objects.exists())
+
+        record_view("10.0.0.3")
+
+        self.assertEqual(
+            set(JournalViewLog.objects.values_list("ip_address", flat=True)),
+            {"10.0.0.1", "10.0.0.2", "10.0.0.3"},
+        )
+
+        ## spooled by a worker which stopped before writing, or in the middle
+        ## of a flush
+        saved = JournalViewLog.objects.first()
+        with open(os.path.join(spool_dir, "1-1.flushing"), "w") as f:
+            for entry in [
+                {
+                    "id": str(saved.pk),
+                    "journal_id": self.journal.pk,
+                    "created_at": saved.created_at.isoformat(),
+                },
+                {
+                    "id": "6f2c6f0e-0000-4000-8000-000000000001",
+                    "journal_id": self.journal.pk,
+                    "created_at": timezone.now().isoformat(),
+                },
+                {
+                    "id": "6f2c6f0e-0000-4000-8000-000000000002",
+                    "journal_id": 0,
+                    "created_at": timezone.now().isoformat(),
+                },
+            ]:
+                entry.update(user_id=None, ip_address="10.0.0.4")
+                f.write(json.dumps(entry) + "\n")
+
+            f.write('{"id": "6f2c')
+
+        record_view("10.0.0.5")
+
+        ## another worker leaves the spool in use alone
+        other = tracking.ViewLogBuffer(spool_dir=spool_dir)
+
+        self.assertEqual(other.replay(), 3)
+        self.assertEqual(JournalViewLog.objects.count(), 4)
+
+        buffer.close()
+
+        self.assertEqual(JournalViewLog.objects.count(), 5)
+        self.assertEqual(os.listdir(spool_dir), [])
+
+    def test_failed_view_log_flushes_are_replayed(self):
+        """
+        The views of a flush the database refused stay spooled in a file of
+        their own, and are written by the next flush
+        """
+        spool_dir = tempfile.mkdtemp()
+        buffer = tracking.ViewLogBuffer(
+            spool_dir=spool_dir, batch_size=1, flush_interval=3600
+        )
+
+        with mock.patch.object(
+            tracking, "save_entries", side_effect=tracking.DatabaseError
+        ):
+            buffer.record(self.journal.pk, "10.0.0.1")
+            buffer.record(self.journal.pk, "10.0.0.2")
+
+        self.assertFalse(JournalViewLog.objects.exists())
+        self.assertEqual(
+            len(
+                [
+                    name
+                    for name in os.listdir(spool_dir)
+                    if name.endswith(tracking.FLUSHING_SUFFIX)
+                ]
+            ),
+            2,
+        )
+
+        self.assertEqual(buffer.flush(), 2)
+        self.assertEqual(
+            set(JournalViewLog.objects.values_list("ip_address", flat=True)),
+            {"10.0.0.1", "10.0.0.2"},
+        )
+
+        buffer.close()
+
+        self.assertEqual(os.listdir(spool_dir), [])
+
+    def test_invalid_view_logs_are_dropped(self):
+        """
+        Views with an address or journal id the database would reject are
+        refused before spooling, and dropped alone when found in a spool
+        """
+        spool_dir = tempfile.mkdtemp()
+        buffer = tracking.ViewLogBuffer(
+            spool_dir=spool_dir, batch_size=100, flush_interval=3600
+        )
+
+        def record_view(journal_id, ip_address):
+            with mock.patch.object(tracking, "_buffer", buffer):
+                return self.query(
+                    """
+                    mutation RecordJournalView($journalId: ID!) {
+                        recordJournalView(journalId: $journalId) {
+                            message
+                        }
+                    }
+                    """,
+                    operation_name="RecordJournalView",
+                    variables={"journalId": journal_id},
+                    headers={"HTTP_X_FORWARDED_FOR": ip_address},
+                )
+
+        ## the address of the connection stands in for a forged one
+        self.assertResponseNoErrors(record_view(self.journal.pk, "foo"))
+        self.assertResponseHasErrors(record_view("foo", "10.0.0.1"))
+
+        with open(os.path.join(spool_dir, "1-1.flushing"), "w") as f:
+            for journal_id, ip_address in [
+                (self.journal.pk, "10.0.0.2"),
+                (self.journal.pk, "foo"),
+                ("foo", "10.0.0.3"),
+            ]:
+                entry = {
+                    "id": str(uuid.uuid4()),
+                    "journal_id": journal_id,
+                    "user_id": None,
+                    "ip_address": ip_address,
+                    "created_at": timezone.now().isoformat(),
+                }
+                f.write(json.dumps(entry) + "\n")
+
+        self.assertEqual(buffer.flush(), 2)
+        self.assertEqual(
+            set(JournalViewLog.objects.values_list("ip_address", flat=True)),
+            {"127.0.0.1", "10.0.0.2"},
+        )
+        self.assertEqual(os.listdir(spool_dir), [])
+
+    def test_journal_analytics(self):
+        """
+        Views are rolled up by day from a watermark and the analytics are
+        read from the rollups
+        """
+        users = mixer.cycle(2).blend(get_user_model())
+
+        def log_views(*views):
+            logs = JournalViewLog.objects.bulk_create(
+                [
+                    JournalViewLog(
+                        journal=self.journal, ip_address=ip_address, user=user
+                    )
+                    for created_at, ip_address, user in views
+                ]
+            )
+
+            for log, (created_at, ip_address, user) in zip(logs, views):
+                JournalViewLog.objects.filter(pk=log.pk).update(
+                    created_at=datetime.fromisoformat(created_at + "+00:00"),
+                    inserted_at=datetime.fromisoformat(created_at + "+00:00"),
+                )
+
+        ## a Monday, the Tuesday after and the Monday of the next week
+        log_views(
+            ("2026-10-05T09:00", "10.0.0.1", None),
+            ("2026-10-05T10:00", "10.0.0.1", None),
+            ("2026-10-05T11:00", "10.0.0.2", users[0]),
+        )
+
+        until = datetime.fromisoformat("2026-10-05T12:00+00:00")
+        self.assertEqual(rollup_journal_views(until), 3)
+        self.assertEqual(rollup_journal_views(until), 0)
+
+        log_views(
+            ("2026-10-05T15:00", "10.0.0.3", users[1]),
+            ("2026-10-06T08:00", "10.0.0.1", None),
+            ("2026-10-12T08:00", "10.0.0.4", None),
+            ("2026-10-13T08:00", "10.0.0.5", None),
+        )
+
+        until = datetime.fromisoformat("2026-10-13T00:00+00:00")
+        self.assertEqual(rollup_journal_views(until), 3)
+
+        query = """
+            query JournalAnalytics(
+                $journalId: ID!, $range: DateRangeInput!, $granularity: Granularity
+            ) {
+                journalAnalytics(
+                    journalId: $journalId, range: $range, granularity: $granularity
+                ) {
+                    bucket
+                    views
+                    userViews
+                    anonymousViews
+                    visitors
+                }
+            }
+            """
+
+        def analytics(granularity):
+            with CaptureQueriesContext(connection) as queries:
+                response = self.query(
+                    query,
+                    operation_name="JournalAnalytics",
+                    variables={
+                        "journalId": self.journal.pk,
+                        "range": {"start": "2026-10-01", "end": "2026-10-31"},
+                        "granularity": granularity,
+                    },
+                    headers=self.editor_headers,
+                )
+
+            self.assertResponseNoErrors(response)
+            self.assertFalse(
+                any("journal_view_logs" in query["sql"] for query in queries)
+            )
+
+            return json.loads(response.content)["data"]["journalAnalytics"]
+
+        self.assertEqual(
+            analytics("DAY"),
+            [
+                {
+                    "bucket": "2026-10-05",
+                    "views": 4,
+                    "userViews": 2,
+                    "anonymousViews": 2,
+                    "visitors": 3,
+                },
+                {
+                    "bucket": "2026-10-06",
+                    "views": 1,
+                    "userViews": 0,
+                    "anonymousViews": 1,
+                    "visitors": 1,
+                },
+                {
+                    "bucket": "2026-10-12",
+                    "views": 1,
+                    "userViews": 0,
+                    "anonymousViews": 1,
+                    "visitors": 1,
+                },
+            ],
+        )
+        self.assertEqual(
+            [
+                (row["bucket"], row["views"], row["visitors"])
+                for row in analytics("WEEK")
+            ],
+            [("2026-10-05", 5, 3), ("2026-10-12", 1, 1)],
+        )
+
+        ## a view of the Tuesday replayed from a spool after the rollup
+        JournalViewLog.objects.create(
+            journal=self.journal,
+            ip_address="10.0.0.6",
+            created_at=datetime.fromisoformat("2026-10-06T09:00+00:00"),
+            inserted_at=datetime.fromisoformat("2026-10-13T06:00+00:00"),
+        )
+
+        until = datetime.fromisoformat("2026-10-13T07:00+00:00")
+        self.assertEqual(rollup_journal_views(until), 1)
+        self.assertEqual(
+            [row["views"] for row in analytics("DAY")],
+            [4, 2, 1],
+        )
+
+    def test_rollup_waits_for_running_inserts(self):
+        """
+        The watermark stops at the start of a transaction still writing, the
+        views it stamped with that time are rolled up once it commits
+        """
+        other = connection.copy()
+        self.addCleanup(other.close)
+        other.set_autocommit(False)
+
+        with other.cursor() as cursor:
+            cursor.execute("SELECT txid_current(), transaction_timestamp()")
+            _, started = cursor.fetchone()
+
+        rollup_journal_views(until=started + timedelta(hours=1))
+
+        self.assertEqual(
+            RollupWatermark.objects.get(name=VIEW_ROLLUP).position, started
+        )
+
+        other.rollback()
+
+    def test_view_log_partitions(self):
+        """
+        View logs land in their month's partition, created ahead or split
+        off the default partition, and old months are dropped whole
+        """
+
+        def log_view(created_at):
+            return JournalViewLog.objects.create(
+                journal=self.journal,
+                ip_address="10.0.0.1",
+                created_at=datetime.fromisoformat(created_at + "T12:00+00:00"),
+            )
+
+        def partition_of(log):
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT tableoid::regclass::text FROM journal_view_logs WHERE id = %s",
+                    [log.pk],
+                )
+                return cursor.fetchone()[0]
+
+        table = JournalViewLog._meta.db_table
+
+        ## before its partition exists
+        old = log_view("2020-01-15")
+        self.assertEqual(partition_of(old), "journal_view_logs_default")
+
+        self.assertEqual(
+            create_partitions(table, date(2019, 12, 1), date(2020, 2, 1)),
+            [
+                "journal_view_logs_p201912",
+                "journal_view_logs_p202001",
+                "journal_view_logs_p202002",
+            ],
+        )
+        self.assertEqual(
+            create_partitions(table, date(2020, 1, 1), date(2020, 1, 1)), []
+        )
+        self.assertEqual(partition_of(old), "journal_view_logs_p202001")
+
+        recent = log_view("2020-02-03")
+        self.assertEqual(partition_of(recent), "journal_view_logs_p202002")
+
+        ## the ORM is unaware of the partitions
+        JournalViewLog.objects.filter(pk=recent.pk).update(ip_address="10.0.0.2")
+        self.assertEqual(
+            JournalViewLog.objects.get(pk=recent.pk).ip_address, "10.0.0.2"
+        )
+
+        self.assertEqual(
+            drop_partitions(table, date(2020, 2, 1)),
+            ["journal_view_logs_p201912", "journal_view_logs_p202001"],
+        )
+        self.assertNotIn("journal_view_logs_p202001", partitions(table))
+        self.assertFalse(JournalViewLog.objects.filter(pk=old.pk).exists())
+        self.assertTrue(JournalViewLog.objects.filter(pk=recent.pk).exists())
+
+        ## expired months without a partition are purged from the default one
+        orphan = log_view("2019-06-15")
+        future = log_view("2099-01-15")
+        self.assertEqual(partition_of(orphan), "journal_view_logs_default")
+
+        self.assertEqual(purge_default_partition(table, date(2020, 2, 1)), 1)
+        self.assertFalse(JournalViewLog.objects.filter(pk=orphan.pk).exists())
+        self.assertTrue(JournalViewLog.objects.filter(pk=future.pk).exists())
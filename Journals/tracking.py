@@ -0,0 +1,370 @@
+import atexit
+import fcntl
+import ipaddress
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from collections import deque
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import (
+    DataError,
+    DatabaseError,
+    IntegrityError,
+    connection,
+    transaction,
+)
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from .models import Journal, JournalViewLog
+
+logger = logging.getLogger(__name__)
+
+## spool files being appended to, and spool files being flushed
+SPOOL_SUFFIX = ".jsonl"
+FLUSHING_SUFFIX = ".flushing"
+
+
+def is_ip_address(value):
+    try:
+        ipaddress.ip_address(value)
+    except ValueError:
+        return False
+
+    return True
+
+
+def client_ip(request):
+    """
+    Address of the client, the first one forwarded by a proxy if it is an
+    address, else the address of the connection
+    """
+    forwarded = request.META.get("HTTP_X_FORWARDED_FOR")
+
+    if forwarded and is_ip_address(forwarded.split(",")[0].strip()):
+        return forwarded.split(",")[0].strip()
+
+    remote = request.META.get("REMOTE_ADDR")
+
+    return remote if remote and is_ip_address(remote) else "0.0.0.0"
+
+
+def is_valid_entry(entry):
+    """
+    Whether a view log can be inserted, its journal id is an integer and its
+    address an IP address
+    """
+    try:
+        int(entry.journal_id)
+    except (TypeError, ValueError):
+        return False
+
+    return is_ip_address(str(entry.ip_address))
+
+
+def load_entries(path):
+    """
+    View logs of a spool file, a line cut short by a crash is skipped
+    """
+    entries = []
+
+    with open(path) as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+
+            entries.append(
+                JournalViewLog(
+                    id=entry["id"],
+                    journal_id=entry["journal_id"],
+                    user_id=entry["user_id"],
+                    ip_address=entry["ip_address"],
+                    created_at=parse_datetime(entry["created_at"]),
+                )
+            )
+
+    return [entry for entry in entries if is_valid_entry(entry)]
+
+
+def save_entries(entries, batch_size):
+    """
+    Insert view logs, the ones inserted already by an earlier flush are
+    skipped so that spool files can be replayed safely, and so are the views
+    of journals deleted since. A view the database rejects is dropped alone
+    rather than failing its batch.
+    """
+    entries = [entry for entry in entries if is_valid_entry(entry)]
+    journals = {
+        str(pk)
+        for pk in Journal.objects.filter(
+            pk__in={entry.journal_id for entry in entries}
+        ).values_list("pk", flat=True)
+    }
+    users = {
+        str(pk)
+        for pk in get_user_model()
+        .objects.filter(
+            pk__in={entry.user_id for entry in entries if entry.user_id is not None}
+        )
+        .values_list("pk", flat=True)
+    }
+
+    for entry in entries:
+        if entry.user_id is not None and str(entry.user_id) not in users:
+            entry.user_id = None
+
+    entries = [entry for entry in entries if str(entry.journal_id) in journals]
+
+    with transaction.atomic():
+        ## stamped with the start of the inserting transaction, the rollups
+        ## wait for the transactions still running, see Journals.analytics
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT transaction_timestamp()")
+            (inserted_at,) = cursor.fetchone()
+
+        for entry in entries:
+            entry.inserted_at = inserted_at
+
+        try:
+            with transaction.atomic():
+                JournalViewLog.objects.bulk_create(
+                    entries, batch_size=batch_size, ignore_conflicts=True
+                )
+        except (DataError, IntegrityError):
+            for entry in entries:
+                try:
+                    with transaction.atomic():
+                        JournalViewLog.objects.bulk_create(
+                            [entry], ignore_conflicts=True
+                        )
+                except (DataError, IntegrityError):
+                    logger.warning("dropped the invalid journal view %s", entry.id)
+
+
+class ViewLogBuffer:
+    """
+    Write-behind buffer of journal views.
+
+    A view is appended to a spool file owned by the process and kept in
+    memory, the buffer is written with one bulk insert once it holds
+    VIEW_LOG_BATCH_SIZE views or its oldest view is VIEW_LOG_FLUSH_INTERVAL
+    seconds old. Spool files are locked while in use, the unlocked ones
+    left behind by stopped workers are replayed by the next flush.
+    """
+
+    def __init__(self, spool_dir=None, batch_size=None, flush_interval=None):
+        self.spool_dir = spool_dir or settings.VIEW_LOG_SPOOL_DIR
+        self.batch_size = batch_size or settings.VIEW_LOG_BATCH_SIZE
+        self.flush_interval = flush_interval or settings.VIEW_LOG_FLUSH_INTERVAL
+
+        self.entries = deque()
+        self.lock = threading.Lock()
+        self.spool = None
+        self.pid = None
+        self.oldest = None
+        self.timer = None
+
+    def spool_path(self, suffix=SPOOL_SUFFIX):
+        return os.path.join(
+            self.spool_dir, "{0}-{1}{2}".format(self.pid, id(self), suffix)
+        )
+
+    def open_spool(self):
+        ## a forked worker starts afresh, its parent keeps its views and spool
+        if self.pid != os.getpid():
+            self.pid = os.getpid()
+            self.entries.clear()
+            self.oldest = None
+            self.spool = None
+
+        if self.spool is None:
+            os.makedirs(self.spool_dir, exist_ok=True)
+            self.spool = open(self.spool_path(), "a")
+            fcntl.flock(self.spool, fcntl.LOCK_EX)
+
+    def record(self, journal_id, ip_address, user_id=None):
+        """
+        Log a view of the journal, raises ValueError when the journal id is
+        not an integer or the address not an IP address
+        """
+        entry = JournalViewLog(
+            id=uuid.uuid4(),
+            journal_id=journal_id,
+            user_id=user_id,
+            ip_address=ip_address,
+            created_at=timezone.now(),
+        )
+
+        if not is_valid_entry(entry):
+            raise ValueError("invalid journal view")
+
+        with self.lock:
+            self.open_spool()
+            self.spool.write(
+                json.dumps(
+                    {
+                        "id": str(entry.id),
+                        "journal_id": str(entry.journal_id),
+                        "user_id": entry.user_id and str(entry.user_id),
+                        "ip_address": entry.ip_address,
+                        "created_at": entry.created_at.isoformat(),
+                    }
+                )
+                + "\n"
+            )
+            self.spool.flush()
+            self.entries.append(entry)
+
+            if self.oldest is None:
+                self.oldest = time.monotonic()
+                self.timer = threading.Timer(self.flush_interval, self.timed_flush)
+                self.timer.daemon = True
+                self.timer.start()
+
+            due = (
+                len(self.entries) >= self.batch_size
+                or time.monotonic() - self.oldest >= self.flush_interval
+            )
+
+        if due:
+            self.flush()
+
+    def flush(self):
+        """
+        Replay the spool files of failed flushes and stopped workers, then
+        insert the buffered views. Returns the number of views written.
+        """
+        written = self.replay()
+
+        with self.lock:
+            entries, flushing = [], None
+
+            if self.pid == os.getpid() and self.entries:
+                entries = list(self.entries)
+                self.entries.clear()
+                self.oldest = None
+                self.timer.cancel()
+
+                ## views recorded while inserting go to a new spool file, the
+                ## moved one stays locked until its views are saved. Each flush
+                ## gets a file of its own, linking fails rather than replacing
+                ## the file of a failed flush.
+                flushing = self.spool
+                flushing_path = self.spool_path(
+                    "-{0}{1}".format(uuid.uuid4().hex, FLUSHING_SUFFIX)
+                )
+                os.link(self.spool_path(), flushing_path)
+                os.unlink(self.spool_path())
+                self.spool = None
+
+        if flushing is not None:
+            with flushing:
+                try:
+                    save_entries(entries, self.batch_size)
+                except DatabaseError:
+                    ## left for a replay
+                    logger.exception("could not save %d journal views", len(entries))
+                else:
+                    os.unlink(flushing_path)
+                    written += len(entries)
+
+        return written
+
+    def timed_flush(self):
+        try:
+            self.flush()
+        finally:
+            ## the timer thread's own connection
+            connection.close()
+
+    def replay(self):
+        """
+        Insert the views of the spool files no running worker holds.
+        Returns the number of views written.
+        """
+        if not os.path.isdir(self.spool_dir):
+            return 0
+
+        written = 0
+
+        for name in sorted(os.listdir(self.spool_dir)):
+            if not name.endswith((SPOOL_SUFFIX, FLUSHING_SUFFIX)):
+                continue
+
+            path = os.path.join(self.spool_dir, name)
+
+            try:
+                f = open(path)
+            except FileNotFoundError:
+                continue
+
+            with f:
+                try:
+                    fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    continue
+
+                ## saved and removed by its worker while we opened it
+                if not os.path.exists(path):
+                    continue
+
+                entries = load_entries(path)
+
+                try:
+                    save_entries(entries, self.batch_size)
+                except DatabaseError:
+                    logger.exception("could not replay %s", path)
+                    continue
+
+                os.unlink(path)
+                written += len(entries)
+
+        return written
+
+    def close(self):
+        """
+        Flush the buffer and release the spool
+        """
+        if self.pid != os.getpid():
+            return
+
+        self.flush()
+
+        with self.lock:
+            if self.spool is not None and not self.entries:
+                os.unlink(self.spool_path())
+                self.spool.close()
+                self.spool = None
+
+
+_buffer = None
+_buffer_lock = threading.Lock()
+
+
+def get_buffer():
+    global _buffer
+
+    with _buffer_lock:
+        if _buffer is None:
+            _buffer = ViewLogBuffer()
+            atexit.register(_buffer.close)
+
+    return _buffer
+
+
+def record_view(request, journal_id):
+    """
+    Log a view of the journal by the request's client without waiting on
+    the database
+    """
+    user = getattr(request, "user", None)
+    user_id = user.pk if user is not None and user.is_authenticated else None
+
+    get_buffer().record(journal_id, client_ip(request), user_id)
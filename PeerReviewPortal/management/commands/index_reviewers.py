@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from Journals.models import Reviewer
+from PeerReviewPortal.recommendations import refresh_reviewer_terms
+
+
+class Command(BaseCommand):
+    help = "Rebuild the term weights used to recommend reviewers"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        ids = list(Reviewer.objects.order_by("pk").values_list("pk", flat=True))
+        batch_size = options["batch_size"]
+
+        for start in range(0, len(ids), batch_size):
+            refresh_reviewer_terms(ids[start : start + batch_size])
+
+        self.stdout.write("indexed {0} reviewers".format(len(ids)))
@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+
+from Journals.models import Journal
+from PeerReviewPortal.stats import reconcile_pipeline_counters
+
+
+class Command(BaseCommand):
+    help = "Recompute the journals' pipeline counters and correct the drifted ones"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=100)
+
+    def handle(self, *args, **options):
+        ids = list(Journal.objects.order_by("pk").values_list("pk", flat=True))
+        batch_size = options["batch_size"]
+        corrected = 0
+
+        for start in range(0, len(ids), batch_size):
+            corrected += reconcile_pipeline_counters(ids[start : start + batch_size])
+
+        self.stdout.write(
+            "corrected {0} counters of {1} journals".format(corrected, len(ids))
+        )
@@ -0,0 +1,17 @@
+# Generated by Django 4.0.3 on 2026-10-18 11:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('PeerReviewPortal', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='journalsubmission',
+            index=models.Index(fields=['journal', '-created_at', '-id'], name='journal_submission_page_idx'),
+        ),
+    ]
@@ -0,0 +1,53 @@
+# Generated by Django 4.0.3 on 2026-10-18 11:51
+
+from django.db import migrations, models
+
+## JournalPermissionChoice values at the time of the migration, in bit order
+PERMISSIONS = [
+    "give_reports",
+    "view_submissions",
+    "assign_editors",
+    "assign_reviewers",
+    "delete_submissions",
+    "edit_submissions",
+    "can_recruit",
+]
+
+
+def backfill_permission_masks(apps, schema_editor):
+    Team = apps.get_model("PeerReviewPortal", "JournalSubmissionEditorialTeam")
+    Through = Team.permissions.through
+    masks = {}
+
+    for pk, code_name in Through.objects.values_list(
+        "journalsubmissioneditorialteam_id", "journalpermission__code_name"
+    ).iterator():
+        if code_name in PERMISSIONS:
+            masks[pk] = masks.get(pk, 0) | 1 << PERMISSIONS.index(code_name)
+
+    Team.objects.bulk_update(
+        [Team(pk=pk, permission_mask=mask) for pk, mask in masks.items()],
+        ["permission_mask"],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Journals', '0007_editorialmember_permission_mask'),
+        ('PeerReviewPortal', '0003_journalsubmission_journal_submission_page_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='journalsubmissioneditorialteam',
+            name='permission_mask',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='permission_mask'),
+        ),
+        migrations.AddIndex(
+            model_name='journalsubmissioneditorialteam',
+            index=models.Index(fields=['journal_submission', 'editor'], name='submission_editor_idx'),
+        ),
+        migrations.RunPython(backfill_permission_masks, migrations.RunPython.noop),
+    ]
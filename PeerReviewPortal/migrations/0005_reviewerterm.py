@@ -0,0 +1,37 @@
+# Generated by Django 4.0.3 on 2026-10-18 11:59
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Journals', '0008_journal_name_trgm_idx'),
+        ('PeerReviewPortal', '0004_journalsubmissioneditorialteam_permission_mask_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReviewerTerm',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('term', models.CharField(max_length=255, verbose_name='term')),
+                ('weight', models.FloatField(verbose_name='weight')),
+                ('reviewer', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='terms', to='Journals.reviewer')),
+            ],
+            options={
+                'verbose_name': 'reviewer_term',
+                'verbose_name_plural': 'reviewer_terms',
+                'db_table': 'reviewer_terms',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='reviewerterm',
+            index=models.Index(fields=['term'], include=('reviewer', 'weight'), name='reviewer_term_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='reviewerterm',
+            constraint=models.UniqueConstraint(fields=('reviewer', 'term'), name='unique_reviewer_term'),
+        ),
+    ]
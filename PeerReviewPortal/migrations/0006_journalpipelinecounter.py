@@ -0,0 +1,34 @@
+# Generated by Django 4.0.3 on 2026-10-18 12:08
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Journals', '0010_partition_journal_view_logs'),
+        ('PeerReviewPortal', '0005_reviewerterm'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JournalPipelineCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.PositiveSmallIntegerField(choices=[(1, 'stage'), (2, 'status'), (3, 'editor')], verbose_name='kind')),
+                ('key', models.CharField(max_length=255, verbose_name='key')),
+                ('count', models.IntegerField(default=0, verbose_name='count')),
+                ('journal', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='pipeline_counters', to='Journals.journal')),
+            ],
+            options={
+                'verbose_name': 'journal pipeline counter',
+                'verbose_name_plural': 'journal pipeline counters',
+                'db_table': 'journal_pipeline_counters',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='journalpipelinecounter',
+            constraint=models.UniqueConstraint(fields=('journal', 'kind', 'key'), name='unique_pipeline_counter'),
+        ),
+    ]
@@ -0,0 +1,101 @@
+# Generated by Django 4.0.3 on 2026-10-18 12:12
+
+import datetime
+
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+SUBMITTED = 1
+ACCEPTED = 3
+
+
+def backfill_stage_events(apps, schema_editor):
+    """
+    Record the known history of the existing submissions, their submission
+    in their current stage and their acceptance
+    """
+    JournalSubmission = apps.get_model("PeerReviewPortal", "JournalSubmission")
+    SubmissionStageEvent = apps.get_model("PeerReviewPortal", "SubmissionStageEvent")
+
+    events, decided = [], []
+
+    for submission in JournalSubmission.objects.order_by("pk").iterator():
+        events.append(
+            SubmissionStageEvent(
+                journal_submission_id=submission.pk,
+                journal_id=submission.journal_id,
+                kind=SUBMITTED,
+                stage=submission.stage,
+                elapsed=datetime.timedelta(0),
+                created_at=submission.created_at,
+            )
+        )
+
+        if submission.is_accepted:
+            submission.time_to_first_decision = (
+                submission.is_accepted - submission.created_at
+            )
+            decided.append(submission)
+            events.append(
+                SubmissionStageEvent(
+                    journal_submission_id=submission.pk,
+                    journal_id=submission.journal_id,
+                    kind=ACCEPTED,
+                    from_stage=submission.stage,
+                    stage=submission.stage,
+                    time_in_stage=submission.time_to_first_decision,
+                    elapsed=submission.time_to_first_decision,
+                    created_at=submission.is_accepted,
+                )
+            )
+
+    SubmissionStageEvent.objects.bulk_create(events, batch_size=1000)
+    JournalSubmission.objects.bulk_update(
+        decided, ["time_to_first_decision"], batch_size=1000
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Journals', '0010_partition_journal_view_logs'),
+        ('PeerReviewPortal', '0006_journalpipelinecounter'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='journalsubmission',
+            name='time_to_first_decision',
+            field=models.DurationField(blank=True, default=None, null=True, verbose_name='time_to_first_decision'),
+        ),
+        migrations.CreateModel(
+            name='SubmissionStageEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.PositiveSmallIntegerField(choices=[(1, 'submitted'), (2, 'transferred'), (3, 'accepted'), (4, 'rejected')], verbose_name='kind')),
+                ('from_stage', models.CharField(blank=True, max_length=255, verbose_name='from_stage')),
+                ('stage', models.CharField(max_length=255, verbose_name='stage')),
+                ('time_in_stage', models.DurationField(blank=True, null=True, verbose_name='time_in_stage')),
+                ('elapsed', models.DurationField(verbose_name='elapsed')),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now, verbose_name='created_at')),
+                ('journal', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='stage_events', to='Journals.journal')),
+                ('journal_submission', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='stage_events', to='PeerReviewPortal.journalsubmission')),
+            ],
+            options={
+                'verbose_name': 'submission stage event',
+                'verbose_name_plural': 'submission stage events',
+                'db_table': 'submission_stage_events',
+                'ordering': ('created_at',),
+            },
+        ),
+        migrations.AddIndex(
+            model_name='submissionstageevent',
+            index=models.Index(fields=['journal_submission', '-created_at'], name='stage_event_submission_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='submissionstageevent',
+            index=models.Index(fields=['journal', 'created_at'], include=('from_stage', 'time_in_stage'), name='stage_event_journal_idx'),
+        ),
+        migrations.RunPython(backfill_stage_events, migrations.RunPython.noop),
+    ]
@@ -1,6 +1,7 @@
 import uuid
 
 from django.db import models
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 from Journals.models import Journal, JournalPermission, Role, Editor, Reviewer
@@ -22,6 +23,9 @@ class JournalSubmission(models.Model):
     journal = models.ForeignKey(
         Journal, related_name="submissions", on_delete=models.PROTECT
     )
+    time_to_first_decision = models.DurationField(
+        _("time_to_first_decision"), null=True, blank=True, default=None
+    )
     created_at = models.DateTimeField(_("created_at"), auto_now_add=True)
     updated_at = models.DateTimeField(_("updated_at"), auto_now=True)
 
@@ -30,6 +34,12 @@ class JournalSubmission(models.Model):
         verbose_name = _("journal submission")
         verbose_name_plural = _("journal submissions")
         ordering = ("-created_at",)
+        indexes = [
+            models.Index(
+                fields=["journal", "-created_at", "-id"],
+                name="journal_submission_page_idx",
+            )
+        ]
 
 
 class JournalSubmissionEditorialTeam(Role):
@@ -56,6 +66,84 @@ class JournalSubmissionEditorialTeam(Role):
         verbose_name_plural = _("journal submission editorial teams")
         db_table = "journal_submission_editorial_teams"
         ordering = ("-created_at",)
+        indexes = [
+            models.Index(
+                fields=["journal_submission", "editor"], name="submission_editor_idx"
+            ),
+        ]
+
+
+class JournalPipelineCounter(models.Model):
+    """
+    Number of a journal's submissions in a stage, accepted or pending, or
+    pending with an editor on their team, maintained by PeerReviewPortal.stats
+    """
+
+    class Kind(models.IntegerChoices):
+        STAGE = 1, _("stage")
+        STATUS = 2, _("status")
+        EDITOR = 3, _("editor")
+
+    journal = models.ForeignKey(
+        Journal, related_name="pipeline_counters", on_delete=models.CASCADE
+    )
+    kind = models.PositiveSmallIntegerField(_("kind"), choices=Kind.choices)
+    key = models.CharField(_("key"), max_length=255)
+    count = models.IntegerField(_("count"), default=0)
+
+    class Meta:
+        verbose_name = _("journal pipeline counter")
+        verbose_name_plural = _("journal pipeline counters")
+        db_table = "journal_pipeline_counters"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["journal", "kind", "key"], name="unique_pipeline_counter"
+            )
+        ]
+
+
+class SubmissionStageEvent(models.Model):
+    """
+    Append-only record of a submission's stage changes and decisions, with
+    the time the submission spent in its previous stage and since it was
+    submitted. Events are written by PeerReviewPortal.turnaround.
+    """
+
+    class Kind(models.IntegerChoices):
+        SUBMITTED = 1, _("submitted")
+        TRANSFERRED = 2, _("transferred")
+        ACCEPTED = 3, _("accepted")
+        REJECTED = 4, _("rejected")
+
+    journal_submission = models.ForeignKey(
+        JournalSubmission, related_name="stage_events", on_delete=models.CASCADE
+    )
+    journal = models.ForeignKey(
+        Journal, related_name="stage_events", on_delete=models.CASCADE
+    )
+    kind = models.PositiveSmallIntegerField(_("kind"), choices=Kind.choices)
+    from_stage = models.CharField(_("from_stage"), max_length=255, blank=True)
+    stage = models.CharField(_("stage"), max_length=255)
+    time_in_stage = models.DurationField(_("time_in_stage"), null=True, blank=True)
+    elapsed = models.DurationField(_("elapsed"))
+    created_at = models.DateTimeField(_("created_at"), default=timezone.now)
+
+    class Meta:
+        verbose_name = _("submission stage event")
+        verbose_name_plural = _("submission stage events")
+        db_table = "submission_stage_events"
+        ordering = ("created_at",)
+        indexes = [
+            models.Index(
+                fields=["journal_submission", "-created_at"],
+                name="stage_event_submission_idx",
+            ),
+            models.Index(
+                fields=["journal", "created_at"],
+                include=["from_stage", "time_in_stage"],
+                name="stage_event_journal_idx",
+            ),
+        ]
 
 
 class EditorReport(models.Model):
@@ -108,6 +196,36 @@ class ReviewerReport(models.Model):
         ]
 
 
+class ReviewerTerm(models.Model):
+    """
+    Weight of a keyword or subject area in the submissions a reviewer has
+    reported on, a reviewer's weights have a unit norm
+    """
+
+    reviewer = models.ForeignKey(
+        Reviewer, related_name="terms", on_delete=models.CASCADE
+    )
+    term = models.CharField(_("term"), max_length=255)
+    weight = models.FloatField(_("weight"))
+
+    class Meta:
+        verbose_name = _("reviewer_term")
+        verbose_name_plural = _("reviewer_terms")
+        db_table = "reviewer_terms"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["reviewer", "term"], name="unique_reviewer_term"
+            )
+        ]
+        indexes = [
+            models.Index(
+                fields=["term"],
+                include=["reviewer", "weight"],
+                name="reviewer_term_idx",
+            )
+        ]
+
+
 class ReviewerReportSection(models.Model):
     """
     Review report sections
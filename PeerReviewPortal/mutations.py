@@ -1,18 +1,20 @@
 import json
 import graphene
 
+from django.db import transaction
 from django.utils import timezone
-from django.core.mail import EmailMultiAlternatives
 from django.core.signing import Signer
 
 from graphql_jwt.decorators import login_required
 from graphql_relay import from_global_id
 from Contents.models import ManuscriptSection
+from Cores.mail import queue_email
 from Journals.models.journals import JournalReportQuestion
 
 from Journals.permissions import (
     editor_in_chief_required,
     editor_is_required,
+    get_permissions,
     is_editor_journal,
     reviewer_is_required,
 )
@@ -22,6 +24,7 @@ from .input_types import EditorInput, ReportSectionInput
 from .permissions import (
     has_handling_permission,
     is_assigned_submission,
+    handling_members,
     handling_permissions,
 )
 
@@ -31,8 +34,12 @@ from .models import (
     JournalSubmissionEditorialTeam,
     ReviewerReport,
     ReviewerReportSection,
+    SubmissionStageEvent,
 )
 from .nodes import EditorReportNode, JournalSubmissionNode, ReviewerReportNode
+from .provisioning import submit_to_journal
+from .stats import Kind, adjust_counters, submission_counts, team_editors
+from .turnaround import record_stage_event
 from .signals.signals import has_notified_editor
 
 
@@ -57,10 +64,10 @@ class CreateJournalSubmissionMutation(graphene.relay.ClientIDMutation):
             pk=from_global_id(author_submission_id).id
         )
 
-        journal_submission = JournalSubmission.objects.create(
-            author_submission=author_submission,
+        journal_submission = submit_to_journal(
+            author_submission,
+            author_submission.manuscript.journal,
             stage="initial submission",
-            journal=author_submission.manuscript.journal,
         )
 
         return CreateJournalSubmissionMutation(
@@ -121,9 +128,13 @@ class InviteReviewerMutation(graphene.relay.ClientIDMutation):
             "<p>{0}</p><a>{1}</a></div>"
         )
 
-        msg = EmailMultiAlternatives(subject, text_content, from_email, to)
-        msg.attach_alternative(html_content.format(abstract, url), "text/html")
-        msg.send()
+        queue_email(
+            subject,
+            text_content,
+            from_email,
+            to,
+            html_content=html_content.format(abstract, url),
+        )
 
         return InviteReviewerMutation(message="success")
 
@@ -158,6 +169,7 @@ class AcceptReviewerInvitation(graphene.relay.ClientIDMutation):
         )
 
         submission.reviewers.add(reviewer)
+        get_permissions(info.context).clear()
 
         return AcceptReviewerInvitation(message="success", submission=submission)
 
@@ -183,9 +195,29 @@ class AcceptSubmission(graphene.relay.ClientIDMutation):
         is_accepted = input.get("is_accepted")
         submission_id = input.get("submission_id")
 
-        submission = JournalSubmission.objects.get(pk=from_global_id(submission_id).id)
-        submission.is_accepted = timezone.now() if is_accepted else None
-        submission.save()
+        with transaction.atomic():
+            submission = JournalSubmission.objects.select_for_update().get(
+                pk=from_global_id(submission_id).id
+            )
+            editor_ids = team_editors(submission)
+            before = submission_counts(
+                submission.stage, submission.is_accepted, editor_ids
+            )
+
+            submission.is_accepted = timezone.now() if is_accepted else None
+            submission.save()
+
+            adjust_counters(
+                submission.journal_id,
+                submission_counts(submission.stage, submission.is_accepted, editor_ids),
+                before,
+            )
+            record_stage_event(
+                submission,
+                SubmissionStageEvent.Kind.ACCEPTED
+                if is_accepted
+                else SubmissionStageEvent.Kind.REJECTED,
+            )
 
         message = "success" if submission else "failed"
 
@@ -214,24 +246,42 @@ class AssignHandlingEditorsMutation(graphene.relay.ClientIDMutation):
         editors = input.get("editors")
         submission_id = input.get("submission_id")
 
-        submission = JournalSubmission.objects.get(pk=from_global_id(submission_id).id)
-
         editor_data = {
             from_global_id(editor["editor_id"]).id: editor["role"] for editor in editors
         }
 
         editor_qs = Editor.objects.filter(pk__in=list(editor_data))
-        members = submission.editorial_members.all()
 
-        for editor_obj in editor_qs:
-            if str(editor_obj.pk) in editor_data:
-                editor_role = editor_data[str(editor_obj.pk)]
-
-                for member in members:
-                    if member.role == editor_role.value:
-                        member.editor = editor_obj
-
-        JournalSubmissionEditorialTeam.objects.bulk_update(members, ["editor"])
+        with transaction.atomic():
+            ## concurrent changes of the submission count from the team it left
+            submission = JournalSubmission.objects.select_for_update().get(
+                pk=from_global_id(submission_id).id
+            )
+            members = submission.editorial_members.all()
+            before = submission_counts(
+                submission.stage,
+                submission.is_accepted,
+                [member.editor_id for member in members],
+            )
+
+            for editor_obj in editor_qs:
+                if str(editor_obj.pk) in editor_data:
+                    editor_role = editor_data[str(editor_obj.pk)]
+
+                    for member in members:
+                        if member.role == editor_role.value:
+                            member.editor = editor_obj
+
+            JournalSubmissionEditorialTeam.objects.bulk_update(members, ["editor"])
+            adjust_counters(
+                submission.journal_id,
+                submission_counts(
+                    submission.stage,
+                    submission.is_accepted,
+                    [member.editor_id for member in members],
+                ),
+                before,
+            )
 
         message = "success" if submission else "failed"
 
@@ -265,28 +315,48 @@ class TransferHandlingPermission(graphene.relay.ClientIDMutation):
         journal_id = input.get("journal_id")
 
         user = info.context.user
-        submission = JournalSubmission.objects.get(pk=from_global_id(submission_id).id)
         permissions_qs = JournalPermission.objects.filter(
             journal__pk=from_global_id(journal_id).id,
             code_name__in=handling_permissions,
         )
 
-        current_handler = submission.editorial_members.get(editor__user__pk=user.pk)
-        next_handler = submission.editorial_members.get(
-            pk=from_global_id(editorial_member_id).id
-        )
-
-        next_handler.permissions.add(*permissions_qs)
-        current_handler.permissions.remove(*permissions_qs)
-
-        next_handler_role = next_handler.get_role_display()
-
-        submission.stage = "with {}".format(next_handler_role)
-        submission.save()
-
-        has_notified_editor.send(
-            sender=JournalSubmission, email=next_handler.editor.user.email
-        )
+        with transaction.atomic():
+            ## concurrent transfers wait and move the submission from the
+            ## stage the previous one left it in
+            submission = JournalSubmission.objects.select_for_update().get(
+                pk=from_global_id(submission_id).id
+            )
+
+            current_handler = handling_members(submission.editorial_members).get(
+                editor__user__pk=user.pk
+            )
+            next_handler = submission.editorial_members.get(
+                pk=from_global_id(editorial_member_id).id
+            )
+
+            next_handler_role = next_handler.get_role_display()
+
+            next_handler.permissions.add(*permissions_qs)
+            current_handler.permissions.remove(*permissions_qs)
+
+            previous_stage = submission.stage
+            submission.stage = "with {}".format(next_handler_role)
+            submission.save()
+
+            adjust_counters(
+                submission.journal_id,
+                {(Kind.STAGE, submission.stage): 1},
+                {(Kind.STAGE, previous_stage): 1},
+            )
+            record_stage_event(
+                submission, SubmissionStageEvent.Kind.TRANSFERRED, previous_stage
+            )
+
+            has_notified_editor.send(
+                sender=JournalSubmission, email=next_handler.editor.user.email
+            )
+
+        get_permissions(info.context).clear()
 
         return TransferHandlingPermission(message="success", submission=submission)
 
@@ -1,7 +1,10 @@
 import graphene
 
 from graphene_django import DjangoObjectType
+from Cores.fields import CountableConnection
+from Cores.loaders import load_related
 from Journals.models.roles import EditorialMember
+from Journals.nodes import Editor as EditorType
 
 from PeerReviewPortal.models import (
     EditorReport,
@@ -26,11 +29,21 @@ class JournalSubmissionEditorialTeamNode(DjangoObjectType):
             "created_at",
         ]
 
+    def resolve_permissions(self, info, **kwargs):
+        return load_related(info, self, "permissions")
+
+    def resolve_editor(self, info):
+        return load_related(info, self, "editor")
+
+    def resolve_journal_submission(self, info):
+        return load_related(info, self, "journal_submission")
+
 
 class JournalSubmissionNode(DjangoObjectType):
     class Meta:
         model = JournalSubmission
         interfaces = (graphene.relay.Node,)
+        connection_class = CountableConnection
         fields = [
             "id",
             "author_submission",
@@ -43,6 +56,21 @@ class JournalSubmissionNode(DjangoObjectType):
             "editors_reports",
         ]
 
+    def resolve_author_submission(self, info):
+        return load_related(info, self, "author_submission")
+
+    def resolve_reviewers(self, info, **kwargs):
+        return load_related(info, self, "reviewers")
+
+    def resolve_journal(self, info):
+        return load_related(info, self, "journal")
+
+    def resolve_editorial_members(self, info, **kwargs):
+        return load_related(info, self, "editorial_members")
+
+    def resolve_editors_reports(self, info, **kwargs):
+        return load_related(info, self, "editors_reports")
+
 
 class EditorialMemberNode(DjangoObjectType):
     class Meta:
@@ -57,6 +85,9 @@ class EditorReportNode(DjangoObjectType):
         fields = ["id", "detail", "created_at", "editor"]
         interfaces = (graphene.relay.Node,)
 
+    def resolve_editor(self, info):
+        return load_related(info, self, "editor")
+
 
 class ReviewerReportNode(DjangoObjectType):
     class Meta:
@@ -70,3 +101,40 @@ class ReviewerReportSectionNode(DjangoObjectType):
         model = ReviewerReportSection
         fields = ["id", "response", "section", "report"]
         interfaces = (graphene.relay.Node,)
+
+
+class StageCount(graphene.ObjectType):
+    stage = graphene.String()
+    count = graphene.Int()
+
+
+class EditorWorkload(graphene.ObjectType):
+    editor = graphene.Field(EditorType)
+    open_assignments = graphene.Int(
+        description="pending submissions with the editor on their team"
+    )
+
+
+class JournalPipelineStats(graphene.ObjectType):
+    accepted = graphene.Int()
+    pending = graphene.Int()
+    stages = graphene.List(StageCount)
+    editors = graphene.List(EditorWorkload)
+
+
+class DurationPercentiles(graphene.ObjectType):
+    p50 = graphene.Float(description="median duration in seconds")
+    p95 = graphene.Float(description="95th percentile duration in seconds")
+
+
+class StageTurnaround(graphene.ObjectType):
+    stage = graphene.String()
+    transitions = graphene.Int(description="submissions which left the stage")
+    time_in_stage = graphene.Field(DurationPercentiles)
+
+
+class JournalTurnaround(graphene.ObjectType):
+    submitted = graphene.Int()
+    decided = graphene.Int(description="submissions with a first decision")
+    time_to_first_decision = graphene.Field(DurationPercentiles)
+    stages = graphene.List(StageTurnaround)
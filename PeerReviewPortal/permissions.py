@@ -1,5 +1,6 @@
 from functools import wraps
 
+from django.db.models import F
 from graphql_jwt.decorators import context
 from graphql_jwt.exceptions import PermissionDenied
 from graphql_relay import from_global_id
@@ -9,7 +10,11 @@ from PeerReviewPortal.models import (
     JournalSubmissionEditorialTeam,
     ReviewerReport,
 )
-from Journals.permissions import JournalPermissionChoice
+from Journals.permissions import (
+    JournalPermissionChoice,
+    get_permissions,
+    permission_mask,
+)
 
 
 handling_permissions = (
@@ -17,6 +22,62 @@ handling_permissions = (
     JournalPermissionChoice.EDIT_SUBMISSIONS.value,
 )
 
+handling_mask = permission_mask(handling_permissions)
+
+
+def handling_members(queryset):
+    """
+    Filter the editorial team members holding a handling permission
+    """
+    return queryset.alias(handling=F("permission_mask").bitand(handling_mask)).filter(
+        handling__gt=0
+    )
+
+
+def handles_submission(context, submission_id):
+    """
+    The user holds handling permissions on the submission
+    """
+    return get_permissions(context).memoize(
+        ("handles_submission", submission_id),
+        lambda: handling_members(
+            JournalSubmissionEditorialTeam.objects.filter(
+                journal_submission_id=submission_id,
+                editor__user__pk=context.user.pk,
+            )
+        ).exists(),
+    )
+
+
+def assigned_submissions(context):
+    """
+    Ids of the submissions the user was invited to review
+    """
+    return get_permissions(context).memoize(
+        "assigned_submissions",
+        lambda: {
+            str(pk)
+            for pk in JournalSubmission.objects.filter(
+                reviewers__user__pk=context.user.pk
+            ).values_list("pk", flat=True)
+        },
+    )
+
+
+def reviewer_reports(context):
+    """
+    Ids of the reports written by the user
+    """
+    return get_permissions(context).memoize(
+        "reviewer_reports",
+        lambda: {
+            str(pk)
+            for pk in ReviewerReport.objects.filter(
+                reviewer__user__pk=context.user.pk
+            ).values_list("pk", flat=True)
+        },
+    )
+
 
 def has_handling_permission(input_key="submission_id"):
     """
@@ -35,13 +96,7 @@ def has_handling_permission(input_key="submission_id"):
             if not submission_id:
                 raise PermissionDenied("Submission ID is required")
 
-            handler = JournalSubmissionEditorialTeam.objects.filter(
-                journal_submission__pk=from_global_id(submission_id).id,
-                editor__user__pk=context.user.pk,
-                permissions__code_name__in=handling_permissions,
-            )
-
-            if not handler.exists():
+            if not handles_submission(context, from_global_id(submission_id).id):
                 raise PermissionDenied(
                     "You do not have permission to perform this action"
                 )
@@ -71,11 +126,7 @@ def is_assigned_submission(input_key="submission_id"):
             if not submission_id:
                 raise PermissionDenied("Submission ID is required")
 
-            submission = JournalSubmission.objects.filter(
-                reviewers__user__pk=context.user.pk, pk=from_global_id(submission_id).id
-            )
-
-            if not submission.exists():
+            if from_global_id(submission_id).id not in assigned_submissions(context):
                 raise PermissionDenied(
                     "You do not have permission to perform this action"
                 )
@@ -105,11 +156,7 @@ def is_reviewer_report(input_key="report_id"):
             if not report_id:
                 raise PermissionDenied("Report ID is required")
 
-            report = ReviewerReport.objects.filter(
-                pk=from_global_id(report_id).id, reviewer__user__pk=context.user.pk
-            )
-
-            if not report.exists():
+            if from_global_id(report_id).id not in reviewer_reports(context):
                 raise PermissionDenied(
                     "You do not have permission to perform this action"
                 )
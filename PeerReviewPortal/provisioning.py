@@ -0,0 +1,80 @@
+from django.db import transaction
+
+from Journals.permissions import JournalPermissionChoice, permission_mask
+
+from .models import (
+    JournalSubmission,
+    JournalSubmissionEditorialTeam,
+    SubmissionStageEvent,
+)
+from .stats import adjust_counters, submission_counts
+from .turnaround import record_stage_event
+
+
+def provision_editorial_team(journal_submission):
+    """
+    Create the submission's editorial team from the journal's editorial board,
+    every role but the editor in chief, and grant the team members permission
+    to view the submission. The board is read once and the team and its
+    permissions are written with one statement each.
+    """
+    journal = journal_submission.journal
+
+    board = dict(journal.editorial_members.values_list("role", "editor_id"))
+    permissions = list(
+        journal.permissions.filter(
+            code_name=JournalPermissionChoice.VIEW_SUBMISSIONS.value
+        ).values_list("pk", "code_name")
+    )
+    mask = permission_mask(code_name for pk, code_name in permissions)
+
+    members = JournalSubmissionEditorialTeam.objects.bulk_create(
+        [
+            JournalSubmissionEditorialTeam(
+                role=role,
+                journal_submission=journal_submission,
+                editor_id=board.get(role),
+                permission_mask=mask,
+            )
+            for role in JournalSubmissionEditorialTeam.Role.values
+            if role != JournalSubmissionEditorialTeam.Role.CHIEF
+        ]
+    )
+
+    Through = JournalSubmissionEditorialTeam.permissions.through
+    Through.objects.bulk_create(
+        [
+            Through(
+                journalsubmissioneditorialteam_id=member.pk,
+                journalpermission_id=permission,
+            )
+            for member in members
+            for permission, code_name in permissions
+        ]
+    )
+
+    return members
+
+
+@transaction.atomic
+def submit_to_journal(author_submission, journal, **fields):
+    """
+    Create a journal submission along with its editorial team, count it in
+    the journal's pipeline and record its submission event
+    """
+    journal_submission = JournalSubmission.objects.create(
+        author_submission=author_submission, journal=journal, **fields
+    )
+    members = provision_editorial_team(journal_submission)
+
+    adjust_counters(
+        journal.pk,
+        submission_counts(
+            journal_submission.stage,
+            journal_submission.is_accepted,
+            [member.editor_id for member in members],
+        ),
+    )
+    record_stage_event(journal_submission, SubmissionStageEvent.Kind.SUBMITTED)
+
+    return journal_submission
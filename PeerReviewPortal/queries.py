@@ -1,24 +1,33 @@
 import graphene
 
-from graphene_django import DjangoConnectionField
 from graphql_jwt.decorators import login_required
 from graphql_relay import from_global_id
 
+from Contents.models import Manuscript
+from Contents.nodes import ManuscriptNode
+from Contents.search import search_manuscripts
+from Cores.fields import BatchedConnectionField, KeysetConnectionField
+from Cores.optimizer import optimize
+from Journals.inputTypes.journals import DateRangeInput
+from Journals.models import Editor, Reviewer
+from Journals.nodes import ReviewerNode
 from Journals.permissions import (
     is_editor_journal,
     editor_is_required,
     is_reviewer_journal,
     reviewer_is_required,
 )
-from .nodes import JournalSubmissionNode, ReviewerReportNode
-from .models import JournalSubmission, ReviewerReport
-
-
-related_fields = (
-    "author_submission__manuscript",
-    "author_submission__user",
-    "journal",
+from .nodes import (
+    JournalPipelineStats,
+    JournalSubmissionNode,
+    JournalTurnaround,
+    ReviewerReportNode,
 )
+from .models import JournalSubmission, ReviewerReport
+from .permissions import has_handling_permission
+from .recommendations import recommend_reviewers
+from .stats import pipeline_stats
+from .turnaround import turnaround_report
 
 
 class ReviewerQuery(graphene.ObjectType):
@@ -26,7 +35,7 @@ class ReviewerQuery(graphene.ObjectType):
     Reviewers queries
     """
 
-    reviewer_submissions = DjangoConnectionField(
+    reviewer_submissions = KeysetConnectionField(
         JournalSubmissionNode,
         journal_id=graphene.ID(required=True),
     )
@@ -49,10 +58,12 @@ class ReviewerQuery(graphene.ObjectType):
     def resolve_reviewer_submissions(self, info, **kwargs):
         journal_id = kwargs.get("journal_id")
 
-        return JournalSubmission.objects.filter(
+        queryset = JournalSubmission.objects.filter(
             journal__pk=from_global_id(journal_id).id,
             reviewers__user__pk=info.context.user.pk,
-        ).select_related(*related_fields)
+        )
+
+        return optimize(queryset, info)
 
     @is_reviewer_journal()
     @reviewer_is_required
@@ -61,7 +72,7 @@ class ReviewerQuery(graphene.ObjectType):
         submission_id = kwargs.get("submission_id")
         journal_id = kwargs.get("journal_id")
 
-        return JournalSubmission.objects.select_related(*related_fields).get(
+        return optimize(JournalSubmission.objects, info).get(
             pk=from_global_id(submission_id).id,
             reviewers__user__pk=info.context.user.pk,
             journal__pk=from_global_id(journal_id).id,
@@ -74,7 +85,7 @@ class ReviewerQuery(graphene.ObjectType):
         report_id = kwargs.get("report_id")
         journal_id = kwargs.get("journal_id")
 
-        return ReviewerReport.objects.get(
+        return optimize(ReviewerReport.objects, info).get(
             pk=from_global_id(report_id).id,
             journal_submission__journal__pk=from_global_id(journal_id).id,
             reviewer__user__pk=info.context.user.pk,
@@ -86,7 +97,7 @@ class EditorQuery(graphene.ObjectType):
     Editor's queries
     """
 
-    journal_submissions = DjangoConnectionField(
+    journal_submissions = KeysetConnectionField(
         JournalSubmissionNode, journal_id=graphene.ID(required=True)
     )
 
@@ -96,15 +107,40 @@ class EditorQuery(graphene.ObjectType):
         submission_id=graphene.ID(required=True),
     )
 
+    search_manuscripts = BatchedConnectionField(
+        ManuscriptNode,
+        query=graphene.String(required=True),
+        journal_id=graphene.ID(required=True),
+    )
+
+    journal_pipeline_stats = graphene.Field(
+        JournalPipelineStats, journal_id=graphene.ID(required=True)
+    )
+
+    journal_turnaround = graphene.Field(
+        JournalTurnaround,
+        journal_id=graphene.ID(required=True),
+        range=DateRangeInput(required=True),
+    )
+
+    suggest_reviewers = graphene.List(
+        ReviewerNode,
+        journal_id=graphene.ID(required=True),
+        submission_id=graphene.ID(required=True),
+        k=graphene.Int(),
+    )
+
     @is_editor_journal()
     @editor_is_required
     @login_required
     def resolve_journal_submissions(self, info, **kwargs):
         journal_id = kwargs.get("journal_id")
 
-        return JournalSubmission.objects.filter(
+        queryset = JournalSubmission.objects.filter(
             journal__pk=from_global_id(journal_id).id
-        ).select_related(*related_fields)
+        )
+
+        return optimize(queryset, info)
 
     @is_editor_journal()
     @editor_is_required
@@ -112,6 +148,69 @@ class EditorQuery(graphene.ObjectType):
     def resolve_journal_submission(self, info, **kwargs):
         submission_id = kwargs.get("submission_id")
 
-        return JournalSubmission.objects.select_related(*related_fields).get(
+        return optimize(JournalSubmission.objects, info).get(
             pk=from_global_id(submission_id).id
         )
+
+    @is_editor_journal()
+    @editor_is_required
+    @login_required
+    def resolve_search_manuscripts(self, info, **kwargs):
+        query = kwargs.get("query")
+        journal_id = kwargs.get("journal_id")
+
+        queryset = Manuscript.objects.filter(
+            journal__pk=from_global_id(journal_id).id,
+            author_submission__journal_submission__isnull=False,
+        )
+
+        return optimize(search_manuscripts(queryset, query), info)
+
+    @has_handling_permission()
+    @is_editor_journal()
+    @editor_is_required
+    @login_required
+    def resolve_suggest_reviewers(self, info, **kwargs):
+        submission_id = kwargs.get("submission_id")
+
+        return recommend_reviewers(
+            optimize(Reviewer.objects, info),
+            from_global_id(submission_id).id,
+            kwargs.get("k"),
+        )
+
+    @is_editor_journal()
+    @editor_is_required
+    @login_required
+    def resolve_journal_pipeline_stats(self, info, **kwargs):
+        journal_id = kwargs.get("journal_id")
+
+        stats = pipeline_stats(from_global_id(journal_id).id)
+        editors = {
+            str(editor.pk): editor
+            for editor in Editor.objects.filter(
+                pk__in=[workload["editor_id"] for workload in stats["editors"]]
+            )
+        }
+
+        stats["editors"] = [
+            {
+                "editor": editors[workload["editor_id"]],
+                "open_assignments": workload["count"],
+            }
+            for workload in stats["editors"]
+            if workload["editor_id"] in editors
+        ]
+
+        return stats
+
+    @is_editor_journal()
+    @editor_is_required
+    @login_required
+    def resolve_journal_turnaround(self, info, **kwargs):
+        journal_id = int(from_global_id(kwargs.get("journal_id")).id)
+        date_range = kwargs.get("range")
+
+        return turnaround_report([journal_id], date_range.start, date_range.end)[
+            journal_id
+        ]
@@ -0,0 +1,143 @@
+import math
+from collections import Counter, defaultdict
+
+from django.db import transaction
+from django.db.models import Sum
+from django.db.models.functions import Lower
+
+from Contents.models import ManuscriptAuthor, ManuscriptKeywordTag
+
+from .models import JournalSubmission, ReviewerReport, ReviewerTerm
+
+## reviewers suggested when the editor does not ask for a number
+SUGGESTED_REVIEWERS = 10
+
+## most reviewers an editor can ask for
+MAX_SUGGESTED_REVIEWERS = 50
+
+## keywords and subject areas are prefixed so that a keyword never matches a
+## subject area of the same name
+KEYWORD_TERM = "keyword:{0}"
+SUBJECT_TERM = "subject:{0}"
+
+TERM_LENGTH = ReviewerTerm._meta.get_field("term").max_length
+
+
+def keyword_term(tag):
+    return KEYWORD_TERM.format(" ".join(tag.split()).lower())[:TERM_LENGTH]
+
+
+def subject_term(name):
+    return SUBJECT_TERM.format(" ".join(name.split()).lower())[:TERM_LENGTH]
+
+
+def refresh_reviewer_terms(reviewer_ids):
+    """
+    Rebuild the term weights of the given reviewers from the keywords and
+    subject areas of the submissions they have reported on. A term weighs
+    1 + log of the number of those submissions, scaled so that each
+    reviewer's weights have a unit norm.
+    """
+    reviewer_ids = list(reviewer_ids)
+    reports = ReviewerReport.objects.filter(reviewer__in=reviewer_ids)
+    manuscript = "journal_submission__author_submission__manuscript"
+
+    counts = defaultdict(Counter)
+
+    for reviewer_id, tag in reports.filter(
+        **{manuscript + "__keyword_tags__isnull": False}
+    ).values_list("reviewer_id", manuscript + "__keyword_tags__tag"):
+        counts[reviewer_id][keyword_term(tag)] += 1
+
+    for reviewer_id, name in reports.filter(
+        **{manuscript + "__subject_area__isnull": False}
+    ).values_list("reviewer_id", manuscript + "__subject_area__name"):
+        counts[reviewer_id][subject_term(name)] += 1
+
+    terms = []
+
+    for reviewer_id, reviewer_counts in counts.items():
+        weights = {term: 1 + math.log(count) for term, count in reviewer_counts.items()}
+        norm = math.sqrt(sum(weight * weight for weight in weights.values()))
+
+        terms.extend(
+            ReviewerTerm(reviewer_id=reviewer_id, term=term, weight=weight / norm)
+            for term, weight in weights.items()
+        )
+
+    with transaction.atomic():
+        ReviewerTerm.objects.filter(reviewer__in=reviewer_ids).delete()
+        ReviewerTerm.objects.bulk_create(terms)
+
+
+def submission_terms(journal_submission_id):
+    """
+    Terms of the submitted manuscript, its keywords and subject area
+    """
+    subject_area = (
+        JournalSubmission.objects.filter(pk=journal_submission_id)
+        .values_list("author_submission__manuscript__subject_area__name", flat=True)
+        .first()
+    )
+    tags = ManuscriptKeywordTag.objects.filter(
+        manuscript__author_submission__journal_submission=journal_submission_id
+    ).values_list("tag", flat=True)
+
+    terms = {keyword_term(tag) for tag in tags}
+
+    if subject_area:
+        terms.add(subject_term(subject_area))
+
+    return terms
+
+
+def recommend_reviewers(queryset, journal_submission_id, k=SUGGESTED_REVIEWERS):
+    """
+    Reviewers of queryset closest to the submission, best first, with their
+    cosine similarity to the submission's terms as `score`.
+
+    The submission's authors, matched by email, and the reviewers already
+    on the submission are left out. Only the reviewers sharing a term with
+    the submission are scored, from the term index alone.
+    """
+    k = max(1, min(k or SUGGESTED_REVIEWERS, MAX_SUGGESTED_REVIEWERS))
+    terms = submission_terms(journal_submission_id)
+
+    if not terms:
+        return []
+
+    author_emails = (
+        ManuscriptAuthor.objects.filter(
+            manuscript__author_submission__journal_submission=journal_submission_id
+        )
+        .annotate(address=Lower("email"))
+        .values("address")
+    )
+    assigned = JournalSubmission.reviewers.through.objects.filter(
+        journalsubmission_id=journal_submission_id
+    ).values("reviewer_id")
+
+    scores = list(
+        ReviewerTerm.objects.filter(term__in=terms)
+        .alias(address=Lower("reviewer__user__email"))
+        .exclude(address__in=author_emails)
+        .exclude(reviewer_id__in=assigned)
+        .values("reviewer_id")
+        .annotate(score=Sum("weight"))
+        .order_by("-score", "reviewer_id")
+        .values_list("reviewer_id", "score")[:k]
+    )
+
+    ## the submission's terms all weigh the same
+    norm = math.sqrt(len(terms))
+    reviewers = queryset.in_bulk([reviewer_id for reviewer_id, score in scores])
+
+    for reviewer_id, score in scores:
+        if reviewer_id in reviewers:
+            reviewers[reviewer_id].score = score / norm
+
+    return [
+        reviewers[reviewer_id]
+        for reviewer_id, score in scores
+        if reviewer_id in reviewers
+    ]
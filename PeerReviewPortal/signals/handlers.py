@@ -1,43 +1,15 @@
 from django.dispatch import receiver
-from django.db.models.signals import post_save
-from django.core.mail import EmailMultiAlternatives
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
 
-from Journals.permissions import JournalPermissionChoice
+from Cores.mail import queue_email
+
+from Journals.permissions import permissions_changed
 
 from .signals import has_notified_editor
 
-from ..models import JournalSubmission, JournalSubmissionEditorialTeam
-
-
-@receiver(post_save, sender=JournalSubmission)
-def create_editorial_roles(sender, instance, created, **kwargs):
-
-    if created:
-        journal = instance.journal
-        members = JournalSubmissionEditorialTeam.objects.bulk_create(
-            [
-                JournalSubmissionEditorialTeam(
-                    **{
-                        "role": getattr(JournalSubmissionEditorialTeam.Role, role),
-                        "journal_submission": instance,
-                        "editor": journal.get_editorial_board_member(
-                            getattr(JournalSubmissionEditorialTeam.Role, role),
-                        ),
-                    }
-                )
-                for role in filter(
-                    lambda role: role != JournalSubmissionEditorialTeam.Role.CHIEF.name,
-                    JournalSubmissionEditorialTeam.Role.names,
-                )
-            ]
-        )
-
-        ## assign individual editorial team members permissions ##
-        for member in members:
-            permission_qs = journal.permissions.filter(
-                code_name=JournalPermissionChoice.VIEW_SUBMISSIONS.value
-            )
-            member.permissions.add(*permission_qs)
+from ..models import JournalSubmission, JournalSubmissionEditorialTeam, ReviewerReport
+from ..recommendations import refresh_reviewer_terms
+from ..stats import adjust_counters, submission_counts, team_editors
 
 
 @receiver(has_notified_editor)
@@ -52,7 +24,37 @@ def notify_editor(sender, **kwargs):
     html_content = "<p> A manuscript was transfered to you for processing.</p>"
     text_content = "A manuscript was transfered to you for processing."
 
-    msg = EmailMultiAlternatives(subject, text_content, from_email, [email])
+    queue_email(subject, text_content, from_email, [email], html_content=html_content)
+
+
+@receiver(m2m_changed, sender=JournalSubmissionEditorialTeam.permissions.through)
+def sync_team_permission_masks(sender, instance, action, reverse, pk_set, **kwargs):
+    permissions_changed(
+        JournalSubmissionEditorialTeam, instance, action, reverse, pk_set
+    )
+
 
-    msg.attach_alternative(html_content, "text/html")
-    msg.send()
+@receiver(post_save, sender=ReviewerReport)
+@receiver(post_delete, sender=ReviewerReport)
+def update_reviewer_terms(sender, instance, **kwargs):
+    if kwargs.get("created", True):
+        refresh_reviewer_terms([instance.reviewer_id])
+
+
+@receiver(pre_delete, sender=JournalSubmission)
+def track_counted_editors(sender, instance, **kwargs):
+    ## the team is deleted before the submission when the deletion cascades
+    instance._counted_editors = team_editors(instance)
+
+
+@receiver(post_delete, sender=JournalSubmission)
+def uncount_submission(sender, instance, **kwargs):
+    adjust_counters(
+        instance.journal_id,
+        {},
+        before=submission_counts(
+            instance.stage,
+            instance.is_accepted,
+            getattr(instance, "_counted_editors", ()),
+        ),
+    )
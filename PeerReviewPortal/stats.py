@@ -0,0 +1,180 @@
+from collections import Counter
+
+from django.db import connection, transaction
+from django.db.models import Count, Q
+
+from .models import (
+    JournalPipelineCounter,
+    JournalSubmission,
+    JournalSubmissionEditorialTeam,
+)
+
+Kind = JournalPipelineCounter.Kind
+
+ACCEPTED = "accepted"
+PENDING = "pending"
+
+
+def submission_counts(stage, is_accepted, editor_ids):
+    """
+    Counters of a submission in the given state, the editors on its team
+    have an open assignment until it is accepted
+    """
+    counts = Counter({(Kind.STAGE, stage): 1})
+
+    if is_accepted:
+        counts[(Kind.STATUS, ACCEPTED)] += 1
+    else:
+        counts[(Kind.STATUS, PENDING)] += 1
+        counts.update(
+            (Kind.EDITOR, str(editor_id))
+            for editor_id in editor_ids
+            if editor_id is not None
+        )
+
+    return counts
+
+
+def adjust_counters(journal_id, after, before=None):
+    """
+    Move the journal's counters by the difference between the counts of a
+    submission after and before a change, in one upsert which increments
+    the counters in place, so concurrent changes add up
+    """
+    deltas = Counter()
+    deltas.update(after)
+    deltas.subtract(before or {})
+
+    rows = sorted(
+        (int(kind), key, delta) for (kind, key), delta in deltas.items() if delta
+    )
+
+    if not rows:
+        return
+
+    quote = connection.ops.quote_name
+    table = quote(JournalPipelineCounter._meta.db_table)
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            INSERT INTO {0} (journal_id, kind, {1}, count) VALUES {2}
+            ON CONFLICT (journal_id, kind, {1})
+            DO UPDATE SET count = {0}.count + EXCLUDED.count
+            """.format(
+                table, quote("key"), ", ".join(["(%s, %s, %s, %s)"] * len(rows))
+            ),
+            [value for row in rows for value in (journal_id, *row)],
+        )
+
+
+def team_editors(journal_submission):
+    return list(
+        journal_submission.editorial_members.values_list("editor_id", flat=True)
+    )
+
+
+def pipeline_counts(journal_ids):
+    """
+    Counters of the journals computed from their submissions
+    """
+    counts = Counter()
+    submissions = JournalSubmission.objects.filter(journal__in=journal_ids).order_by()
+
+    for row in submissions.values("journal_id", "stage").annotate(count=Count("pk")):
+        counts[(row["journal_id"], Kind.STAGE, row["stage"])] = row["count"]
+
+    for row in submissions.values("journal_id").annotate(
+        accepted=Count("pk", filter=Q(is_accepted__isnull=False)),
+        pending=Count("pk", filter=Q(is_accepted__isnull=True)),
+    ):
+        counts[(row["journal_id"], Kind.STATUS, ACCEPTED)] = row["accepted"]
+        counts[(row["journal_id"], Kind.STATUS, PENDING)] = row["pending"]
+
+    for row in (
+        JournalSubmissionEditorialTeam.objects.filter(
+            journal_submission__journal__in=journal_ids,
+            journal_submission__is_accepted__isnull=True,
+            editor__isnull=False,
+        )
+        .order_by()
+        .values("journal_submission__journal_id", "editor_id")
+        .annotate(count=Count("pk"))
+    ):
+        key = (
+            row["journal_submission__journal_id"],
+            Kind.EDITOR,
+            str(row["editor_id"]),
+        )
+        counts[key] = row["count"]
+
+    return counts
+
+
+def reconcile_pipeline_counters(journal_ids):
+    """
+    Recompute the journals' counters from their submissions and correct
+    the ones which drifted. Counter updates wait for the reconciliation.
+
+    Returns the number of corrected counters.
+    """
+    journal_ids = list(journal_ids)
+
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "LOCK TABLE {0} IN SHARE ROW EXCLUSIVE MODE".format(
+                    connection.ops.quote_name(JournalPipelineCounter._meta.db_table)
+                )
+            )
+
+        counts = pipeline_counts(journal_ids)
+        counters = {
+            (counter.journal_id, counter.kind, counter.key): counter
+            for counter in JournalPipelineCounter.objects.filter(
+                journal__in=journal_ids
+            )
+        }
+
+        updates, creates = [], []
+
+        for key, counter in counters.items():
+            if counter.count != counts.get(key, 0):
+                counter.count = counts.get(key, 0)
+                updates.append(counter)
+
+        for (journal_id, kind, key), count in counts.items():
+            if (journal_id, kind, key) not in counters and count:
+                creates.append(
+                    JournalPipelineCounter(
+                        journal_id=journal_id, kind=kind, key=key, count=count
+                    )
+                )
+
+        JournalPipelineCounter.objects.bulk_update(updates, ["count"])
+        JournalPipelineCounter.objects.bulk_create(creates)
+        JournalPipelineCounter.objects.filter(journal__in=journal_ids, count=0).delete()
+
+    return len(updates) + len(creates)
+
+
+def pipeline_stats(journal_id):
+    """
+    Submissions of the journal by stage, accepted and pending, and open
+    assignments by editor, read from the counters alone
+    """
+    stats = {ACCEPTED: 0, PENDING: 0, "stages": [], "editors": []}
+
+    for kind, key, count in (
+        JournalPipelineCounter.objects.filter(journal=journal_id, count__gt=0)
+        .order_by("kind", "-count", "key")
+        .values_list("kind", "key", "count")
+    ):
+        if kind == Kind.STATUS:
+            stats[key] = count
+        elif kind == Kind.STAGE:
+            stats["stages"].append({"stage": key, "count": count})
+        else:
+            stats["editors"].append({"editor_id": key, "count": count})
+
+    return stats
@@ -1,4 +1,5 @@
 import json
+from datetime import timedelta
 
 from mixer.backend.django import mixer
 
@@ -7,9 +8,13 @@ from Cores.models import ArticleType, ArticleTypeSection, Discipline
 
 from django.contrib.auth import get_user_model, models
 from django.core.signing import Signer
+from django.db import connection
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 
 from graphene.utils.str_converters import to_snake_case
+from graphene_django.settings import graphene_settings
 from graphene_django.utils.testing import GraphQLTestCase
 from graphql_jwt.shortcuts import get_token
 from graphql_relay import from_global_id, to_global_id
@@ -31,19 +36,41 @@ from Journals.nodes import (
 
 from PeerReviewPortal.models import (
     JournalSubmission,
+    JournalSubmissionEditorialTeam,
     ReviewerReport,
     ReviewerReportSection,
+    ReviewerTerm,
+    JournalPipelineCounter,
+    SubmissionStageEvent,
 )
 from PeerReviewPortal.nodes import (
     EditorialMemberNode,
     JournalSubmissionNode,
     ReviewerReportNode,
 )
-from PeerReviewPortal.permissions import handling_permissions
+from PeerReviewPortal.permissions import (
+    handles_submission,
+    handling_mask,
+    handling_permissions,
+)
+from Contents.search import search_manuscripts
+from PeerReviewPortal.provisioning import provision_editorial_team, submit_to_journal
+from PeerReviewPortal.stats import pipeline_stats, reconcile_pipeline_counters
+from PeerReviewPortal.turnaround import record_stage_event
+from Journals.permissions import (
+    JournalPermissionChoice,
+    get_permissions,
+    permission_mask,
+)
 
 from SubmissionPortal.nodes import SubmissionNode
 
-from Contents.models import Manuscript, ManuscriptSection
+from Contents.models import (
+    Manuscript,
+    ManuscriptAuthor,
+    ManuscriptKeywordTag,
+    ManuscriptSection,
+)
 
 
 def dependencies(cls):
@@ -210,7 +237,7 @@ class AssignHandlingEditorsTest(GraphQLTestCase):
         dependencies(cls)
 
     def test_assign_editors(self):
-        submission = JournalSubmission.objects.create(
+        submission = submit_to_journal(
             stage="with line editor",
             author_submission=mixer.blend(
                 AuthorSubmission,
@@ -267,8 +294,150 @@ class AssignHandlingEditorsTest(GraphQLTestCase):
             ).exists()
         )
 
+    def test_journal_pipeline_stats(self):
+        submissions = [
+            submit_to_journal(
+                stage="with line editor",
+                author_submission=mixer.blend(
+                    AuthorSubmission,
+                    user=self.user,
+                    article_type=AuthorSubmission.ArticleType.RESEARCH_ARTICLE,
+                ),
+                journal=self.journal,
+            )
+            for _ in range(3)
+        ]
+
+        editor = Editor.objects.create(
+            **{
+                "affiliation": "bayero university, kano",
+                "phone_number": "+2347037606119",
+                "user": self.user,
+            }
+        )
+
+        editor.journals.add(self.journal)
+        self.journal.make_editor_chief(editor)
+
+        response = self.query(
+            """
+            mutation updateSubmission($input: AssignHandlingEditorsMutationInput!) {
+                assignEditors(input: $input) {
+                    message
+                }
+            }
+            """,
+            operation_name="updateSubmission",
+            variables={
+                "input": {
+                    "submissionId": to_global_id(
+                        JournalSubmissionNode, submissions[0].pk
+                    ),
+                    "journalId": self.data["journalId"],
+                    "editors": self.data["editors"],
+                }
+            },
+            headers=self.headers,
+        )
+
+        self.assertResponseNoErrors(response)
+
+        response = self.query(
+            """
+            mutation acceptSubmission($input: AcceptSubmissionInput!) {
+                acceptSubmission(input: $input) {
+                    message
+                }
+            }
+            """,
+            operation_name="acceptSubmission",
+            variables={
+                "input": {
+                    "isAccepted": True,
+                    "journalId": self.data["journalId"],
+                    "submissionId": to_global_id(
+                        JournalSubmissionNode, submissions[1].pk
+                    ),
+                }
+            },
+            headers=self.headers,
+        )
+
+        self.assertResponseNoErrors(response)
+
+        query = """
+            query PipelineStats($journalId: ID!) {
+                journalPipelineStats(journalId: $journalId) {
+                    accepted
+                    pending
+                    stages {
+                        stage
+                        count
+                    }
+                    editors {
+                        editor {
+                            id
+                        }
+                        openAssignments
+                    }
+                }
+            }
+            """
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.query(
+                query,
+                operation_name="PipelineStats",
+                variables={"journalId": self.data["journalId"]},
+                headers=self.headers,
+            )
+
+        self.assertResponseNoErrors(response)
+
+        stats = json.loads(response.content)["data"]["journalPipelineStats"]
+
+        self.assertEqual(stats["accepted"], 1)
+        self.assertEqual(stats["pending"], 2)
+        self.assertEqual(stats["stages"], [{"stage": "with line editor", "count": 3}])
+        self.assertEqual(len(stats["editors"]), len(self.data["editors"]))
+        self.assertTrue(
+            all(workload["openAssignments"] == 1 for workload in stats["editors"])
+        )
+        self.assertFalse(
+            any(
+                "journal_submission" in query["sql"]
+                for query in queries.captured_queries
+            )
+        )
+
+        ## the counters are recomputed from the submissions
+        JournalPipelineCounter.objects.filter(
+            journal=self.journal, kind=JournalPipelineCounter.Kind.STATUS
+        ).update(count=7)
+        JournalPipelineCounter.objects.filter(
+            journal=self.journal, kind=JournalPipelineCounter.Kind.EDITOR
+        ).delete()
+
+        self.assertEqual(
+            reconcile_pipeline_counters([self.journal.pk]),
+            2 + len(self.data["editors"]),
+        )
+        self.assertEqual(reconcile_pipeline_counters([self.journal.pk]), 0)
+        self.assertEqual(pipeline_stats(self.journal.pk)["pending"], 2)
+
+        ## deleting a submission takes it off the counters
+        submissions[0].author_submission.delete()
+
+        stats = pipeline_stats(self.journal.pk)
+
+        self.assertEqual(stats["pending"], 1)
+        self.assertEqual(stats["accepted"], 1)
+        self.assertEqual(stats["stages"], [{"stage": "with line editor", "count": 2}])
+        self.assertEqual(stats["editors"], [])
+        self.assertEqual(reconcile_pipeline_counters([self.journal.pk]), 0)
+
     def test_unauthorized_editor_update_submission(self):
-        submission = JournalSubmission.objects.create(
+        submission = submit_to_journal(
             stage="with line editor",
             journal=self.journal,
             author_submission=mixer.blend(
@@ -366,6 +535,39 @@ class CreateJournalSubmissionTest(GraphQLTestCase):
             author_submission.article_type,
         )
 
+    def test_provision_editorial_team(self):
+        editors = self.editors[:3]
+        roles = [
+            EditorialMember.Role.LINE,
+            EditorialMember.Role.COPY,
+            EditorialMember.Role.SECTION,
+        ]
+
+        for editor, role in zip(editors, roles):
+            self.journal.assign_editor_role(editor, role)
+
+        submission = mixer.blend(
+            JournalSubmission,
+            journal=self.journal,
+            author_submission=mixer.blend(AuthorSubmission, user=self.user),
+        )
+
+        ## the board, the permission, the team and the team's permissions
+        with self.assertNumQueries(4):
+            members = provision_editorial_team(submission)
+
+        self.assertEqual(len(members), len(roles))
+        self.assertEqual(
+            dict(submission.editorial_members.values_list("role", "editor")),
+            {role.value: editor.pk for editor, role in zip(editors, roles)},
+        )
+
+        for member in submission.editorial_members.all():
+            self.assertEqual(
+                list(member.permissions.values_list("code_name", flat=True)),
+                [JournalPermissionChoice.VIEW_SUBMISSIONS.value],
+            )
+
 
 class InviteReviewerMutationTest(GraphQLTestCase):
     GRAPHQL_URL = "http://localhost/graphql"
@@ -423,7 +625,7 @@ class InviteReviewerMutationTest(GraphQLTestCase):
             manuscript=manuscript,
         )
 
-        cls.submission = JournalSubmission.objects.create(
+        cls.submission = submit_to_journal(
             stage="with line editor",
             author_submission=author_submission,
             journal=cls.journal,
@@ -487,6 +689,74 @@ class InviteReviewerMutationTest(GraphQLTestCase):
 
         self.assertEqual(content["message"], "success")
 
+    def test_suggest_reviewers(self):
+        assign_handling_permissions(self)
+
+        manuscript = self.submission.author_submission.manuscript
+
+        for tag in ("plant vision", "mimicry"):
+            ManuscriptKeywordTag.objects.create(manuscript=manuscript, tag=tag)
+
+        mixer.blend(
+            ManuscriptAuthor, manuscript=manuscript, email="JamesDowneygmail.com"
+        )
+        self.submission.reviewers.add(self.reviewers[3])
+
+        def review(reviewer, tags):
+            past = mixer.blend(Manuscript, journal=self.journal)
+
+            for tag in tags:
+                ManuscriptKeywordTag.objects.create(manuscript=past, tag=tag)
+
+            submission = submit_to_journal(
+                mixer.blend(AuthorSubmission, user=self.user, manuscript=past),
+                self.journal,
+            )
+            ReviewerReport.objects.create(
+                reviewer=reviewer, journal_submission=submission
+            )
+
+        review(self.reviewers[0], ["Plant  Vision", "mimicry"])
+        review(self.reviewers[1], ["mimicry", "soil"])
+        review(self.reviewers[2], ["plant vision"])
+        review(self.reviewers[3], ["mimicry"])
+
+        self.assertEqual(
+            ReviewerTerm.objects.filter(reviewer=self.reviewers[1]).count(), 2
+        )
+
+        response = self.query(
+            """
+            query SuggestReviewers($journalId: ID!, $submissionId: ID!) {
+                suggestReviewers(journalId: $journalId, submissionId: $submissionId) {
+                    id
+                    score
+                }
+            }
+            """,
+            operation_name="SuggestReviewers",
+            variables={
+                "journalId": to_global_id(JournalType, self.journal.pk),
+                "submissionId": to_global_id(JournalSubmissionNode, self.submission.pk),
+            },
+            headers=self.headers,
+        )
+
+        self.assertResponseNoErrors(response)
+
+        content = json.loads(response.content)["data"]["suggestReviewers"]
+
+        ## the co-author and the reviewer already on the submission are left out
+        self.assertEqual(
+            [reviewer["id"] for reviewer in content],
+            [
+                to_global_id(ReviewerNode, self.reviewers[0].pk),
+                to_global_id(ReviewerNode, self.reviewers[1].pk),
+            ],
+        )
+        self.assertAlmostEqual(content[0]["score"], 1.0)
+        self.assertAlmostEqual(content[1]["score"], 0.5)
+
 
 class AcceptReviewerInvitationMutationTest(GraphQLTestCase):
     GRAPHQL_URL = "http://localhost/graphql"
@@ -504,7 +774,7 @@ class AcceptReviewerInvitationMutationTest(GraphQLTestCase):
             article_type=AuthorSubmission.ArticleType.RESEARCH_ARTICLE,
         )
 
-        submission = JournalSubmission.objects.create(
+        submission = submit_to_journal(
             stage="with line editor",
             author_submission=author_submission,
             journal=self.journal,
@@ -592,6 +862,131 @@ class AcceptSubmissionTest(GraphQLTestCase):
 
         self.assertIsNotNone(content["submission"]["isAccepted"])
 
+    def test_journal_turnaround(self):
+        editor = mixer.blend(Editor, user=self.user)
+
+        editor.journals.add(self.journal)
+        self.journal.make_editor_chief(editor)
+
+        submissions = []
+
+        for days in range(1, 5):
+            submission = submit_to_journal(
+                stage="with line editor",
+                author_submission=mixer.blend(
+                    AuthorSubmission,
+                    user=self.user,
+                    article_type=AuthorSubmission.ArticleType.RESEARCH_ARTICLE,
+                ),
+                journal=self.journal,
+            )
+            submission.created_at -= timedelta(days=days)
+            submission.save(update_fields=["created_at"])
+            submission.stage_events.update(created_at=submission.created_at)
+            submissions.append(submission)
+
+        ## a pending submission has no first decision
+        submit_to_journal(
+            stage="with line editor",
+            author_submission=mixer.blend(
+                AuthorSubmission,
+                user=self.user,
+                article_type=AuthorSubmission.ArticleType.RESEARCH_ARTICLE,
+            ),
+            journal=self.journal,
+        )
+
+        for submission in submissions:
+            response = self.query(
+                """
+                mutation acceptSubmission($input: AcceptSubmissionInput!) {
+                    acceptSubmission(input: $input) {
+                        message
+                    }
+                }
+                """,
+                operation_name="acceptSubmission",
+                variables={
+                    "input": {
+                        "isAccepted": submission != submissions[0],
+                        "journalId": to_global_id(JournalType, self.journal.pk),
+                        "submissionId": to_global_id(
+                            JournalSubmissionNode, submission.pk
+                        ),
+                    }
+                },
+                headers=self.headers,
+            )
+
+            self.assertResponseNoErrors(response)
+
+        ## a later decision leaves the time to the first one as it is
+        record_stage_event(submissions[0], SubmissionStageEvent.Kind.ACCEPTED)
+
+        submissions[0].refresh_from_db()
+
+        self.assertAlmostEqual(
+            submissions[0].time_to_first_decision.total_seconds(), 86400, delta=60
+        )
+        self.assertEqual(
+            list(submissions[0].stage_events.values_list("kind", flat=True)),
+            [
+                SubmissionStageEvent.Kind.SUBMITTED,
+                SubmissionStageEvent.Kind.REJECTED,
+                SubmissionStageEvent.Kind.ACCEPTED,
+            ],
+        )
+
+        today = timezone.localdate()
+
+        response = self.query(
+            """
+            query Turnaround($journalId: ID!, $range: DateRangeInput!) {
+                journalTurnaround(journalId: $journalId, range: $range) {
+                    submitted
+                    decided
+                    timeToFirstDecision {
+                        p50
+                        p95
+                    }
+                    stages {
+                        stage
+                        transitions
+                        timeInStage {
+                            p50
+                        }
+                    }
+                }
+            }
+            """,
+            operation_name="Turnaround",
+            variables={
+                "journalId": to_global_id(JournalType, self.journal.pk),
+                "range": {
+                    "start": str(today - timedelta(days=7)),
+                    "end": str(today),
+                },
+            },
+            headers=self.headers,
+        )
+
+        self.assertResponseNoErrors(response)
+
+        report = json.loads(response.content)["data"]["journalTurnaround"]
+        day = 86400
+
+        self.assertEqual(report["submitted"], 5)
+        self.assertEqual(report["decided"], 4)
+        self.assertAlmostEqual(
+            report["timeToFirstDecision"]["p50"], 2.5 * day, delta=60
+        )
+        self.assertAlmostEqual(
+            report["timeToFirstDecision"]["p95"], 3.85 * day, delta=60
+        )
+        self.assertEqual(len(report["stages"]), 1)
+        self.assertEqual(report["stages"][0]["stage"], "with line editor")
+        self.assertEqual(report["stages"][0]["transitions"], 5)
+
 
 class UpdateMemberPermissionMutation(GraphQLTestCase):
     GRAPHQL_URL = "http://localhost/graphql"
@@ -611,7 +1006,7 @@ class UpdateMemberPermissionMutation(GraphQLTestCase):
 
         cls.journal.assign_editor_role(cls.next_editor, EditorialMember.Role.SECTION)
 
-        cls.submission = JournalSubmission.objects.create(
+        cls.submission = submit_to_journal(
             stage="with line editor",
             author_submission=author_submission,
             journal=cls.journal,
@@ -676,6 +1071,66 @@ class UpdateMemberPermissionMutation(GraphQLTestCase):
             "with {}".format(next_handler.get_role_display()),
         )
 
+    def test_permission_checks_are_memoized_per_request(self):
+        request = RequestFactory().post(self.GRAPHQL_URL)
+        request.user = self.user
+
+        submission_id = str(self.submission.pk)
+        journal_id = str(self.journal.pk)
+
+        with self.assertNumQueries(3):
+            for _ in range(3):
+                self.assertTrue(get_permissions(request).has_group("editors"))
+                self.assertIn(journal_id, get_permissions(request).editor_journals)
+                self.assertTrue(handles_submission(request, submission_id))
+
+        get_permissions(request).clear()
+
+        with self.assertNumQueries(1):
+            self.assertTrue(handles_submission(request, submission_id))
+
+    def test_permission_masks_follow_permissions(self):
+        member = JournalSubmissionEditorialTeam.objects.get(pk=self.member.pk)
+        view_mask = permission_mask([JournalPermissionChoice.VIEW_SUBMISSIONS])
+        give_reports = self.journal.permissions.get(
+            code_name=JournalPermissionChoice.GIVE_REPORTS
+        )
+
+        self.assertEqual(member.permission_mask, view_mask | handling_mask)
+
+        member.permissions.remove(
+            *member.permissions.filter(code_name__in=handling_permissions)
+        )
+        member.refresh_from_db()
+        self.assertEqual(member.permission_mask, view_mask)
+
+        ## changes made from the permission's side are tracked as well
+        give_reports.journal_submission_roles.add(member)
+        member.refresh_from_db()
+        self.assertEqual(
+            member.permission_mask,
+            view_mask | permission_mask([JournalPermissionChoice.GIVE_REPORTS]),
+        )
+
+        give_reports.journal_submission_roles.clear()
+        member.refresh_from_db()
+        self.assertEqual(member.permission_mask, view_mask)
+
+        member.permissions.clear()
+        member.refresh_from_db()
+        self.assertEqual(member.permission_mask, 0)
+
+    def test_handling_permission_check_skips_permission_tables(self):
+        request = RequestFactory().post(self.GRAPHQL_URL)
+        request.user = self.user
+
+        with CaptureQueriesContext(connection) as queries:
+            self.assertTrue(handles_submission(request, str(self.submission.pk)))
+            self.assertTrue(handles_submission(request, str(self.submission.pk)))
+
+        self.assertEqual(len(queries), 1)
+        self.assertNotIn("journal_permissions", queries[0]["sql"])
+
 
 class CreateEditorReport(GraphQLTestCase):
     GRAPHQL_URL = "http://localhost/graphql"
@@ -689,7 +1144,7 @@ class CreateEditorReport(GraphQLTestCase):
             article_type=AuthorSubmission.ArticleType.RESEARCH_ARTICLE,
         )
 
-        cls.submission = JournalSubmission.objects.create(
+        cls.submission = submit_to_journal(
             stage="with line editor",
             author_submission=author_submission,
             journal=cls.journal,
@@ -753,7 +1208,7 @@ class CreateReviewerReport(GraphQLTestCase):
             article_type=AuthorSubmission.ArticleType.RESEARCH_ARTICLE,
         )
 
-        cls.submission = JournalSubmission.objects.create(
+        cls.submission = submit_to_journal(
             stage="with line editor",
             author_submission=author_submission,
             journal=cls.journal,
@@ -885,7 +1340,7 @@ class EditorQueryTest(GraphQLTestCase):
         )
 
     def test_query_a_submission(self):
-        submission = JournalSubmission.objects.create(
+        submission = submit_to_journal(
             **{
                 "stage": "with line editor",
                 "author_submission": mixer.blend(
@@ -987,6 +1442,184 @@ class EditorQueryTest(GraphQLTestCase):
             self.users[0].first_name,
         )
 
+    def test_query_all_submissions_selects_related_fields(self):
+        query = """
+            query GetSubmissions($journalId: ID!) {
+                journalSubmissions(journalId: $journalId) {
+                    edges {
+                        node {
+                            id
+                            stage
+                            authorSubmission {
+                                articleType
+                                user {
+                                    firstName
+                                }
+                            }
+                            editorialMembers {
+                                edges {
+                                    node {
+                                        role
+                                        editor {
+                                            affiliation
+                                            user {
+                                                firstName
+                                            }
+                                        }
+                                    }
+                                }
+                            }
+                            reviewers {
+                                edges {
+                                    node {
+                                        affiliation
+                                        user {
+                                            firstName
+                                        }
+                                    }
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+            """
+
+        editor = Editor.objects.create(
+            **{
+                "affiliation": "bayero university, kano",
+                "phone_number": "+2347037606119",
+                "user": self.user,
+            }
+        )
+
+        editor.journals.add(self.journal)
+        self.journal.make_editor_chief(editor)
+
+        def create_submissions(n):
+            for _ in range(n):
+                submission = submit_to_journal(
+                    stage="with line editor",
+                    author_submission=mixer.blend(
+                        AuthorSubmission,
+                        user=self.user,
+                        article_type=AuthorSubmission.ArticleType.RESEARCH_ARTICLE,
+                    ),
+                    journal=self.journal,
+                )
+                submission.reviewers.add(*self.reviewers)
+                submission.editorial_members.update(editor=self.editors[0])
+
+        def count_queries():
+            request = RequestFactory().post(self.GRAPHQL_URL)
+            request.user = self.user
+            variables = {"journalId": to_global_id(JournalType, self.journal.pk)}
+
+            with CaptureQueriesContext(connection) as queries:
+                result = graphene_settings.SCHEMA.execute(
+                    query, variable_values=variables, context_value=request
+                )
+
+            self.assertIsNone(result.errors)
+
+            return len(queries)
+
+        create_submissions(1)
+        n_queries = count_queries()
+
+        create_submissions(4)
+
+        self.assertEqual(count_queries(), n_queries)
+
+    def test_search_manuscripts(self):
+        editor = Editor.objects.create(
+            affiliation="bayero university, kano",
+            phone_number="+2347037606119",
+            user=self.user,
+        )
+        editor.journals.add(self.journal)
+        self.journal.make_editor_chief(editor)
+
+        abstract = mixer.blend(ArticleTypeSection, name="abstract")
+
+        def create_manuscript(title, content, journal=None, submitted=True):
+            manuscript = mixer.blend(
+                Manuscript, title=title, journal=journal or self.journal
+            )
+            ManuscriptSection.objects.create(
+                manuscript=manuscript,
+                section=abstract,
+                content=json.dumps(
+                    [{"type": "paragraph", "children": [{"text": content}]}]
+                ),
+            )
+            author_submission = mixer.blend(
+                AuthorSubmission, user=self.user, manuscript=manuscript
+            )
+
+            if submitted:
+                submit_to_journal(author_submission, manuscript.journal)
+
+            return manuscript
+
+        titled = create_manuscript(
+            "Leaf mimicry in Boquila trifoliolata", "vines grown in a greenhouse"
+        )
+        mentioned = create_manuscript(
+            "Vision in climbing plants", "leaf mimicry of the climbing vines"
+        )
+        create_manuscript("Soil bacteria", "nitrogen fixation in legumes")
+        create_manuscript("Leaf mimicry drafts", "not submitted", submitted=False)
+        create_manuscript(
+            "Leaf mimicry elsewhere",
+            "another journal",
+            journal=mixer.blend(Journal, discipline=self.journal.discipline),
+        )
+
+        response = self.query(
+            """
+            query SearchManuscripts($query: String!, $journalId: ID!) {
+                searchManuscripts(query: $query, journalId: $journalId) {
+                    edges {
+                        node {
+                            id
+                            title
+                            rank
+                            headline
+                        }
+                    }
+                }
+            }
+            """,
+            operation_name="SearchManuscripts",
+            variables={
+                "query": "leaf mimicry",
+                "journalId": to_global_id(JournalType, self.journal.pk),
+            },
+            headers=self.headers,
+        )
+
+        self.assertResponseNoErrors(response)
+
+        edges = json.loads(response.content)["data"]["searchManuscripts"]["edges"]
+
+        self.assertEqual(
+            [edge["node"]["title"] for edge in edges],
+            [titled.title, mentioned.title],
+        )
+        self.assertGreater(edges[0]["node"]["rank"], edges[1]["node"]["rank"])
+        self.assertIn("<mark>mimicry</mark>", edges[0]["node"]["headline"])
+
+        ## a title edit is searchable right away
+        mentioned.title = "Plant vision and leaf mimicry"
+        mentioned.save()
+
+        self.assertTrue(
+            search_manuscripts(Manuscript.objects.all(), "vision")
+            .filter(pk=mentioned.pk)
+            .exists()
+        )
+
 
 class ReviewerQuery(GraphQLTestCase):
     GRAPHQL_URL = "http://localhost/graphql"
@@ -1001,7 +1634,7 @@ class ReviewerQuery(GraphQLTestCase):
         cls.reviewer_1.journals.add(cls.journal)
         cls.reviewer_2.journals.add(cls.journal)
 
-        initial_submission = JournalSubmission.objects.create(
+        initial_submission = submit_to_journal(
             stage="with line editor",
             author_submission=mixer.blend(
                 AuthorSubmission,
@@ -0,0 +1,151 @@
+from datetime import datetime, time, timedelta
+
+from django.db.models import Count, DurationField, Q
+from django.utils import timezone
+from graphql import GraphQLError
+
+from Cores.aggregates import PercentileCont
+from Journals.analytics import MAX_ANALYTICS_DAYS
+
+from .models import JournalSubmission, SubmissionStageEvent
+
+Kind = SubmissionStageEvent.Kind
+
+DECISIONS = (Kind.ACCEPTED, Kind.REJECTED)
+
+## percentiles of the turnaround report, by name
+PERCENTILES = {"p50": 0.5, "p95": 0.95}
+
+
+def record_stage_event(journal_submission, kind, from_stage=None):
+    """
+    Append an event of the submission entering its current stage from
+    from_stage or receiving a decision in it, with the time it spent in the
+    stage it leaves. The time to the submission's first decision is kept on
+    the submission.
+    """
+    if kind == Kind.SUBMITTED:
+        from_stage = ""
+        now = entered = journal_submission.created_at
+    else:
+        if from_stage is None:
+            from_stage = journal_submission.stage
+
+        now = timezone.now()
+        entered = (
+            journal_submission.stage_events.order_by("-created_at")
+            .values_list("created_at", flat=True)
+            .first()
+        ) or journal_submission.created_at
+
+    elapsed = now - journal_submission.created_at
+
+    event = SubmissionStageEvent.objects.create(
+        journal_submission=journal_submission,
+        journal_id=journal_submission.journal_id,
+        kind=kind,
+        from_stage=from_stage,
+        stage=journal_submission.stage,
+        time_in_stage=None if kind == Kind.SUBMITTED else now - entered,
+        elapsed=elapsed,
+        created_at=now,
+    )
+
+    if kind in DECISIONS:
+        ## later decisions leave the first one's time as it is
+        if JournalSubmission.objects.filter(
+            pk=journal_submission.pk, time_to_first_decision__isnull=True
+        ).update(time_to_first_decision=elapsed):
+            journal_submission.time_to_first_decision = elapsed
+
+    return event
+
+
+def day_start(day):
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+
+def percentiles(durations):
+    """
+    Named percentiles in seconds of the durations computed by PercentileCont
+    """
+    durations = durations or [None] * len(PERCENTILES)
+
+    return {
+        name: duration.total_seconds() if duration is not None else None
+        for name, duration in zip(PERCENTILES, durations)
+    }
+
+
+def turnaround_report(journal_ids, start, end):
+    """
+    Percentiles of the time to first decision of the journals' submissions
+    submitted between start and end included, and of the time spent in
+    each stage by the submissions which left it in that range. Each is
+    computed for all the journals by one grouped query.
+    """
+    if end < start:
+        raise GraphQLError("the range ends before it starts")
+
+    if (end - start).days >= MAX_ANALYTICS_DAYS:
+        raise GraphQLError(
+            "the range covers more than {0} days".format(MAX_ANALYTICS_DAYS)
+        )
+
+    journal_ids = list(journal_ids)
+    bounds = {
+        "created_at__gte": day_start(start),
+        "created_at__lt": day_start(end + timedelta(days=1)),
+    }
+    fractions = list(PERCENTILES.values())
+
+    report = {
+        journal_id: {
+            "submitted": 0,
+            "decided": 0,
+            "time_to_first_decision": percentiles(None),
+            "stages": [],
+        }
+        for journal_id in journal_ids
+    }
+
+    for row in (
+        JournalSubmission.objects.filter(journal__in=journal_ids, **bounds)
+        .order_by()
+        .values("journal_id")
+        .annotate(
+            submitted=Count("pk"),
+            decided=Count("pk", filter=Q(time_to_first_decision__isnull=False)),
+            durations=PercentileCont(
+                "time_to_first_decision", fractions, output_field=DurationField()
+            ),
+        )
+    ):
+        report[row["journal_id"]].update(
+            submitted=row["submitted"],
+            decided=row["decided"],
+            time_to_first_decision=percentiles(row["durations"]),
+        )
+
+    for row in (
+        SubmissionStageEvent.objects.filter(
+            journal__in=journal_ids, time_in_stage__isnull=False, **bounds
+        )
+        .order_by("journal_id", "from_stage")
+        .values("journal_id", "from_stage")
+        .annotate(
+            transitions=Count("pk"),
+            durations=PercentileCont(
+                "time_in_stage", fractions, output_field=DurationField()
+            ),
+        )
+    ):
+        report[row["journal_id"]]["stages"].append(
+            {
+                "stage": row["from_stage"],
+                "transitions": row["transitions"],
+                "time_in_stage": percentiles(row["durations"]),
+            }
+        )
+
+    return report
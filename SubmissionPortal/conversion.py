@@ -0,0 +1,141 @@
+import logging
+import os
+import subprocess
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from datetime import timedelta
+from pathlib import Path
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from .models import SubmissionFile
+
+logger = logging.getLogger(__name__)
+
+## word processor documents rendered to PDF for the reviewers
+CONVERTIBLE_SUFFIXES = (".doc", ".docx", ".odt", ".rtf")
+
+## seconds a single document may take to convert
+CONVERSION_TIMEOUT = 120
+
+## a claimed file is claimed again after this time, its worker stopped
+CLAIM_TIMEOUT = timedelta(hours=1)
+
+## a file whose worker stopped on every claim is failed after this many
+MAX_CONVERSION_ATTEMPTS = 3
+
+
+def is_convertible(file_name):
+    return Path(file_name).suffix.lower() in CONVERTIBLE_SUFFIXES
+
+
+def convert_to_pdf(source, binary="soffice"):
+    """
+    Convert a document to a PDF next to it with a headless office suite
+    and return the path of the PDF
+    """
+    source = Path(source)
+    target = source.with_name("{0}_converted.pdf".format(source.stem))
+
+    ## every conversion gets its own profile, concurrent instances
+    ## sharing one profile refuse to start
+    with tempfile.TemporaryDirectory() as workdir:
+        subprocess.run(
+            [
+                binary,
+                "-env:UserInstallation=file://{0}".format(workdir),
+                "--headless",
+                "--convert-to",
+                "pdf",
+                "--outdir",
+                workdir,
+                str(source),
+            ],
+            check=True,
+            capture_output=True,
+            timeout=CONVERSION_TIMEOUT,
+        )
+
+        os.replace(Path(workdir) / "{0}.pdf".format(source.stem), target)
+
+    return str(target)
+
+
+def claim_pending_files(batch_size):
+    """
+    Mark a batch of pending files, and of files whose claim expired, as
+    processing and return them. The claim is committed at once, other
+    workers skip the claimed files without a lock held while converting.
+    Each claim counts as an attempt, an expired claim of a file attempted
+    MAX_CONVERSION_ATTEMPTS times fails the file instead.
+    """
+    now = timezone.now()
+    expired = Q(
+        conversion_status=SubmissionFile.ConversionStatus.PROCESSING,
+        conversion_claimed_at__lt=now - CLAIM_TIMEOUT,
+    )
+
+    with transaction.atomic():
+        abandoned = SubmissionFile.objects.filter(
+            expired, conversion_attempts__gte=MAX_CONVERSION_ATTEMPTS
+        ).update(conversion_status=SubmissionFile.ConversionStatus.FAILED)
+
+        if abandoned:
+            logger.error("gave up converting %d submission files", abandoned)
+
+        files = list(
+            SubmissionFile.objects.select_for_update(skip_locked=True)
+            .filter(
+                Q(conversion_status=SubmissionFile.ConversionStatus.PENDING) | expired
+            )
+            .order_by("created_at")
+            .only("pk", "file")[:batch_size]
+        )
+
+        SubmissionFile.objects.filter(pk__in=[f.pk for f in files]).update(
+            conversion_status=SubmissionFile.ConversionStatus.PROCESSING,
+            conversion_claimed_at=now,
+            conversion_attempts=F("conversion_attempts") + 1,
+        )
+
+    return files
+
+
+def convert_pending_files(workers=2, batch_size=10):
+    """
+    Convert a batch of pending submission files in a bounded pool of
+    processes and return the number of files processed. The batch is
+    claimed beforehand, so several workers can run side by side, and the
+    outcome of each file is recorded as soon as it is known.
+    """
+    files = claim_pending_files(batch_size)
+
+    if not files:
+        return 0
+
+    binary = getattr(settings, "DOCUMENT_CONVERTER_BINARY", "soffice")
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(convert_to_pdf, f.file.path, binary) for f in files]
+
+        for submission_file, future in zip(files, futures):
+            try:
+                target = future.result()
+            except Exception:
+                ## a broken pool fails the files it had not converted yet
+                logger.exception(
+                    "could not convert submission file %s", submission_file.pk
+                )
+                outcome = {"conversion_status": SubmissionFile.ConversionStatus.FAILED}
+            else:
+                outcome = {
+                    "converted_file": os.path.relpath(target, settings.MEDIA_ROOT),
+                    "conversion_status": SubmissionFile.ConversionStatus.CONVERTED,
+                }
+
+            SubmissionFile.objects.filter(pk=submission_file.pk).update(**outcome)
+
+    return len(files)
@@ -0,0 +1,37 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from SubmissionPortal.conversion import convert_pending_files
+
+
+class Command(BaseCommand):
+    help = "Convert the pending submission files to PDF"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--workers", type=int, default=2)
+        parser.add_argument("--batch-size", type=int, default=10)
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=5,
+            help="seconds to wait when no file is pending",
+        )
+        parser.add_argument(
+            "--once", action="store_true", help="convert the pending files and exit"
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+
+        while True:
+            converted = convert_pending_files(options["workers"], batch_size)
+
+            if converted:
+                self.stdout.write("processed {0} files".format(converted))
+
+            if options["once"] and converted < batch_size:
+                break
+
+            if converted < batch_size:
+                time.sleep(options["interval"])
@@ -0,0 +1,27 @@
+# Generated by Django 4.0.3 on 2026-10-18 11:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('SubmissionPortal', '0003_authorsubmission_author_submission_page_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='submissionfile',
+            name='conversion_status',
+            field=models.PositiveSmallIntegerField(blank=True, choices=[(1, 'pending'), (2, 'converted'), (3, 'failed')], null=True, verbose_name='conversion status'),
+        ),
+        migrations.AddField(
+            model_name='submissionfile',
+            name='converted_file',
+            field=models.FileField(blank=True, max_length=255, null=True, upload_to='', verbose_name='converted file'),
+        ),
+        migrations.AddIndex(
+            model_name='submissionfile',
+            index=models.Index(condition=models.Q(('conversion_status', 1)), fields=['created_at'], name='pending_conversion_idx'),
+        ),
+    ]
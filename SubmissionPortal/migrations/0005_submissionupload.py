@@ -0,0 +1,34 @@
+# Generated by Django 4.0.3 on 2026-10-18 11:35
+
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('SubmissionPortal', '0004_submissionfile_conversion_status_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SubmissionUpload',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('file_type', models.PositiveIntegerField(choices=[(1, 'cover letter'), (2, 'manuscript'), (3, 'supplementary data')], verbose_name='file type')),
+                ('file_name', models.CharField(max_length=255, verbose_name='file name')),
+                ('size', models.PositiveBigIntegerField(verbose_name='size')),
+                ('offset', models.PositiveBigIntegerField(default=0, verbose_name='offset')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('author_submission', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='uploads', to='SubmissionPortal.authorsubmission')),
+            ],
+            options={
+                'verbose_name': 'submission_upload',
+                'verbose_name_plural': 'submission_uploads',
+                'db_table': 'author_submission_uploads',
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
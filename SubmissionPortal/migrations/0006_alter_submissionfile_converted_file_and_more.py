@@ -0,0 +1,25 @@
+# Generated by Django 4.0.3 on 2026-10-18 11:37
+
+import Cores.storage
+import SubmissionPortal.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('SubmissionPortal', '0005_submissionupload'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='submissionfile',
+            name='converted_file',
+            field=models.FileField(blank=True, max_length=255, null=True, storage=Cores.storage.ContentAddressedStorage(), upload_to='', verbose_name='converted file'),
+        ),
+        migrations.AlterField(
+            model_name='submissionfile',
+            name='file',
+            field=models.FileField(max_length=255, storage=Cores.storage.ContentAddressedStorage(), upload_to=SubmissionPortal.models.SubmissionFile.file_path, verbose_name='file'),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 4.0.3 on 2026-10-18 12:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('SubmissionPortal', '0006_alter_submissionfile_converted_file_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='submissionfile',
+            name='conversion_claimed_at',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='conversion claimed at'),
+        ),
+        migrations.AlterField(
+            model_name='submissionfile',
+            name='conversion_status',
+            field=models.PositiveSmallIntegerField(blank=True, choices=[(1, 'pending'), (2, 'converted'), (3, 'failed'), (4, 'processing')], null=True, verbose_name='conversion status'),
+        ),
+        migrations.AddIndex(
+            model_name='submissionfile',
+            index=models.Index(condition=models.Q(('conversion_status', 4)), fields=['conversion_claimed_at'], name='processing_conversion_idx'),
+        ),
+    ]
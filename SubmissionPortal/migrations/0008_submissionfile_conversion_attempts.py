@@ -0,0 +1,18 @@
+# Generated by Django 4.0.3 on 2026-10-18 12:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('SubmissionPortal', '0007_submissionfile_conversion_claim'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='submissionfile',
+            name='conversion_attempts',
+            field=models.PositiveSmallIntegerField(default=0, verbose_name='conversion attempts'),
+        ),
+    ]
@@ -1,3 +1,4 @@
+import os
 import uuid
 
 from django.conf import settings
@@ -5,6 +6,7 @@ from django.db import models
 from django.utils.translation import gettext_lazy as _
 
 from Cores.models import TermOfService
+from Cores.storage import content_addressed_storage
 from Contents.models import Manuscript
 
 # Create your models here.
@@ -29,6 +31,12 @@ class AuthorSubmission(models.Model):
         verbose_name_plural = _("submissions")
         ordering = ["-created_at"]
         db_table = "author_submissions"
+        indexes = [
+            models.Index(
+                fields=["user", "-created_at", "-id"],
+                name="author_submission_page_idx",
+            )
+        ]
 
 
 class SubmissionStatus(models.Model):
@@ -71,12 +79,44 @@ class SubmissionFile(models.Model):
         MANUSCRIPT = 2, _("manuscript")
         SUPPLEMENTARY_DATA = 3, _("supplementary data")
 
+    class ConversionStatus(models.IntegerChoices):
+        PENDING = 1, _("pending")
+        CONVERTED = 2, _("converted")
+        FAILED = 3, _("failed")
+        PROCESSING = 4, _("processing")
+
     author_submission = models.ForeignKey(
         AuthorSubmission, related_name="files", on_delete=models.CASCADE
     )
     version = models.PositiveIntegerField(_("version"), blank=True, default=1)
     file_type = models.PositiveIntegerField(_("file type"), choices=FileType.choices)
-    file = models.FileField(_("file"), max_length=255, upload_to=file_path)
+    file = models.FileField(
+        _("file"),
+        max_length=255,
+        upload_to=file_path,
+        storage=content_addressed_storage,
+    )
+    ## PDF rendition of word processor documents, written next to the file
+    converted_file = models.FileField(
+        _("converted file"),
+        max_length=255,
+        blank=True,
+        null=True,
+        storage=content_addressed_storage,
+    )
+    conversion_status = models.PositiveSmallIntegerField(
+        _("conversion status"),
+        choices=ConversionStatus.choices,
+        blank=True,
+        null=True,
+    )
+    ## when a conversion worker claimed the file, see SubmissionPortal.conversion
+    conversion_claimed_at = models.DateTimeField(
+        _("conversion claimed at"), blank=True, null=True
+    )
+    conversion_attempts = models.PositiveSmallIntegerField(
+        _("conversion attempts"), default=0
+    )
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
@@ -84,11 +124,58 @@ class SubmissionFile(models.Model):
         verbose_name_plural = _("submission_files")
         ordering = ["-created_at"]
         db_table = "author_submission_files"
+        indexes = [
+            models.Index(
+                fields=["created_at"],
+                name="pending_conversion_idx",
+                condition=models.Q(conversion_status=1),
+            ),
+            models.Index(
+                fields=["conversion_claimed_at"],
+                name="processing_conversion_idx",
+                condition=models.Q(conversion_status=4),
+            ),
+        ]
 
     def __str__(self) -> str:
         return self.file_type
 
 
+class SubmissionUpload(models.Model):
+    """
+    A resumable upload of a submission file, received in chunks
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    author_submission = models.ForeignKey(
+        AuthorSubmission, related_name="uploads", on_delete=models.CASCADE
+    )
+    file_type = models.PositiveIntegerField(
+        _("file type"), choices=SubmissionFile.FileType.choices
+    )
+    file_name = models.CharField(_("file name"), max_length=255)
+    size = models.PositiveBigIntegerField(_("size"))
+    offset = models.PositiveBigIntegerField(_("offset"), default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = _("submission_upload")
+        verbose_name_plural = _("submission_uploads")
+        ordering = ["-created_at"]
+        db_table = "author_submission_uploads"
+
+    def __str__(self) -> str:
+        return self.file_name
+
+    @property
+    def path(self):
+        """
+        Where the received chunks are assembled
+        """
+        return os.path.join(settings.MEDIA_ROOT, "uploads", str(self.pk))
+
+
 # users agreement before manuscript submission
 class SubmissionConditionAgreement(models.Model):
     class ResponseType(models.IntegerChoices):
@@ -1,6 +1,9 @@
 import json
 import graphene
 
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
 from graphql import GraphQLError
 from graphene_file_upload.scalars import Upload
 from graphql_jwt.decorators import login_required
@@ -12,7 +15,9 @@ from Contents.models import (
     ManuscriptSection,
 )
 
+from Contents.search import update_search_vectors
 from Cores.models import ArticleTypeSection, TermOfService
+from Cores.reference import reference_in_bulk
 from Journals.models import Journal, JournalSubjectArea
 
 from .nodes import SubmissionNode
@@ -23,10 +28,241 @@ from .input_types import (
     UpdateAuthorInput,
     UpdateStatementInput,
 )
-from .models import AuthorSubmission, SubmissionConditionAgreement, SubmissionFile
+from .models import (
+    AuthorSubmission,
+    SubmissionConditionAgreement,
+    SubmissionFile,
+    SubmissionUpload,
+)
+from .uploads import UploadError, finalize_upload
 from .utils import cast
 
 
+def get_article_sections(sections):
+    """
+    Fetch the article type sections of the input sections in one query,
+    keyed by their decoded ids
+    """
+    ids = {from_global_id(section.get("section_id")).id for section in sections}
+    article_sections = {
+        str(pk): section
+        for pk, section in reference_in_bulk(ArticleTypeSection, ids).items()
+    }
+
+    if len(article_sections) != len(ids):
+        raise GraphQLError("article type section does not exist")
+
+    return article_sections
+
+
+## the actions an author input may ask for
+AUTHOR_ACTIONS = ("create", "update", "delete")
+
+
+def section_content(content):
+    return json.dumps([{"type": "paragraph", "children": [{"text": content}]}])
+
+
+def sync_sections(manuscript, sections, delete_missing=False):
+    """
+    Create and update the manuscript's sections to match the input sections,
+    keyed by their article type section. With delete_missing the sections
+    absent from the input are deleted.
+    """
+    article_sections = get_article_sections(sections)
+    contents = {}
+
+    for section in sections:
+        section_id = from_global_id(section.get("section_id")).id
+
+        if section_id in contents:
+            raise GraphQLError(
+                "section {0} is listed twice".format(section.get("section_name"))
+            )
+
+        contents[section_id] = section_content(section.get("content"))
+    existing = {
+        str(section.section_id): section for section in manuscript.sections.all()
+    }
+
+    to_create, to_update = [], []
+
+    for section_id, content in contents.items():
+        section = existing.get(section_id)
+
+        if section is None:
+            to_create.append(
+                ManuscriptSection(
+                    manuscript=manuscript,
+                    section=article_sections[section_id],
+                    content=content,
+                )
+            )
+        elif section.content != content:
+            section.content = content
+            to_update.append(section)
+
+    stale = [
+        section.pk
+        for section_id, section in existing.items()
+        if section_id not in contents
+    ]
+
+    if delete_missing and stale:
+        ManuscriptSection.objects.filter(pk__in=stale).delete()
+
+    if to_update:
+        ManuscriptSection.objects.bulk_update(to_update, ["content"])
+
+    if to_create:
+        ManuscriptSection.objects.bulk_create(to_create)
+
+    update_search_vectors([manuscript.pk])
+
+
+def sync_authors(manuscript, authors):
+    """
+    Apply the create, update and delete actions of the input authors to the
+    manuscript's authors with one statement per action. The resulting authors
+    are checked against the unique (rank, email) constraint beforehand.
+    """
+    existing = {str(author.pk): author for author in manuscript.authors.all()}
+
+    to_create, to_update, to_delete = [], {}, set()
+    fields = set()
+
+    for author in authors:
+        if author["action"] not in AUTHOR_ACTIONS:
+            raise GraphQLError("unknown author action {0}".format(author["action"]))
+
+        values = {k: v for k, v in author.items() if k not in ("action", "id")}
+
+        if author["action"] == "create":
+            to_create.append(ManuscriptAuthor(manuscript=manuscript, **values))
+            continue
+
+        if not author.get("id"):
+            raise GraphQLError("author id is required")
+
+        author_id = from_global_id(author["id"]).id
+
+        if author_id not in existing:
+            raise GraphQLError("author does not exist")
+
+        if author["action"] == "update":
+            author_model = existing[author_id]
+
+            for key, value in values.items():
+                setattr(author_model, key, value)
+
+            fields.update(values)
+            to_update[author_id] = author_model
+        elif author["action"] == "delete":
+            to_delete.add(author_id)
+
+    remaining = [
+        author for author_id, author in existing.items() if author_id not in to_delete
+    ]
+    seen = set()
+
+    for author in remaining + to_create:
+        key = (author.rank, author.email)
+
+        if key in seen:
+            raise GraphQLError(
+                "author {0} is listed twice with rank {1}".format(
+                    author.email, author.rank
+                )
+            )
+
+        seen.add(key)
+
+    to_update = [
+        author for author_id, author in to_update.items() if author_id not in to_delete
+    ]
+
+    with transaction.atomic():
+        if to_delete:
+            ManuscriptAuthor.objects.filter(pk__in=to_delete).delete()
+
+        if to_update:
+            ManuscriptAuthor.objects.bulk_update(to_update, sorted(fields))
+
+        if to_create:
+            ManuscriptAuthor.objects.bulk_create(to_create)
+
+        update_search_vectors([manuscript.pk])
+
+
+def sync_agreements(submission, statements):
+    """
+    Upsert the submission's agreements from the input statements and return
+    them in input order. A statement updates the agreement with its id when
+    given, otherwise the submission's agreement to the same term, and creates
+    an agreement when there is none.
+    """
+    term_ids = {from_global_id(statement["term_id"]).id for statement in statements}
+    agreement_ids = {
+        from_global_id(statement["id"]).id
+        for statement in statements
+        if statement.get("id")
+    }
+
+    terms = {
+        str(pk): term for pk, term in reference_in_bulk(TermOfService, term_ids).items()
+    }
+
+    if len(terms) != len(term_ids):
+        raise GraphQLError("term of service does not exist")
+
+    existing = submission.agreements.filter(
+        Q(pk__in=agreement_ids) | Q(term__in=term_ids)
+    )
+    by_id = {str(agreement.pk): agreement for agreement in existing}
+    by_term = {str(agreement.term_id): agreement for agreement in by_id.values()}
+
+    agreements, to_create, to_update = [], [], {}
+    listed = set()
+
+    for statement in statements:
+        term_id = from_global_id(statement["term_id"]).id
+
+        if statement.get("id"):
+            agreement = by_id.get(from_global_id(statement["id"]).id)
+
+            if agreement is None:
+                raise GraphQLError("submission agreement does not exist")
+        else:
+            agreement = by_term.get(term_id)
+
+        if agreement is not None and id(agreement) in listed:
+            raise GraphQLError("submission agreement is listed twice")
+
+        if agreement is None:
+            agreement = SubmissionConditionAgreement(author_submission=submission)
+            by_term[term_id] = agreement
+            to_create.append(agreement)
+        elif agreement.pk:
+            to_update[agreement.pk] = agreement
+
+        agreement.term = terms[term_id]
+        agreement.response = cast(statement.get("response"))
+        agreement.statement = statement.get("statement", None)
+        agreements.append(agreement)
+        listed.add(id(agreement))
+
+    with transaction.atomic():
+        if to_update:
+            SubmissionConditionAgreement.objects.bulk_update(
+                to_update.values(), ["term", "response", "statement"]
+            )
+
+        if to_create:
+            SubmissionConditionAgreement.objects.bulk_create(to_create)
+
+    return agreements
+
+
 class CreateSubmissionMutation(graphene.relay.ClientIDMutation):
     message = graphene.String()
     submission = graphene.Field(SubmissionNode)
@@ -56,41 +292,35 @@ class CreateSubmissionMutation(graphene.relay.ClientIDMutation):
             subject = JournalSubjectArea.objects.get(name=subject_area)
 
         journal = Journal.objects.get(name=journal_name)
+        article_sections = get_article_sections(sections)
+
+        with transaction.atomic():
+            manuscript = Manuscript.objects.create(
+                title=title,
+                journal=journal,
+                subject_area=subject,
+                word_count=word_count,
+            )
 
-        manuscript = Manuscript.objects.create(
-            title=title,
-            journal=journal,
-            subject_area=subject,
-            word_count=word_count,
-        )
-
-        get_article_section = lambda id: ArticleTypeSection.objects.get(
-            pk=from_global_id(id).id
-        )
-
-        ManuscriptSection.objects.bulk_create(
-            [
-                ManuscriptSection(
-                    section=get_article_section(section.get("section_id")),
-                    content=json.dumps(
-                        [
-                            {
-                                "type": "paragraph",
-                                "children": [{"text": section.get("content")}],
-                            }
-                        ]
-                    ),
-                    manuscript=manuscript,
-                )
-                for section in sections
-            ]
-        )
+            ManuscriptSection.objects.bulk_create(
+                [
+                    ManuscriptSection(
+                        section=article_sections[
+                            from_global_id(section.get("section_id")).id
+                        ],
+                        content=section_content(section.get("content")),
+                        manuscript=manuscript,
+                    )
+                    for section in sections
+                ]
+            )
+            update_search_vectors([manuscript.pk])
 
-        submission = AuthorSubmission.objects.create(
-            user=info.context.user,
-            article_type=article_type,
-            manuscript=manuscript,
-        )
+            submission = AuthorSubmission.objects.create(
+                user=info.context.user,
+                article_type=article_type,
+                manuscript=manuscript,
+            )
 
         return CreateSubmissionMutation(message="success", submission=submission)
 
@@ -120,6 +350,7 @@ class CreateAuthorMutation(graphene.relay.ClientIDMutation):
         authors = ManuscriptAuthor.objects.bulk_create(
             [ManuscriptAuthor(manuscript=manuscript, **author) for author in authors]
         )
+        update_search_vectors([manuscript.pk])
 
         message = "success" if authors else "failed"
         submission = user.submissions.get(pk=from_global_id(submission_id).id)
@@ -160,6 +391,77 @@ class SubmissionUploadMutation(graphene.Mutation):
         return SubmissionUploadMutation(message=message, submission=submission)
 
 
+class InitiateSubmissionUploadMutation(graphene.relay.ClientIDMutation):
+    """
+    Start a resumable upload of a submission file, the chunks are sent
+    to /uploads/<upload_id>
+    """
+
+    message = graphene.String()
+    upload_id = graphene.UUID()
+    offset = graphene.Float()
+
+    class Input:
+        submission_id = graphene.ID(required=True)
+        type = graphene.Enum.from_enum(SubmissionFile.FileType)(required=True)
+        file_name = graphene.String(required=True)
+        size = graphene.Float(required=True)
+
+    @classmethod
+    @login_required
+    def mutate(cls, root, info, input):
+        submission_id = input.get("submission_id")
+        size = int(input.get("size"))
+
+        if size <= 0 or size > settings.MAX_SUBMISSION_UPLOAD_SIZE:
+            raise GraphQLError("invalid file size")
+
+        user = info.context.user
+        submission = user.submissions.get(pk=from_global_id(submission_id).id)
+
+        upload = SubmissionUpload.objects.create(
+            author_submission=submission,
+            file_type=input.get("type"),
+            file_name=input.get("file_name"),
+            size=size,
+        )
+
+        return InitiateSubmissionUploadMutation(
+            message="success", upload_id=upload.pk, offset=upload.offset
+        )
+
+
+class FinalizeSubmissionUploadMutation(graphene.relay.ClientIDMutation):
+    """
+    Attach a completely received upload to the submission, optionally
+    verifying the SHA-256 checksum of the file
+    """
+
+    message = graphene.String()
+    submission = graphene.Field(SubmissionNode)
+
+    class Input:
+        upload_id = graphene.UUID(required=True)
+        checksum = graphene.String()
+
+    @classmethod
+    @login_required
+    def mutate(cls, root, info, input):
+        user = info.context.user
+        upload = SubmissionUpload.objects.select_related("author_submission").get(
+            pk=input.get("upload_id"), author_submission__user__pk=user.pk
+        )
+
+        try:
+            finalize_upload(upload, input.get("checksum", None))
+        except UploadError as e:
+            raise GraphQLError(str(e))
+
+        return FinalizeSubmissionUploadMutation(
+            message="success", submission=upload.author_submission
+        )
+
+
 class CreateStatementMutation(graphene.relay.ClientIDMutation):
     """
     Create manuscript submissions statements
@@ -181,23 +483,7 @@ class CreateStatementMutation(graphene.relay.ClientIDMutation):
         user = info.context.user
         submission = user.submissions.get(pk=from_global_id(submission_id).id)
 
-        terms_qs = TermOfService.objects.filter(
-            pk__in=[from_global_id(statement["term_id"]).id for statement in statements]
-        )
-
-        condition = SubmissionConditionAgreement.objects.bulk_create(
-            [
-                SubmissionConditionAgreement(
-                    **{
-                        "author_submission": submission,
-                        "term": terms_qs[i],
-                        "response": cast(statement.get("response")),
-                        "statement": statement.get("statement", None),
-                    }
-                )
-                for i, statement in enumerate(statements)
-            ]
-        )
+        condition = sync_agreements(submission, statements)
 
         message = "success" if condition else "failed"
 
@@ -246,36 +532,8 @@ class UpdateAuthorSubmissionMutation(graphene.relay.ClientIDMutation):
             subject = JournalSubjectArea.objects.get(name=subject_area)
             manuscript.subject_area = subject
 
-        if article_type:
-            submission.article_type = article_type
-            submission.save()
-
-            if sections is None:
-                raise GraphQLError("manuscript sections are missing")
-
-            manuscript.sections.delete()
-
-            get_article_section = lambda id: ArticleTypeSection.objects.get(
-                pk=from_global_id(id).id
-            )
-
-            ManuscriptSection.objects.bulk_create(
-                [
-                    ManuscriptSection(
-                        section=get_article_section(section.get("section_id")),
-                        content=json.dumps(
-                            [
-                                {
-                                    "type": "paragraph",
-                                    "children": [{"text": section.get("content")}],
-                                }
-                            ]
-                        ),
-                        manuscript=manuscript,
-                    )
-                    for section in sections
-                ]
-            )
+        if article_type and sections is None:
+            raise GraphQLError("manuscript sections are missing")
 
         if journal_name:
             journal = Journal.objects.get(name=journal_name)
@@ -287,16 +545,16 @@ class UpdateAuthorSubmissionMutation(graphene.relay.ClientIDMutation):
         if title:
             manuscript.title = title
 
-        manuscript.save()
+        with transaction.atomic():
+            if article_type:
+                submission.article_type = article_type
+                submission.save()
 
-        if sections:
-            sections_qs = manuscript.sections.all()
+            manuscript.save()
 
-            for section in sections:
-                for section_qs in sections_qs:
-                    if section_qs.section.name == section.get("section_name"):
-                        section_qs.content = section.get("content")
-                        section_qs.save()
+            ## the sections of the previous article type are dropped
+            if sections:
+                sync_sections(manuscript, sections, delete_missing=bool(article_type))
 
         return CreateSubmissionMutation(message="success", submission=submission)
 
@@ -326,25 +584,7 @@ class UpdateAuthorMutation(graphene.relay.ClientIDMutation):
         )
 
         if authors:
-            for author in authors:
-                if author["action"] == "create":
-                    author.pop("action")
-                    manuscript.authors.create(manuscript=manuscript, **author)
-                elif author["action"] == "update" and "id" in author and author["id"]:
-                    author_model = manuscript.authors.get(
-                        pk=from_global_id(author["id"]).id
-                    )
-
-                    for key, value in author.items():
-                        if key not in ("action", "id"):
-                            setattr(author_model, key, value)
-
-                    author_model.save()
-                else:
-                    author_model = manuscript.authors.get(
-                        pk=from_global_id(author["id"]).id
-                    )
-                    author_model.delete()
+            sync_authors(manuscript, authors)
 
         submission = AuthorSubmission.objects.get(pk=from_global_id(submission_id).id)
 
@@ -372,22 +612,8 @@ class UpdateStatementMutation(graphene.relay.ClientIDMutation):
         user = info.context.user
         submission = user.submissions.get(pk=from_global_id(submission_id).id)
 
-        terms_qs = TermOfService.objects.filter(
-            pk__in=map(lambda s: from_global_id(s["term_id"]).id, statements)
-        )
-
-        conditions_qs = SubmissionConditionAgreement.objects.filter(
-            pk__in=map(lambda s: from_global_id(s["id"]).id, statements)
-        )
-
-        for i, statement in enumerate(statements):
-            instance = conditions_qs[i]
-
-            instance.statement = statement.get("statement", None)
-            instance.response = cast(statement.get("response"))
-            instance.term = terms_qs[i]
-
-            instance.save()
+        if statements:
+            sync_agreements(submission, statements)
 
         return UpdateStatementMutation(message="success", submission=submission)
 
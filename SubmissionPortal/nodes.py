@@ -2,6 +2,9 @@ import graphene
 
 from graphene_django import DjangoObjectType
 
+from Cores.fields import CountableConnection
+from Cores.loaders import load_related
+
 from .models import (
     AuthorSubmission,
     SubmissionConditionAgreement,
@@ -27,8 +30,24 @@ class SubmissionNode(DjangoObjectType):
             "article_type",
         )
         interfaces = (graphene.relay.Node,)
+        connection_class = CountableConnection
         convert_choices_to_enum = False
 
+    def resolve_user(self, info):
+        return load_related(info, self, "user")
+
+    def resolve_manuscript(self, info):
+        return load_related(info, self, "manuscript")
+
+    def resolve_agreements(self, info, **kwargs):
+        return load_related(info, self, "agreements")
+
+    def resolve_status(self, info):
+        return load_related(info, self, "status")
+
+    def resolve_files(self, info, **kwargs):
+        return load_related(info, self, "files")
+
 
 class SubmissionAgreementNode(DjangoObjectType):
     class Meta:
@@ -37,6 +56,9 @@ class SubmissionAgreementNode(DjangoObjectType):
         convert_choices_to_enum = False
         interfaces = (graphene.relay.Node,)
 
+    def resolve_term(self, info):
+        return load_related(info, self, "term")
+
 
 class SubmissionStatusNode(DjangoObjectType):
     class Meta:
@@ -47,4 +69,12 @@ class SubmissionStatusNode(DjangoObjectType):
 class SubmissionFileNode(DjangoObjectType):
     class Meta:
         model = SubmissionFile
-        fields = ("id", "version", "file_type", "file", "created_at")
+        fields = (
+            "id",
+            "version",
+            "file_type",
+            "file",
+            "converted_file",
+            "conversion_status",
+            "created_at",
+        )
@@ -1,8 +1,10 @@
 import graphene
-from graphene_django import DjangoConnectionField
 from graphql_jwt.decorators import login_required
 from graphql_relay import from_global_id
 
+from Cores.fields import KeysetConnectionField
+from Cores.optimizer import optimize
+
 from .nodes import SubmissionNode
 from .mutations import (
     CreateAuthorMutation,
@@ -14,30 +16,36 @@ from .mutations import (
     UpdateStatementMutation,
     UpdateAuthorSubmissionMutation,
     DeleteSubmissionFileMutation,
+    FinalizeSubmissionUploadMutation,
+    InitiateSubmissionUploadMutation,
 )
 
 
 class Query(graphene.ObjectType):
-    user_submissions = DjangoConnectionField(SubmissionNode)
+    user_submissions = KeysetConnectionField(SubmissionNode)
     user_submission = graphene.Field(
         SubmissionNode, submission_id=graphene.ID(required=True)
     )
 
     @login_required
     def resolve_user_submissions(self, info, **kwargs):
-        return info.context.user.submissions
+        return optimize(info.context.user.submissions, info)
 
     @login_required
     def resolve_user_submission(self, info, **kwargs):
         submission_id = kwargs.get("submission_id")
 
-        return info.context.user.submissions.get(pk=from_global_id(submission_id).id)
+        return optimize(info.context.user.submissions, info).get(
+            pk=from_global_id(submission_id).id
+        )
 
 
 class Mutation(graphene.ObjectType):
     create_author_submission = CreateSubmissionMutation.Field()
     add_submission_authors = CreateAuthorMutation.Field()
     upload_submission_file = SubmissionUploadMutation.Field()
+    initiate_submission_upload = InitiateSubmissionUploadMutation.Field()
+    finalize_submission_upload = FinalizeSubmissionUploadMutation.Field()
     add_submission_agreements = CreateStatementMutation.Field()
     edit_author_submission = UpdateAuthorSubmissionMutation.Field()
     edit_submission_authors = UpdateAuthorMutation.Field()
@@ -1,28 +1,17 @@
-import os
-from pathlib import Path
-from docx2pdf import convert
-
 from django.dispatch import receiver
-from django.db.models.signals import post_delete, post_save
+from django.db.models.signals import post_save
 
+from ..conversion import is_convertible
 from ..models import SubmissionFile
 
 
-@receiver(post_delete, sender=SubmissionFile)
-def delete_file(sender, instance, *args, **kwargs):
-    file_path = instance.file.path
-
-    if os.path.isfile(file_path):
-        os.remove(file_path)
-
-
 @receiver(post_save, sender=SubmissionFile)
-def covert_to_pdf(sender, instance, created, *args, **kwargs):
-    file_path = instance.file.path
-    file_name = instance.file.name
-    ext = Path(file_path).suffix
-
-    if created and (ext == "docx" or ext == "doc"):
-        path = Path(file_path).resolve().parents[0]
-        new_path = Path(path).touch("{0}_convert.pdf".format(file_name))
-        convert(file_path, new_path)
+def queue_conversion(sender, instance, created, *args, **kwargs):
+    """
+    Queue documents for conversion to PDF by the conversion worker
+    """
+    if created and is_convertible(instance.file.name):
+        instance.conversion_status = SubmissionFile.ConversionStatus.PENDING
+        sender.objects.filter(pk=instance.pk).update(
+            conversion_status=instance.conversion_status
+        )
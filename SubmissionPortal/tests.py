@@ -1,19 +1,32 @@
+import hashlib
+import io
 import json
 import os
+import stat
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from unittest import mock
 
 from mixer.backend.django import mixer
 
 from django.contrib.auth import get_user_model, models
 from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test import RequestFactory, override_settings
+from django.utils import timezone
+from django.test.utils import CaptureQueriesContext
 
+from graphene_django.settings import graphene_settings
 from graphene_django.utils.testing import GraphQLTestCase
 from graphene_file_upload.django.testing import GraphQLFileUploadTestMixin
 from graphql_jwt.shortcuts import get_token
-from graphql_relay import from_global_id, to_global_id
+from graphql_relay import from_global_id, offset_to_cursor, to_global_id
 from graphene.utils.str_converters import to_snake_case
 
 from Cores.models import ArticleType, ArticleTypeSection, Discipline
 from Cores.models import TermOfService
+from Cores.storage import collect_garbage
 from Cores.nodes import ArticleTypeSectionNode, TermOfServiceNode
 
 from Journals.models import Journal, JournalSubjectArea
@@ -21,10 +34,15 @@ from Journals.models import Journal, JournalSubjectArea
 from Contents.models import Manuscript, ManuscriptAuthor, ManuscriptSection
 from Contents.nodes import ManuscriptAuthorNode
 
+from SubmissionPortal import uploads
+from SubmissionPortal import conversion
+from SubmissionPortal.conversion import convert_pending_files
+from SubmissionPortal.mutations import section_content
 from SubmissionPortal.models import (
     AuthorSubmission,
     SubmissionConditionAgreement,
     SubmissionFile,
+    SubmissionUpload,
 )
 from SubmissionPortal.nodes import (
     SubmissionNode,
@@ -72,6 +90,30 @@ class SubmissionsTests(GraphQLFileUploadTestMixin, GraphQLTestCase):
         cls.subject = subject
         cls.user = user
 
+    def execute(self, query, variables=None):
+        """
+        Execute the query as the user, returns its result and the number of
+        database queries it took
+        """
+        request = RequestFactory().post(self.GRAPHQL_URL)
+        request.user = self.user
+
+        with CaptureQueriesContext(connection) as queries:
+            result = graphene_settings.SCHEMA.execute(
+                query, variable_values=variables, context_value=request
+            )
+
+        return result, len(queries)
+
+    def assertQueryCountStable(self, run, *sizes):
+        """
+        Assert run takes as many database queries for each of the sizes,
+        run checks its own outcome and returns the number of queries
+        """
+        counts = [run(size) for size in sizes]
+
+        self.assertEqual(counts, [counts[0]] * len(counts))
+
     def test_create_manuscript(self):
         section_id = to_global_id(ArticleTypeSectionNode, self.sections_qs[1].pk)
         section_name = self.sections_qs[1].name
@@ -133,6 +175,46 @@ class SubmissionsTests(GraphQLFileUploadTestMixin, GraphQLTestCase):
         self.assertEqual(content["user"]["firstName"], self.userInfo["firstName"])
         self.assertEqual(content["manuscript"]["title"], input["title"])
 
+    def test_create_manuscript_fetches_sections_in_one_query(self):
+        query = """
+            mutation StageOneSubmission($input: CreateSubmissionMutationInput!) {
+                createAuthorSubmission(input: $input) {
+                    message
+                }
+            }
+            """
+
+        def create_submission(n_sections):
+            sections = mixer.cycle(n_sections).blend(
+                ArticleTypeSection, article_type=mixer.blend(ArticleType)
+            )
+            input = {
+                "journalName": self.journal.name,
+                "articleType": AuthorSubmission.ArticleType.RESEARCH_ARTICLE.name,
+                "wordCount": 1000,
+                "title": "the standard errors of the state income means",
+                "sections": [
+                    {
+                        "sectionId": to_global_id(ArticleTypeSectionNode, section.pk),
+                        "sectionName": section.name,
+                        "content": "the arguments to cbind()",
+                    }
+                    for section in sections
+                ],
+            }
+
+            result, n_queries = self.execute(query, {"input": input})
+
+            self.assertIsNone(result.errors)
+            self.assertEqual(
+                ManuscriptSection.objects.filter(section__in=sections).count(),
+                n_sections,
+            )
+
+            return n_queries
+
+        self.assertQueryCountStable(create_submission, 1, 15)
+
     def test_create_article_type(self):
 
         manuscript = Manuscript.objects.create(
@@ -262,6 +344,247 @@ class SubmissionsTests(GraphQLFileUploadTestMixin, GraphQLTestCase):
 
         self.assertEqual(content["message"], "success")
 
+    def test_submission_file_conversion(self):
+        submission = mixer.blend(AuthorSubmission, user=self.user)
+
+        create_file = lambda name: SubmissionFile.objects.create(
+            author_submission=submission,
+            file_type=SubmissionFile.FileType.MANUSCRIPT,
+            file=SimpleUploadedFile(name=name, content=b"manuscript"),
+        )
+
+        document = create_file("manuscript.docx")
+        pdf = create_file("manuscript.pdf")
+
+        self.assertEqual(
+            document.conversion_status, SubmissionFile.ConversionStatus.PENDING
+        )
+        self.assertIsNone(pdf.conversion_status)
+
+        ## stands in for the office suite, writing the PDF into --outdir
+        with tempfile.NamedTemporaryFile("w", suffix=".sh", delete=False) as script:
+            script.write(
+                '#!/bin/sh\nname=$(basename "$7")\ncp "$7" "$6/${name%.*}.pdf"\n'
+            )
+
+        os.chmod(script.name, stat.S_IRWXU)
+        self.addCleanup(os.remove, script.name)
+
+        with override_settings(DOCUMENT_CONVERTER_BINARY=script.name):
+            self.assertEqual(convert_pending_files(workers=1), 1)
+
+        document.refresh_from_db()
+
+        self.assertEqual(
+            document.conversion_status, SubmissionFile.ConversionStatus.CONVERTED
+        )
+        self.assertTrue(os.path.isfile(document.converted_file.path))
+
+        broken = create_file("broken.docx")
+
+        with override_settings(DOCUMENT_CONVERTER_BINARY="/nonexistent/soffice"):
+            convert_pending_files(workers=1)
+
+        broken.refresh_from_db()
+
+        self.assertEqual(
+            broken.conversion_status, SubmissionFile.ConversionStatus.FAILED
+        )
+
+    def test_conversion_claims_files_and_records_each_outcome(self):
+        submission = mixer.blend(AuthorSubmission, user=self.user)
+
+        create_file = lambda name: SubmissionFile.objects.create(
+            author_submission=submission,
+            file_type=SubmissionFile.FileType.MANUSCRIPT,
+            file=SimpleUploadedFile(name=name, content=name.encode()),
+        )
+
+        claimed, stale, broken, document = [
+            create_file(name)
+            for name in ["claimed.docx", "stale.docx", "broken.docx", "paper.docx"]
+        ]
+
+        ## claimed by a running worker, and by a worker which stopped
+        SubmissionFile.objects.filter(pk__in=[claimed.pk, stale.pk]).update(
+            conversion_status=SubmissionFile.ConversionStatus.PROCESSING,
+            conversion_claimed_at=timezone.now(),
+        )
+        SubmissionFile.objects.filter(pk=stale.pk).update(
+            conversion_claimed_at=timezone.now() - conversion.CLAIM_TIMEOUT
+        )
+
+        def convert_to_pdf(source, binary):
+            if source == broken.file.path:
+                raise RuntimeError("the converter crashed")
+
+            return source
+
+        with mock.patch.object(
+            conversion, "ProcessPoolExecutor", ThreadPoolExecutor
+        ), mock.patch.object(conversion, "convert_to_pdf", convert_to_pdf):
+            self.assertEqual(convert_pending_files(workers=1), 3)
+
+        statuses = dict(
+            SubmissionFile.objects.filter(author_submission=submission).values_list(
+                "pk", "conversion_status"
+            )
+        )
+
+        self.assertEqual(
+            statuses,
+            {
+                claimed.pk: SubmissionFile.ConversionStatus.PROCESSING,
+                stale.pk: SubmissionFile.ConversionStatus.CONVERTED,
+                broken.pk: SubmissionFile.ConversionStatus.FAILED,
+                document.pk: SubmissionFile.ConversionStatus.CONVERTED,
+            },
+        )
+
+        ## a file whose worker stops on every attempt is given up on
+        SubmissionFile.objects.filter(pk=claimed.pk).update(
+            conversion_claimed_at=timezone.now() - conversion.CLAIM_TIMEOUT,
+            conversion_attempts=conversion.MAX_CONVERSION_ATTEMPTS - 1,
+        )
+
+        self.assertEqual(conversion.claim_pending_files(10), [claimed])
+
+        SubmissionFile.objects.filter(pk=claimed.pk).update(
+            conversion_claimed_at=timezone.now() - conversion.CLAIM_TIMEOUT
+        )
+
+        self.assertEqual(conversion.claim_pending_files(10), [])
+
+        claimed.refresh_from_db()
+
+        self.assertEqual(
+            claimed.conversion_status, SubmissionFile.ConversionStatus.FAILED
+        )
+        self.assertEqual(
+            claimed.conversion_attempts, conversion.MAX_CONVERSION_ATTEMPTS
+        )
+
+    def test_resumable_submission_upload(self):
+        submission = mixer.blend(AuthorSubmission, user=self.user)
+        content = os.urandom(200 * 1024)
+
+        response = self.query(
+            """
+            mutation InitiateUpload($input: InitiateSubmissionUploadMutationInput!) {
+                initiateSubmissionUpload(input: $input) {
+                    uploadId
+                    offset
+                }
+            }
+            """,
+            operation_name="InitiateUpload",
+            input_data={
+                "submissionId": to_global_id(SubmissionNode, submission.pk),
+                "type": SubmissionFile.FileType.SUPPLEMENTARY_DATA.name,
+                "fileName": "dataset.csv",
+                "size": len(content),
+            },
+            headers=self.headers,
+        )
+
+        self.assertResponseNoErrors(response)
+
+        upload_id = json.loads(response.content)["data"]["initiateSubmissionUpload"][
+            "uploadId"
+        ]
+        url = "/uploads/{0}".format(upload_id)
+
+        send_chunk = lambda offset, chunk: self.client.generic(
+            "PATCH",
+            url,
+            chunk,
+            content_type="application/offset+octet-stream",
+            HTTP_UPLOAD_OFFSET=str(offset),
+            **self.headers,
+        )
+
+        self.assertEqual(send_chunk(0, content[:150000]).status_code, 204)
+
+        ## a chunk repeated after a dropped connection is rejected
+        response = send_chunk(0, content[:1000])
+
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response["Upload-Offset"], "150000")
+
+        ## a concurrent request which loaded the upload before the first
+        ## chunk was written leaves the received bytes alone
+        stale = SubmissionUpload.objects.get(pk=upload_id)
+        stale.offset = 0
+
+        with self.assertRaises(uploads.UploadOffsetError):
+            uploads.write_chunk(stale, 0, io.BytesIO(content[:1000]), 1000)
+
+        self.assertEqual(os.path.getsize(stale.path), 150000)
+
+        ## a chunk written at its offset while this one was received
+        class RacingStream(io.BytesIO):
+            def read(self, size=-1):
+                SubmissionUpload.objects.filter(pk=upload_id).update(offset=151000)
+                return super().read(size)
+
+        with self.assertRaises(uploads.UploadOffsetError):
+            uploads.write_chunk(
+                SubmissionUpload.objects.get(pk=upload_id),
+                150000,
+                RacingStream(content[150000:151000]),
+                1000,
+            )
+
+        SubmissionUpload.objects.filter(pk=upload_id).update(offset=150000)
+
+        self.assertEqual(os.path.getsize(stale.path), 150000)
+
+        ## the bytes of a stream that ends early are kept and reported
+        self.assertEqual(
+            uploads.write_chunk(
+                SubmissionUpload.objects.get(pk=upload_id),
+                150000,
+                io.BytesIO(content[150000:150500]),
+                1000,
+            ),
+            150500,
+        )
+        self.assertEqual(os.listdir(os.path.dirname(stale.path)), [upload_id])
+
+        ## the upload resumes on a process that never saw the first chunk
+        uploads._digests.clear()
+
+        response = self.client.head(url, **self.headers)
+        offset = int(response["Upload-Offset"])
+
+        self.assertEqual(send_chunk(offset, content[offset:]).status_code, 204)
+
+        response = self.query(
+            """
+            mutation FinalizeUpload($input: FinalizeSubmissionUploadMutationInput!) {
+                finalizeSubmissionUpload(input: $input) {
+                    message
+                }
+            }
+            """,
+            operation_name="FinalizeUpload",
+            input_data={
+                "uploadId": upload_id,
+                "checksum": hashlib.sha256(content).hexdigest(),
+            },
+            headers=self.headers,
+        )
+
+        self.assertResponseNoErrors(response)
+
+        submission_file = submission.files.get()
+
+        with submission_file.file.open("rb") as f:
+            self.assertEqual(f.read(), content)
+
+        self.assertEqual(self.client.head(url, **self.headers).status_code, 404)
+        self.assertEqual(self.client.head(url).status_code, 401)
+
     def test_statements_response(self):
         submission = mixer.blend(
             AuthorSubmission,
@@ -329,6 +652,81 @@ class SubmissionsTests(GraphQLFileUploadTestMixin, GraphQLTestCase):
             content["submission"]["user"]["firstName"], self.userInfo["firstName"]
         )
 
+    def test_statements_are_upserted_by_term(self):
+        query = """
+            mutation StageFourSubmission($input: CreateStatementMutationInput!) {
+                addSubmissionAgreements(input: $input) {
+                    message
+                }
+            }
+            """
+
+        def add_statements(submission, terms):
+            ## listed in reverse, the input order differs from the model order
+            input = {
+                "submissionId": to_global_id(SubmissionNode, submission.pk),
+                "statements": [
+                    {
+                        "termId": to_global_id(TermOfServiceNode, term.pk),
+                        "response": True,
+                        "statement": term.question,
+                    }
+                    for term in reversed(terms)
+                ],
+            }
+
+            result, n_queries = self.execute(query, {"input": input})
+
+            self.assertIsNone(result.errors)
+
+            return n_queries
+
+        def upsert_statements(n_terms):
+            submission = mixer.blend(AuthorSubmission, user=self.user)
+            terms = mixer.cycle(n_terms).blend(TermOfService)
+
+            ## half of the terms were agreed to already
+            mixer.cycle(n_terms // 2).blend(
+                SubmissionConditionAgreement,
+                author_submission=submission,
+                term=mixer.sequence(*terms),
+                statement="draft",
+            )
+
+            queries = add_statements(submission, terms)
+
+            self.assertEqual(submission.agreements.count(), n_terms)
+            self.assertEqual(
+                dict(submission.agreements.values_list("term_id", "statement")),
+                {term.pk: term.question for term in terms},
+            )
+
+            return queries
+
+        self.assertQueryCountStable(upsert_statements, 4, 20)
+
+        ## a term stated twice is rejected rather than saved twice over
+        submission = mixer.blend(AuthorSubmission, user=self.user)
+        term = mixer.blend(TermOfService)
+
+        result, _ = self.execute(
+            query,
+            {
+                "input": {
+                    "submissionId": to_global_id(SubmissionNode, submission.pk),
+                    "statements": [
+                        {
+                            "termId": to_global_id(TermOfServiceNode, term.pk),
+                            "response": response,
+                        }
+                        for response in (True, False)
+                    ],
+                }
+            },
+        )
+        self.assertIn("listed twice", result.errors[0].message)
+        self.assertFalse(submission.agreements.exists())
+
     def test_author_submission(self):
 
         manuscript = mixer.blend(
@@ -423,6 +821,73 @@ class SubmissionsTests(GraphQLFileUploadTestMixin, GraphQLTestCase):
             data["sections"][0]["sectionName"],
         )
 
+    def test_edit_submission_syncs_sections_in_bulk(self):
+        query = """
+            mutation EditSubmission($input: UpdateAuthorSubmissionMutationInput!) {
+                editAuthorSubmission(input: $input) {
+                    message
+                }
+            }
+            """
+
+        def edit_sections(n_sections):
+            article_type = mixer.blend(ArticleType)
+            sections = mixer.cycle(n_sections).blend(
+                ArticleTypeSection, article_type=article_type
+            )
+            manuscript = mixer.blend(Manuscript, journal=self.journal)
+            submission = mixer.blend(
+                AuthorSubmission, user=self.user, manuscript=manuscript
+            )
+
+            ## a third of the sections is new, the others are edited
+            mixer.cycle(n_sections - n_sections // 3).blend(
+                ManuscriptSection,
+                manuscript=manuscript,
+                section=mixer.sequence(*sections),
+                content="draft",
+            )
+
+            input = {
+                "submissionId": to_global_id(SubmissionNode, submission.pk),
+                "title": "the standard errors of the state income means",
+                "sections": [
+                    {
+                        "sectionId": to_global_id(ArticleTypeSectionNode, section.pk),
+                        "sectionName": section.name,
+                        "content": "revised {0}".format(section.name),
+                    }
+                    for section in sections
+                ],
+            }
+
+            result, n_queries = self.execute(query, {"input": input})
+
+            self.assertIsNone(result.errors)
+            self.assertEqual(
+                sorted(manuscript.sections.values_list("content", flat=True)),
+                sorted(
+                    section_content("revised {0}".format(section.name))
+                    for section in sections
+                ),
+            )
+
+            ## new sections are stored as a paragraph document, like the
+            ## sections of a created submission
+            self.assertEqual(
+                json.loads(manuscript.sections.get(section=sections[-1]).content),
+                [
+                    {
+                        "type": "paragraph",
+                        "children": [{"text": "revised {0}".format(sections[-1].name)}],
+                    }
+                ],
+            )
+
+            return n_queries
+
+        self.assertQueryCountStable(edit_sections, 3, 15)
+
     def test_edit_authors(self):
         manuscript = mixer.blend(
             Manuscript,
@@ -514,6 +979,112 @@ class SubmissionsTests(GraphQLFileUploadTestMixin, GraphQLTestCase):
                 pk=from_global_id(input["authors"][1]["id"]).id
             ),
 
+    def test_edit_authors_in_bulk(self):
+        query = """
+            mutation EditAuthors($input: UpdateAuthorMutationInput!) {
+                editSubmissionAuthors(input: $input) {
+                    message
+                }
+            }
+            """
+
+        def edit_authors(n_authors, authors=None):
+            manuscript = mixer.blend(Manuscript, journal=self.journal)
+            submission = mixer.blend(
+                AuthorSubmission, user=self.user, manuscript=manuscript
+            )
+            authors_qs = mixer.cycle(n_authors).blend(
+                ManuscriptAuthor,
+                manuscript=manuscript,
+                rank=mixer.sequence(*range(1, n_authors + 1)),
+            )
+
+            if authors is None:
+                ## one in three authors is deleted, the others are updated,
+                ## and as many are created
+                authors = [
+                    {
+                        "firstName": author.first_name,
+                        "lastName": "Edited",
+                        "email": author.email,
+                        "affiliation": author.affiliation,
+                        "isCorresponding": False,
+                        "rank": author.rank,
+                        "action": "delete" if i % 3 == 0 else "update",
+                        "id": to_global_id(ManuscriptAuthorNode, author.pk),
+                    }
+                    for i, author in enumerate(authors_qs)
+                ] + [
+                    {
+                        "firstName": "Co",
+                        "lastName": "Author",
+                        "email": "coauthor{0}@example.com".format(i),
+                        "affiliation": "university of Lagos",
+                        "isCorresponding": False,
+                        "rank": n_authors + i + 1,
+                        "action": "create",
+                    }
+                    for i in range(n_authors)
+                ]
+
+            input = {
+                "submissionId": to_global_id(SubmissionNode, submission.pk),
+                "authors": authors,
+            }
+
+            result, n_queries = self.execute(query, {"input": input})
+
+            return result, manuscript, n_queries
+
+        result, manuscript, few = edit_authors(3)
+        self.assertIsNone(result.errors)
+        self.assertEqual(manuscript.authors.count(), 5)
+        self.assertEqual(manuscript.authors.filter(last_name="Edited").count(), 2)
+
+        result, manuscript, many = edit_authors(30)
+        self.assertIsNone(result.errors)
+        self.assertEqual(manuscript.authors.count(), 50)
+        self.assertEqual(few, many)
+
+        ## two authors with the same rank and email are rejected before saving
+        duplicate = {
+            "firstName": "Jane",
+            "lastName": "Doe",
+            "email": "janedoe@gmail.com",
+            "affiliation": "university of Aberdeen",
+            "isCorresponding": True,
+            "rank": 1,
+            "action": "create",
+        }
+        result, manuscript, _ = edit_authors(0, authors=[duplicate, duplicate])
+        self.assertIn("listed twice", result.errors[0].message)
+        self.assertFalse(manuscript.authors.exists())
+
+        ## an unknown action is rejected rather than taken for a deletion
+        manuscript = mixer.blend(Manuscript, journal=self.journal)
+        submission = mixer.blend(
+            AuthorSubmission, user=self.user, manuscript=manuscript
+        )
+        author = mixer.blend(ManuscriptAuthor, manuscript=manuscript)
+
+        result, _ = self.execute(
+            query,
+            {
+                "input": {
+                    "submissionId": to_global_id(SubmissionNode, submission.pk),
+                    "authors": [
+                        dict(
+                            duplicate,
+                            action="updte",
+                            id=to_global_id(ManuscriptAuthorNode, author.pk),
+                        )
+                    ],
+                }
+            },
+        )
+        self.assertIn("unknown author action", result.errors[0].message)
+        self.assertTrue(manuscript.authors.filter(pk=author.pk).exists())
+
     def test_edit_submission_statements(self):
         terms_qs = mixer.cycle(10).blend(TermOfService)
 
@@ -643,7 +1214,12 @@ class SubmissionsTests(GraphQLFileUploadTestMixin, GraphQLTestCase):
         )
         with self.assertRaises(SubmissionFile.DoesNotExist):
             SubmissionFile.objects.get(pk=submission_file_1.pk)
+
+        ## the file is reclaimed by the garbage collector
+        collect_garbage(grace=timedelta(0))
+
         self.assertFalse(os.path.exists(submission_file_1.file.path))
+        self.assertTrue(os.path.exists(submission_file_2.file.path))
 
     def test_delete_author_submission(self):
         submissions = mixer.cycle(3).blend(AuthorSubmission, user=self.user)
@@ -783,3 +1359,178 @@ class SubmissionsTests(GraphQLFileUploadTestMixin, GraphQLTestCase):
             first_node["section"]["name"],
             section.section.name,
         )
+
+    def test_query_all_submissions_batches_relations(self):
+        query = """
+            query allUserSubmissions {
+                userSubmissions {
+                    edges {
+                        node {
+                            id
+                            status {
+                                stage
+                            }
+                            files {
+                                fileType
+                            }
+                            agreements {
+                                edges {
+                                    node {
+                                        term {
+                                            question
+                                        }
+                                    }
+                                }
+                            }
+                            manuscript {
+                                title
+                                journal {
+                                    name
+                                }
+                                authors {
+                                    email
+                                }
+                                sections {
+                                    edges {
+                                        node {
+                                            section {
+                                                name
+                                            }
+                                        }
+                                    }
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+            """
+
+        def create_submissions(n):
+            manuscripts = mixer.cycle(n).blend(Manuscript, journal=self.journal)
+
+            mixer.cycle(n).blend(
+                ManuscriptSection,
+                manuscript=mixer.sequence(*manuscripts),
+                section=self.sections_qs[0],
+                content=json.dumps([{"type": "paragraph"}]),
+            )
+            mixer.cycle(n).blend(
+                ManuscriptAuthor, manuscript=mixer.sequence(*manuscripts)
+            )
+
+            submissions = mixer.cycle(n).blend(
+                AuthorSubmission,
+                user=self.user,
+                manuscript=mixer.sequence(*manuscripts),
+            )
+
+            mixer.cycle(n).blend(
+                SubmissionConditionAgreement,
+                author_submission=mixer.sequence(*submissions),
+                term=mixer.blend(TermOfService),
+            )
+
+        def query_submissions(n):
+            create_submissions(n)
+            result, n_queries = self.execute(query)
+
+            self.assertIsNone(result.errors)
+
+            edges = result.data["userSubmissions"]["edges"]
+
+            self.assertEqual(len(edges), self.user.submissions.count())
+            self.assertTrue(
+                all(
+                    len(edge["node"]["manuscript"]["authors"]) == 1
+                    and len(edge["node"]["agreements"]["edges"]) == 1
+                    for edge in edges
+                )
+            )
+
+            return n_queries
+
+        self.assertQueryCountStable(query_submissions, 2, 5)
+
+    def test_query_all_submissions_keyset_pagination(self):
+        manuscripts = mixer.cycle(5).blend(Manuscript)
+        mixer.cycle(5).blend(
+            AuthorSubmission, user=self.user, manuscript=mixer.sequence(*manuscripts)
+        )
+
+        query = """
+            query allUserSubmissions(
+                $first: Int, $after: String, $offset: Int, $keyset: Boolean
+            ) {
+                userSubmissions(
+                    first: $first, after: $after, offset: $offset, keyset: $keyset
+                ) {
+                    totalCount
+                    pageInfo {
+                        hasNextPage
+                        endCursor
+                    }
+                    edges {
+                        node {
+                            id
+                        }
+                    }
+                }
+            }
+            """
+
+        pages, cursor = [], None
+
+        while True:
+            response = self.query(
+                query,
+                operation_name="allUserSubmissions",
+                variables={"first": 2, "after": cursor, "keyset": True},
+                headers=self.headers,
+            )
+
+            self.assertResponseNoErrors(response)
+
+            content = json.loads(response.content)["data"]["userSubmissions"]
+            pages.append([edge["node"]["id"] for edge in content["edges"]])
+
+            self.assertEqual(content["totalCount"], 5)
+
+            if not content["pageInfo"]["hasNextPage"]:
+                break
+
+            cursor = content["pageInfo"]["endCursor"]
+
+        expected = [
+            to_global_id(SubmissionNode, pk)
+            for pk in self.user.submissions.order_by("-created_at", "-pk").values_list(
+                "pk", flat=True
+            )
+        ]
+
+        self.assertEqual([len(page) for page in pages], [2, 2, 1])
+        self.assertEqual(sum(pages, []), expected)
+
+        ## without keyset the field keeps its offset argument and cursors
+        response = self.query(
+            query,
+            operation_name="allUserSubmissions",
+            variables={"first": 2, "offset": 2},
+            headers=self.headers,
+        )
+
+        self.assertResponseNoErrors(response)
+
+        content = json.loads(response.content)["data"]["userSubmissions"]
+
+        self.assertEqual(len(content["edges"]), 2)
+        self.assertEqual(content["pageInfo"]["endCursor"], offset_to_cursor(3))
+
+        response = self.query(
+            query,
+            operation_name="allUserSubmissions",
+            variables={"first": 2, "offset": 2, "keyset": True},
+            headers=self.headers,
+        )
+
+        self.assertResponseHasErrors(response)
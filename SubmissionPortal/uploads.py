@@ -0,0 +1,161 @@
+import hashlib
+import os
+import uuid
+
+from django.db import transaction
+
+from .models import SubmissionFile, SubmissionUpload
+
+## bytes read from the request and written to disk at a time
+CHUNK_SIZE = 64 * 1024
+
+## running SHA-256 of the uploads received by this process, keyed by
+## upload id and stored with the offset they were computed up to
+_digests = {}
+
+
+class UploadError(Exception):
+    pass
+
+
+class UploadOffsetError(UploadError):
+    """
+    The chunk does not start where the received bytes end
+    """
+
+
+def get_digest(upload):
+    """
+    Get the SHA-256 of the bytes received so far, rehashing them from disk
+    when the upload was resumed on another process
+    """
+    offset, digest = _digests.get(upload.pk, (None, None))
+
+    if offset == upload.offset:
+        return digest
+
+    digest = hashlib.sha256()
+    remaining = upload.offset
+
+    if remaining:
+        with open(upload.path, "rb") as f:
+            while remaining:
+                chunk = f.read(min(CHUNK_SIZE, remaining))
+
+                if not chunk:
+                    raise UploadError("the received bytes are missing")
+
+                digest.update(chunk)
+                remaining -= len(chunk)
+
+    return digest
+
+
+def write_chunk(upload, offset, stream, length):
+    """
+    Append up to length bytes of stream to the upload, starting at offset,
+    and return the new offset, short of offset + length when the stream
+    ends early. The chunk is received into a file of its own without a
+    transaction open, then the offset is advanced only if it is still the
+    one the chunk starts at, and the chunk appended while the row is locked
+    by that update, so only the first chunk sent at an offset is written.
+    """
+    upload.offset = SubmissionUpload.objects.values_list("offset", flat=True).get(
+        pk=upload.pk
+    )
+
+    if offset != upload.offset:
+        raise UploadOffsetError(
+            "expected offset {0}, received {1}".format(upload.offset, offset)
+        )
+
+    if offset + length > upload.size:
+        raise UploadError("chunk exceeds the upload size")
+
+    os.makedirs(os.path.dirname(upload.path), exist_ok=True)
+    part_path = "{0}.{1}.part".format(upload.path, uuid.uuid4().hex)
+
+    try:
+        with open(part_path, "wb") as part:
+            remaining = length
+
+            while remaining:
+                chunk = stream.read(min(CHUNK_SIZE, remaining))
+
+                if not chunk:
+                    break
+
+                part.write(chunk)
+                remaining -= len(chunk)
+
+        received = offset + length - remaining
+
+        with transaction.atomic():
+            advanced = SubmissionUpload.objects.filter(
+                pk=upload.pk, offset=offset
+            ).update(offset=received)
+
+            if not advanced:
+                raise UploadOffsetError(
+                    "a chunk was written at offset {0} meanwhile".format(offset)
+                )
+
+            digest = get_digest(upload).copy()
+
+            with open(part_path, "rb") as part, open(upload.path, "ab") as f:
+                ## drop the bytes of an interrupted chunk that were never acknowledged
+                f.truncate(offset)
+
+                while True:
+                    chunk = part.read(CHUNK_SIZE)
+
+                    if not chunk:
+                        break
+
+                    f.write(chunk)
+                    digest.update(chunk)
+    finally:
+        os.unlink(part_path)
+
+    upload.offset = received
+    _digests[upload.pk] = (received, digest)
+
+    return received
+
+
+@transaction.atomic
+def finalize_upload(upload, checksum=None):
+    """
+    Attach a completely received upload to its submission as a SubmissionFile
+    """
+    ## a chunk being written finishes first
+    upload.offset = (
+        SubmissionUpload.objects.select_for_update()
+        .values_list("offset", flat=True)
+        .get(pk=upload.pk)
+    )
+
+    if upload.offset != upload.size:
+        raise UploadError(
+            "received {0} of {1} bytes".format(upload.offset, upload.size)
+        )
+
+    digest = get_digest(upload).hexdigest()
+
+    if checksum and checksum.lower() != digest:
+        raise UploadError("checksum mismatch")
+
+    submission_file = SubmissionFile(
+        author_submission=upload.author_submission,
+        file_type=upload.file_type,
+    )
+
+    ## the digest is known already, the file is moved instead of rehashed
+    storage = SubmissionFile._meta.get_field("file").storage
+    submission_file.file.name = storage.save_path(upload.path, digest, upload.file_name)
+    submission_file.save()
+
+    _digests.pop(upload.pk, None)
+    upload.delete()
+
+    return submission_file
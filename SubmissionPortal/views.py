@@ -1,3 +1,69 @@
-from django.shortcuts import render
+from django.contrib.auth import authenticate
+from django.http import HttpResponse, JsonResponse
+from django.views import View
+from graphql_jwt.exceptions import JSONWebTokenError
 
-# Create your views here.
+from .models import SubmissionUpload
+from .uploads import UploadError, UploadOffsetError, write_chunk
+
+
+class SubmissionUploadView(View):
+    """
+    Receives the chunks of a resumable upload.
+
+    HEAD returns the number of bytes received in the `Upload-Offset` header,
+    PATCH/PUT append the request body starting at the `Upload-Offset` header.
+    """
+
+    http_method_names = ["head", "patch", "put"]
+
+    def dispatch(self, request, upload_id):
+        try:
+            user = authenticate(request=request)
+        except JSONWebTokenError:
+            user = None
+
+        if user is None:
+            return JsonResponse({"error": "authentication required"}, status=401)
+
+        try:
+            upload = SubmissionUpload.objects.get(
+                pk=upload_id, author_submission__user__pk=user.pk
+            )
+        except SubmissionUpload.DoesNotExist:
+            return JsonResponse({"error": "upload does not exist"}, status=404)
+
+        return super().dispatch(request, upload)
+
+    def response(self, upload, status=204):
+        response = HttpResponse(status=status)
+        response["Upload-Offset"] = upload.offset
+        response["Upload-Length"] = upload.size
+
+        return response
+
+    def head(self, request, upload):
+        return self.response(upload, status=200)
+
+    def patch(self, request, upload):
+        try:
+            offset = int(request.headers["Upload-Offset"])
+            length = int(request.headers["Content-Length"])
+        except (KeyError, ValueError):
+            return JsonResponse(
+                {"error": "Upload-Offset and Content-Length are required"}, status=400
+            )
+
+        try:
+            write_chunk(upload, offset, request, length)
+        except UploadOffsetError as e:
+            upload.refresh_from_db()
+            response = self.response(upload, status=409)
+            response.content = str(e)
+            return response
+        except UploadError as e:
+            return JsonResponse({"error": str(e)}, status=400)
+
+        return self.response(upload)
+
+    put = patch
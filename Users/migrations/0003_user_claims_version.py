@@ -0,0 +1,18 @@
+# Generated by Django 4.0.3 on 2026-10-18 11:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Users', '0002_user_user_page_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='claims_version',
+            field=models.PositiveIntegerField(default=0, verbose_name='claims version'),
+        ),
+    ]
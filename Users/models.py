@@ -83,6 +83,13 @@ class User(AbstractBaseUser, PermissionsMixin):
         null=False
     )
 
+    ## bumped whenever the user's roles change, invalidating the
+    ## permission claims of the tokens issued before
+    claims_version = models.PositiveIntegerField(
+        _('claims version'),
+        default=0
+    )
+
     objects = UserModelManager()
 
     USERNAME_FIELD = 'email'
@@ -93,6 +100,7 @@ class User(AbstractBaseUser, PermissionsMixin):
         verbose_name_plural = 'users'
         ordering = ['-date_joined']
         db_table = 'users'
+        indexes = [models.Index(fields=['-date_joined', '-id'], name='user_page_idx')]
 
     def __str__(self) -> str:
         return self.first_name + ' ' + self.last_name
@@ -3,6 +3,8 @@ import graphene
 from django.contrib.auth import get_user_model
 from graphene_django import DjangoObjectType
 
+from Cores.fields import CountableConnection
+
 
 class User(DjangoObjectType):
     class Meta:
@@ -18,3 +20,4 @@ class User(DjangoObjectType):
             "date_joined",
         )
         interfaces = (graphene.relay.Node,)
+        connection_class = CountableConnection
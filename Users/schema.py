@@ -1,10 +1,12 @@
 import graphene
 
 from django.contrib.auth import get_user_model
-from graphene_django import DjangoConnectionField
 from graphql_jwt.decorators import login_required, staff_member_required
 from graphql_relay import from_global_id
 
+from Cores.fields import KeysetConnectionField
+from Cores.optimizer import optimize
+
 from .mutations import UserCreateMutation, UserUpdateMutation
 from .nodes import User as UserNode
 
@@ -15,7 +17,7 @@ class Mutation(graphene.ObjectType):
 
 
 class Query(graphene.ObjectType):
-    users = DjangoConnectionField(UserNode)
+    users = KeysetConnectionField(UserNode)
     user = graphene.Field(UserNode, id=graphene.ID(required=True))
     logged_in_user = graphene.Field(UserNode, token=graphene.String(required=True))
 
@@ -26,9 +28,9 @@ class Query(graphene.ObjectType):
     @login_required
     @staff_member_required
     def resolve_users(root, info, **kwargs):
-        return get_user_model().objects.all()
+        return optimize(get_user_model().objects, info)
 
     @login_required
     @staff_member_required
     def resolve_user(root, info, id):
-        return get_user_model().objects.get(pk=from_global_id(id).id)
+        return optimize(get_user_model().objects, info).get(pk=from_global_id(id).id)
@@ -1,6 +1,12 @@
 from datetime import datetime
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db.models import F
 from graphql_jwt.settings import jwt_settings
 
+from Journals.permissions import PermissionContext
+
 # JWT payload for Hasura
 
 
@@ -14,4 +20,17 @@ def jwt_payload(user, context=None):
     payload["first_name"] = user.first_name
     payload["last_name"] = user.last_name
     payload["exp"] = jwt_expires
+
+    if getattr(settings, "JWT_PERMISSION_CLAIMS", False):
+        payload["claims"] = PermissionContext(user).claims()
+
     return payload
+
+
+def invalidate_claims(user_ids):
+    """
+    Invalidate the permission claims of the tokens issued to the users
+    """
+    get_user_model().objects.filter(pk__in=user_ids).update(
+        claims_version=F("claims_version") + 1
+    )
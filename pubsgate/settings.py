@@ -39,6 +39,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     "graphene_django",
     "graphql_jwt.refresh_token.apps.RefreshTokenConfig",
     "django_filters",
@@ -100,6 +101,20 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/4.0/topics/cache/
+
+## shared by the workers of a host, the reference data of Cores.reference
+## and the typeahead suggestions are invalidated for every worker through it.
+## Workers on several hosts need a shared server, e.g. Redis or memcached.
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": os.path.join(BASE_DIR, "cache"),
+    }
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/4.0/ref/settings/#auth-password-validators
 
@@ -163,6 +178,26 @@ MEDIA_ROOT = os.path.join(BASE_DIR, "media")
 
 MEDIA_URL = "/media/"
 
+## largest file accepted by the resumable upload endpoint
+MAX_SUBMISSION_UPLOAD_SIZE = 2 * 1024 * 1024 * 1024
+
+## headless office suite converting uploaded documents to PDF
+DOCUMENT_CONVERTER_BINARY = "soffice"
+
+## journal views are spooled here by each worker and written in batches
+VIEW_LOG_SPOOL_DIR = os.path.join(BASE_DIR, "spool", "journal_views")
+
+## views written per insert, and seconds a view waits at most for its batch
+VIEW_LOG_BATCH_SIZE = 500
+
+VIEW_LOG_FLUSH_INTERVAL = 10
+
+## months of view logs partitioned ahead, and months kept, the current one
+## included, by partition_view_logs
+VIEW_LOG_PARTITIONS_AHEAD = 3
+
+VIEW_LOG_RETENTION_MONTHS = 24
+
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 AUTH_USER_MODEL = "Users.User"
@@ -193,6 +228,9 @@ CORS_ALLOW_HEADERS = [
     "user-agent",
 ]
 
+## embed the user's roles and journal memberships in issued tokens
+JWT_PERMISSION_CLAIMS = True
+
 GRAPHQL_JWT = {
     "JWT_PAYLOAD_HANDLER": "Users.utils.jwt_payload",
     "JWT_AUTH_HEADER_PREFIX": "Bearer",
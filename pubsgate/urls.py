@@ -20,7 +20,10 @@ from django.urls import path
 from django.conf.urls.static import static
 from django.conf import settings
 
+from SubmissionPortal.views import SubmissionUploadView
+
 urlpatterns = [
     path("admin/", admin.site.urls),
     path("graphql", csrf_exempt(FileUploadGraphQLView.as_view(graphiql=True))),
+    path("uploads/<uuid:upload_id>", csrf_exempt(SubmissionUploadView.as_view())),
 ] + static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)